@@ -2,14 +2,55 @@ import discord
 from discord.ext import commands, tasks
 import aiohttp
 import asyncio
+import bisect
+import contextlib
+import copy
+import csv
+import functools
+import gzip
+import hashlib
+import heapq
+import hmac
+import io
+import itertools
 import json
+import logging
 import os
+import random
+import re
+import shutil
+import socket
+import sqlite3
+import ssl
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, Deque, Literal
+from urllib.parse import urlparse, parse_qs
+from aiohttp import web
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 CONFIG_DIR = "data/DcStatuses"
 CONFIG_FILE = os.path.join(CONFIG_DIR, "status_config.json")
 STATUS_DATA_FILE = os.path.join(CONFIG_DIR, "status_data.json")
+HISTORY_FILE = os.path.join(CONFIG_DIR, "status_history.sqlite3")
+DELIVERY_SPOOL_FILE = os.path.join(CONFIG_DIR, "api_spool.json")
+IMPORT_MAX_BYTES = 1024 * 1024
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_TOTAL_LIMIT = 6000
+EMBEDS_PER_MESSAGE = 10
+EMBED_FOOTER_RESERVE = 200
+EMBED_FRAGMENT_LIMIT = 1024
+LINK_BUTTON_LIMIT = 25
+DASHBOARD_LAYOUTS = ("auto", "full", "compact")
+METRICS_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRICS_PROBE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SPAN_METRIC = "status_monitor_span_duration_seconds"
 
 STATUS_EMOJI = {
     "Operational": "✅", "Online": "🟩", "Partial Outage": "🟨",
@@ -19,51 +60,1711 @@ STATUS_COLOR = {
     "Operational": discord.Color.green(), "Partial": discord.Color.gold(),
     "Outage": discord.Color.red(), "Maintenance": discord.Color.blue()
 }
+BOT_STATUS_TEXT = {
+    discord.Status.online: "Online", discord.Status.idle: "Idle", discord.Status.dnd: "Do Not Disturb",
+    discord.Status.offline: "Offline", discord.Status.invisible: "Invisible"
+}
+DISCORD_COMPONENTS_URL = "https://discordstatus.com/api/v2/components.json"
+SCHEDULER_TICK_SECONDS = 15
+ROLLUP_RESOLUTIONS = (60, 3600, 86400)
+HISTORY_REPORT_WINDOWS = {"1h": 3600, "24h": 86400, "30d": 30 * 86400}
+PROBE_DRAIN_BYTES = 65536
+PROBE_PHASES = ("dns_ms", "connect_ms", "server_ms", "ttfb_ms", "total_ms")
+LATENCY_BINS_MS = (10, 20, 30, 50, 75, 100, 150, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 7500, 10000, 15000, 30000)
+VOLATILE_RESULT_KEYS = ("latency_ms", "code", "timings")
+CHECK_OPTION_KEYS = {"method": "method", "expect": "expected_status", "keyword": "keyword", "timeout": "timeout", "redirects": "follow_redirects", "slow": "slow_ms", "bytes": "max_body_bytes", "fresh": "fresh_connection"}
+GUILD_DEFAULTS = {
+    "dashboards": [], "bots": [], "websites": [], "services": {},
+    "refresh_interval": 5, "embed_title": "Service Status", "dashboard_layout": "auto",
+    "monitored_discord_services": [],
+    "api_post_url": None, "api_secret_token": None, "api_destinations": [], "api_gzip": False, "api_delta": False
+}
+CONFIG_DEFAULTS = {
+    "guilds": {},
+    "probe_concurrency": 25, "probe_per_host": 4, "probe_deadline": 45,
+    "adaptive_min_interval": 30, "adaptive_max_factor": 4,
+    "discord_feed_ttl": 60, "discord_feed_stale_limit": 600, "presence_debounce": 5, "presence_reconcile_interval": 1800,
+    "edit_min_spacing": 1.0, "edit_channel_gap": 5.0,
+    "history_enabled": True, "history_raw_retention_days": 7, "history_minute_retention_days": 14,
+    "history_hour_retention_days": 400, "history_summary_interval": 900,
+    "website_slow_ms": None, "probe_fresh_connections": False,
+    "probe_pool_limit": 100, "probe_pool_per_host": 4, "probe_dns_ttl": 300, "probe_keepalive": 30,
+    "delivery_pool_limit": 10, "delivery_pool_per_host": 2, "delivery_dns_ttl": 300, "delivery_keepalive": 60,
+    "delivery_queue_limit": 100, "delivery_concurrency": 4, "delivery_retry_base": 2.0, "delivery_retry_max": 300, "delivery_timeout": 15,
+    "api_full_resync_interval": 600,
+    "incident_fail_threshold": 2, "incident_window": 3, "incident_reprobe_delay": 5, "flap_window": 3600, "flap_threshold": 6,
+    "dashboard_compact_threshold": 40,
+    "metrics_enabled": False, "metrics_host": "127.0.0.1", "metrics_port": 9464,
+    "update_debounce": 2.0, "probe_types": {},
+    "agent_hub_enabled": False, "agent_hub_host": "127.0.0.1", "agent_hub_port": 9465, "agent_token": "",
+    "agent_replicas": 3, "agent_quorum": 0.5, "agent_timeout": 30, "agent_sync_interval": 5, "agent_recheck_timeout": 15
+}
+LEGACY_GUILD_KEYS = ("guild_id", "channel_id", "message_id", *GUILD_DEFAULTS)
 
 def create_response_embed(title: str, description: str, color: discord.Color = discord.Color.blue()) -> discord.Embed:
     return discord.Embed(title=title, description=description, color=color)
 
-class TitleModal(discord.ui.Modal, title="Change Embed Title"):
-    def __init__(self, cog: "StatusCog"):
+def migrate_guild_config(legacy: Dict[str, Any]) -> Dict[str, Any]:
+    section = copy.deepcopy(GUILD_DEFAULTS)
+    section.update({key: value for key, value in legacy.items() if key in GUILD_DEFAULTS})
+    if legacy.get("channel_id") and legacy.get("message_id"):
+        section["dashboards"] = [{"channel_id": legacy["channel_id"], "message_id": legacy["message_id"]}]
+    return section
+
+DashboardKey = Tuple[int, int]
+
+def dashboard_key(dashboard: Dict[str, int]) -> DashboardKey:
+    return dashboard["channel_id"], dashboard["message_id"]
+
+def history_suffix(entry: Dict[str, Any]) -> str:
+    parts = []
+    if entry.get("uptime_24h") is not None: parts.append(f"Uptime 24h: **{entry['uptime_24h']:g}%**")
+    if entry.get("latency_p95_ms") is not None: parts.append(f"p95: **{entry['latency_p95_ms']} ms**")
+    return "".join(f" · {part}" for part in parts)
+
+def status_expected(code: int, expected: Optional[List[Any]]) -> bool:
+    if not expected: return 200 <= code < 300
+    for rule in expected:
+        rule = str(rule).strip().lower()
+        if rule.endswith("xx") and rule[0].isdigit() and code // 100 == int(rule[0]): return True
+        if "-" in rule:
+            low, high = rule.split("-", 1)
+            if int(low) <= code <= int(high): return True
+        elif rule.isdigit() and int(rule) == code: return True
+    return False
+
+def parse_check_options(text: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {}
+    for token in text.split():
+        name, sep, value = token.partition("=")
+        if not sep or name.lower() not in CHECK_OPTION_KEYS:
+            raise ValueError(f"Unknown check option `{token}`.")
+        key = CHECK_OPTION_KEYS[name.lower()]
+        if key == "method":
+            if value.upper() not in ("GET", "HEAD"): raise ValueError("`method` must be GET or HEAD.")
+            options[key] = value.upper()
+        elif key == "expected_status":
+            options[key] = [rule for rule in value.split(",") if rule]
+            if not all(re.fullmatch(r"\d{3}|\dxx|\d{3}-\d{3}", rule.lower()) for rule in options[key]):
+                raise ValueError("`expect` takes codes like `200`, `2xx` or `200-399`, separated by commas.")
+        elif key in ("follow_redirects", "fresh_connection"):
+            options[key] = value.lower() not in ("no", "false", "0", "off")
+        elif key in ("timeout", "slow_ms"):
+            options[key] = float(value)
+        elif key == "max_body_bytes":
+            options[key] = int(value)
+        else:
+            options[key] = value
+    return validate_check_options(options)
+
+def validate_check_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    for name in ("timeout", "slow", "bytes"):
+        if options.get(CHECK_OPTION_KEYS[name], 1) <= 0:
+            raise ValueError(f"`{name}` must be greater than 0.")
+    if options.get("method") == "HEAD" and options.get("keyword"):
+        raise ValueError("`keyword` needs `method=GET`, HEAD responses have no body.")
+    return options
+
+def normalize_url(url: str) -> str:
+    parsed = urlparse(url.strip() if "://" in url else "https://" + url.strip())
+    host = (parsed.hostname or "").lower()
+    port = f":{parsed.port}" if parsed.port and parsed.port != {"http": 80, "https": 443}.get(parsed.scheme.lower()) else ""
+    path = "" if parsed.path in ("", "/") else parsed.path
+    return f"{parsed.scheme.lower()}://{host}{port}{path}" + (f"?{parsed.query}" if parsed.query else "")
+
+def format_check_options(site: Dict[str, Any]) -> str:
+    tokens = []
+    for name, key in CHECK_OPTION_KEYS.items():
+        if key not in site or key == "keyword": continue
+        value = site[key]
+        if isinstance(value, bool): value = "yes" if value else "no"
+        elif isinstance(value, list): value = ",".join(str(rule) for rule in value)
+        elif isinstance(value, float): value = f"{value:g}"
+        tokens.append(f"{name}={value}")
+    return " ".join(tokens)
+
+def check_options_from_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    options = parse_check_options(str(entry.get("options") or ""))
+    for name, key in CHECK_OPTION_KEYS.items():
+        if entry.get(key) in (None, ""): continue
+        if key == "keyword":
+            options[key] = str(entry[key])
+            continue
+        value = entry[key]
+        if isinstance(value, bool): value = "yes" if value else "no"
+        elif isinstance(value, list): value = ",".join(str(rule) for rule in value)
+        options.update(parse_check_options(f"{name}={value}"))
+    return validate_check_options(options)
+
+def parse_target_file(filename: str, content: bytes) -> Dict[str, Any]:
+    text = content.decode("utf-8-sig")
+    extension = os.path.splitext(filename.lower())[1]
+    if extension == ".csv":
+        targets: Dict[str, Any] = {"bots": [], "websites": [], "services": {}}
+        reader = csv.DictReader(io.StringIO(text))
+        for row in reader:
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            kind = row.get("type", "").lower()
+            if kind == "bot": targets["bots"].append({"id": row.get("target"), "label": row.get("label"), "interval": row.get("interval")})
+            elif kind == "website": targets["websites"].append({"url": row.get("target"), "label": row.get("label"), "interval": row.get("interval"), "keyword": row.get("keyword"), "options": row.get("options")})
+            elif kind == "service": targets["services"][row.get("target", "")] = row.get("status") or "Operational"
+            else: raise ValueError(f"Line {reader.line_num} has unknown type `{kind}`; use bot, website or service.")
+        return targets
+    if extension in (".yaml", ".yml"):
+        if yaml is None: raise ValueError("YAML import needs the PyYAML package (`pip install pyyaml`).")
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    if not isinstance(data, dict): raise ValueError("The file must contain an object with `bots`, `websites` and/or `services`.")
+    return data
+
+def serialize_targets(section: Dict[str, Any], file_format: str) -> bytes:
+    targets = {"bots": section["bots"], "websites": section["websites"], "services": section["services"]}
+    if file_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["type", "target", "label", "status", "interval", "keyword", "options"])
+        for bot in section["bots"]:
+            writer.writerow(["bot", bot["id"], bot["label"], "", bot.get("interval", ""), "", ""])
+        for site in section["websites"]:
+            writer.writerow(["website", site["url"], site["label"], "", site.get("interval", ""), site.get("keyword", ""), format_check_options(site)])
+        for name, status in section["services"].items():
+            writer.writerow(["service", name, "", status, "", "", ""])
+        return buffer.getvalue().encode("utf-8")
+    if file_format == "yaml":
+        if yaml is None: raise ValueError("YAML export needs the PyYAML package (`pip install pyyaml`).")
+        return yaml.safe_dump(targets, sort_keys=False, allow_unicode=True).encode("utf-8")
+    return json.dumps(targets, indent=4).encode("utf-8")
+
+def build_probe_trace_config() -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+    def mark(name: str, first: bool = True):
+        async def hook(session: aiohttp.ClientSession, context: Any, params: Any):
+            timings = context.trace_request_ctx
+            if not isinstance(timings, dict): return
+            if first: timings.setdefault(name, time.perf_counter())
+            else: timings[name] = time.perf_counter()
+        return hook
+    trace.on_request_start.append(mark("request_start"))
+    trace.on_dns_resolvehost_start.append(mark("dns_start", first=False))
+    trace.on_dns_resolvehost_end.append(mark("dns_end", first=False))
+    trace.on_connection_create_start.append(mark("connect_start", first=False))
+    trace.on_connection_create_end.append(mark("connect_end", first=False))
+    trace.on_request_headers_sent.append(mark("headers_sent", first=False))
+    trace.on_request_end.append(mark("headers_received", first=False))
+    return trace
+
+class HttpPool:
+    def __init__(self, name: str, limit: int, limit_per_host: int, dns_ttl: Optional[int], keepalive: Optional[float], force_close: bool = False, trace_configs: Optional[List[aiohttp.TraceConfig]] = None):
+        self.name = name
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive = keepalive
+        self.force_close = force_close
+        self.trace_configs = list(trace_configs or [])
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.connector: Optional[aiohttp.TCPConnector] = None
+        self.queue_waits = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.queued = 0
+        self.active = 0
+        self.created = 0
+        self.reused = 0
+
+    def pool_trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        async def request_start(session: aiohttp.ClientSession, context: Any, params: Any):
+            self.active += 1
+        async def request_done(session: aiohttp.ClientSession, context: Any, params: Any):
+            self.active -= 1
+        async def connection_created(session: aiohttp.ClientSession, context: Any, params: Any):
+            self.created += 1
+        async def connection_reused(session: aiohttp.ClientSession, context: Any, params: Any):
+            self.reused += 1
+        async def queued_start(session: aiohttp.ClientSession, context: Any, params: Any):
+            context.queued_at = time.perf_counter()
+            self.queued += 1
+        async def queued_end(session: aiohttp.ClientSession, context: Any, params: Any):
+            wait = time.perf_counter() - getattr(context, "queued_at", time.perf_counter())
+            self.queued -= 1
+            self.queue_waits += 1
+            self.queue_wait_total += wait
+            self.queue_wait_max = max(self.queue_wait_max, wait)
+        trace.on_connection_queued_start.append(queued_start)
+        trace.on_connection_queued_end.append(queued_end)
+        trace.on_request_start.append(request_start)
+        trace.on_request_end.append(request_done)
+        trace.on_request_exception.append(request_done)
+        trace.on_connection_create_end.append(connection_created)
+        trace.on_connection_reuseconn.append(connection_reused)
+        return trace
+
+    def start(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host, ttl_dns_cache=self.dns_ttl, use_dns_cache=self.dns_ttl is not None,
+                force_close=self.force_close, keepalive_timeout=None if self.force_close else self.keepalive
+            )
+            self.session = aiohttp.ClientSession(connector=self.connector, trace_configs=[*self.trace_configs, self.pool_trace_config()])
+        return self.session
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active, "created": self.created, "reused": self.reused,
+            "limit": self.limit, "limit_per_host": self.limit_per_host, "queued": self.queued,
+            "queue_waits": self.queue_waits, "queue_wait_ms_total": round(self.queue_wait_total * 1000, 1),
+            "queue_wait_ms_max": round(self.queue_wait_max * 1000, 1)
+        }
+
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+
+class HttpClients:
+    def __init__(self, config: Dict[str, Any]):
+        probe_traces = [build_probe_trace_config()]
+        self.pools = {
+            "probe": HttpPool("probe", config["probe_pool_limit"], config["probe_pool_per_host"], config["probe_dns_ttl"], config["probe_keepalive"], trace_configs=probe_traces),
+            "probe_cold": HttpPool("probe_cold", config["probe_pool_limit"], config["probe_pool_per_host"], None, None, force_close=True, trace_configs=probe_traces),
+            "delivery": HttpPool("delivery", config["delivery_pool_limit"], config["delivery_pool_per_host"], config["delivery_dns_ttl"], config["delivery_keepalive"])
+        }
+
+    def session(self, name: str) -> aiohttp.ClientSession:
+        return self.pools[name].start()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: pool.stats() for name, pool in self.pools.items()}
+
+    async def close(self):
+        await asyncio.gather(*(pool.close() for pool in self.pools.values()))
+
+def parse_destinations(text: str) -> List[Dict[str, Optional[str]]]:
+    destinations = []
+    for line in text.splitlines():
+        parts = line.split()
+        if not parts: continue
+        if len(parts) > 2 or not parts[0].lower().startswith(("http://", "https://")):
+            raise ValueError(f"`{line.strip()}` is not a `URL [token]` line.")
+        destinations.append({"url": parts[0], "token": parts[1] if len(parts) > 1 else None})
+    return destinations
+
+def entry_id(entry: Dict[str, Any]) -> str:
+    return next((str(entry[key]) for key in ("id", "url", "name") if entry.get(key) is not None), "")
+
+def status_delta(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    delta: Dict[str, Any] = {"fields": {}, "lists": {}, "changed": {}, "removed": [key for key in old if key not in new]}
+    for key, value in new.items():
+        if not isinstance(value, list):
+            if old.get(key) != value: delta["fields"][key] = value
+            continue
+        previous = old.get(key) if isinstance(old.get(key), list) else []
+        ids = [entry_id(entry) for entry in value]
+        if ids != [entry_id(entry) for entry in previous] or len(set(ids)) != len(ids):
+            delta["lists"][key] = value
+        elif changed := {entry_key: entry for entry_key, before, entry in zip(ids, previous, value) if before != entry}:
+            delta["changed"][key] = changed
+    return delta
+
+def render_bot_line(bot: Dict[str, Any]) -> str:
+    emoji = STATUS_EMOJI["Online"] if bot["status"] == "Online" else (STATUS_EMOJI["Partial Outage"] if bot["status"] in ["Idle", "Do Not Disturb"] else STATUS_EMOJI["Offline"])
+    since = f" since <t:{int(datetime.fromisoformat(bot['status_since_utc']).timestamp())}:R>" if bot.get("status_since_utc") else ""
+    return f"{emoji} **{bot['label']}**\n> Status: **{bot['status']}**{since}{history_suffix(bot)}"
+
+def render_website_line(site: Dict[str, Any]) -> str:
+    emoji = STATUS_EMOJI['Partial Outage'] if site.get('slow') or site.get('flapping') else (STATUS_EMOJI['Online'] if site['online'] else STATUS_EMOJI['Offline'])
+    since = f" since <t:{int(datetime.fromisoformat(site['down_since_utc']).timestamp())}:R>" if site.get("down_since_utc") else ""
+    return f"{emoji} [{site['label']}]({site['url']})\n> Status: **{site['status']}**{since}{history_suffix(site)}"
+
+def render_discord_line(service: Dict[str, Any]) -> str:
+    return f"> {STATUS_EMOJI.get(service['status'], '❔')} **{service['name']}**: {service['status']}"
+
+def render_service_line(service: Dict[str, Any]) -> str:
+    emoji = STATUS_EMOJI.get(service.get('status', 'Not Found')) or (STATUS_EMOJI["Offline"] if service.get("online") is False else '❔')
+    detail = f" ({service['detail']})" if service.get("detail") else ""
+    return f"**[{service['name']}]**\n> {emoji} Status: **{service['status']}**{detail}{history_suffix(service)}"
+
+FRAGMENT_RENDERERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "bots": render_bot_line, "websites": render_website_line,
+    "discord_services": render_discord_line, "custom_services": render_service_line
+}
+FRAGMENT_FIELDS = ("label", "name", "url", "status", "online", "slow", "flapping", "detail", "status_since_utc", "down_since_utc", "uptime_24h", "latency_p95_ms")
+
+def entry_healthy(kind: str, entry: Dict[str, Any]) -> bool:
+    if kind == "bots": return entry.get("status") == "Online"
+    if kind == "websites": return bool(entry.get("online")) and not entry.get("slow") and not entry.get("flapping")
+    return entry.get("status") == "Operational"
+
+def pack_embed_pages(sections: List[Tuple[str, List[Tuple[str, str]]]], budget: int, limit: int = EMBED_DESCRIPTION_LIMIT) -> List[List[str]]:
+    pages: List[List[str]] = []
+    embeds: List[str] = []
+    current = ""
+    for heading, fragments in sections:
+        started = False
+        for separator, text in fragments:
+            piece, joiner = (text, separator) if started else (f"{heading}{separator}{text}", "\n")
+            size = len(current) + len(joiner) + len(piece) if current else len(piece)
+            if current and (size > limit or sum(map(len, embeds)) + size > budget):
+                embeds.append(current)
+                current = ""
+                if started: piece = f"{heading} (cont.)\n{text}"
+                if sum(map(len, embeds)) + len(piece) > budget or len(embeds) >= EMBEDS_PER_MESSAGE:
+                    pages.append(embeds)
+                    embeds = []
+            current = f"{current}{joiner}{piece}" if current else piece
+            started = True
+    if current: embeds.append(current)
+    if embeds: pages.append(embeds)
+    return pages
+
+def probe_timings(marks: Dict[str, float], finished: float) -> Dict[str, Optional[float]]:
+    def span(start: str, end: str) -> Optional[float]:
+        return round((marks[end] - marks[start]) * 1000, 1) if start in marks and end in marks else None
+    marks = {**marks, "finished": finished}
+    return {
+        "dns_ms": span("dns_start", "dns_end"), "connect_ms": span("connect_start", "connect_end"),
+        "server_ms": span("headers_sent", "headers_received"), "ttfb_ms": span("request_start", "headers_received"),
+        "total_ms": span("request_start", "finished")
+    }
+
+async def drain_response(response: aiohttp.ClientResponse, limit: int = PROBE_DRAIN_BYTES):
+    # A fully read response goes back to the pool; an unread one closes its connection.
+    if response.content_length is not None and response.content_length > limit: return
+    drained = 0
+    with contextlib.suppress(asyncio.TimeoutError, aiohttp.ClientError):
+        while drained < limit and (chunk := await response.content.read(limit - drained)):
+            drained += len(chunk)
+
+async def check_website(http: HttpClients, site: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    method = site.get("method", "GET")
+    keyword = site.get("keyword")
+    max_body = site.get("max_body_bytes", 65536 if keyword else 0) if method == "GET" else 0
+    headers = {"Range": f"bytes=0-{max_body - 1}"} if max_body else {}
+    marks: Dict[str, float] = {}
+    try:
+        pool = "probe_cold" if site.get("fresh_connection", config["probe_fresh_connections"]) else "probe"
+        async with http.session(pool).request(
+            method, site['url'], headers=headers, timeout=aiohttp.ClientTimeout(total=site.get("timeout", 10)),
+            allow_redirects=site.get("follow_redirects", True), trace_request_ctx=marks
+        ) as response:
+            code = response.status
+            expected = site.get("expected_status")
+            matched = status_expected(code, expected) or (bool(headers) and code == 206 and status_expected(200, expected))
+            body = b""
+            if max_body and matched:
+                while len(body) < max_body and (chunk := await response.content.read(max_body - len(body))):
+                    body += chunk
+            finished = time.perf_counter()
+            await drain_response(response)
+    except (asyncio.TimeoutError, aiohttp.ClientError):
+        return {"status": "Offline", "online": False, "code": None, "latency_ms": None, "timings": probe_timings(marks, time.perf_counter())}
+    timings = probe_timings(marks, finished)
+    result = {"status": "Online", "online": True, "code": code, "latency_ms": timings["ttfb_ms"], "timings": timings}
+    slow_ms = site.get("slow_ms", config["website_slow_ms"])
+    if not matched:
+        result.update(status=f"Status {code}", online=False)
+    elif keyword and keyword.encode() not in body:
+        result.update(status="Keyword Missing", online=False)
+    elif slow_ms and timings["ttfb_ms"] is not None and timings["ttfb_ms"] > slow_ms:
+        result.update(status="Slow", slow=True)
+    return result
+
+def parse_interval_minutes(value: str) -> Optional[float]:
+    try:
+        minutes = float(value.strip())
+        return minutes if minutes > 0 else None
+    except ValueError:
+        return None
+
+ProbeJob = Tuple[Optional[str], Callable[[], Awaitable[Any]], Any]
+
+class PersistenceError(Exception):
+    pass
+
+def atomic_write(path: str, data: bytes, backup: bool = False):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    if backup and os.path.exists(path):
+        try:
+            if os.path.exists(f"{path}.bak.tmp"): os.remove(f"{path}.bak.tmp")
+            os.link(path, f"{path}.bak.tmp")
+        except OSError:
+            shutil.copyfile(path, f"{path}.bak.tmp")
+        os.replace(f"{path}.bak.tmp", f"{path}.bak")
+    os.replace(temp_path, path)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+class JsonStore:
+    def __init__(self, path: str, indent: Optional[int] = None, delay: float = 1.0):
+        self.path = path
+        self.indent = indent
+        self.delay = delay
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-store")
+        self.producer: Optional[Callable[[], Any]] = None
+        self.task: Optional[asyncio.Task] = None
+        self.stats = {"requested": 0, "written": 0}
+
+    def load(self) -> Optional[Any]:
+        errors = []
+        for path in (self.path, f"{self.path}.bak"):
+            try:
+                with open(path, "r", encoding="utf-8") as f: data = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                errors.append(f"{path}: {e}")
+                continue
+            if errors:
+                print(f"{self.path} could not be read ({errors[0]}), restored the previous generation from {path}.")
+                os.replace(self.path, f"{self.path}.corrupt-{int(time.time())}")
+            return data
+        if errors:
+            raise PersistenceError(f"Refusing to start with empty data: {'; '.join(errors)}. Fix or remove the file to continue.")
+        return None
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data, indent=self.indent).encode("utf-8")
+
+    def save(self, producer: Callable[[], Any]):
+        self.stats["requested"] += 1
+        self.producer = producer
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_now()
+            return
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.flush_later())
+
+    async def flush_later(self):
+        await asyncio.sleep(self.delay)
+        while self.producer is not None:
+            payload, self.producer = self.encode(self.producer()), None
+            try:
+                await asyncio.get_running_loop().run_in_executor(self.executor, atomic_write, self.path, payload, True)
+                self.stats["written"] += 1
+            except OSError as e:
+                print(f"Failed to write {self.path}: {e}")
+
+    def flush_now(self):
+        if self.producer is None: return
+        payload, self.producer = self.encode(self.producer()), None
+        self.executor.submit(lambda: None).result()
+        atomic_write(self.path, payload, backup=True)
+        self.stats["written"] += 1
+
+    def close(self):
+        if self.task: self.task.cancel()
+        try:
+            self.flush_now()
+        except OSError as e:
+            print(f"Failed to write {self.path}: {e}")
+        self.executor.shutdown(wait=True)
+
+class TargetIndex:
+    def __init__(self):
+        self.guilds: Dict[int, Tuple[Tuple[int, ...], Dict[int, Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
+
+    def lookup(self, guild_id: int, section: Dict[str, Any]) -> Tuple[Dict[int, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        stamp = (id(section["bots"]), len(section["bots"]), id(section["websites"]), len(section["websites"]))
+        cached = self.guilds.get(guild_id)
+        if cached is None or cached[0] != stamp:
+            cached = self.guilds[guild_id] = (stamp, {bot["id"]: bot for bot in section["bots"]}, {site["url"]: site for site in section["websites"]})
+        return cached[1], cached[2]
+
+    def invalidate(self, guild_id: Optional[int] = None):
+        if guild_id is None: self.guilds.clear()
+        else: self.guilds.pop(guild_id, None)
+
+MetricLabels = Tuple[Tuple[str, str], ...]
+
+def format_metric_labels(labels: MetricLabels) -> str:
+    if not labels: return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + "}"
+
+class MetricsRegistry:
+    def __init__(self):
+        self.families: Dict[str, Dict[str, Any]] = {}
+        self.collectors: List[Callable[[], None]] = []
+
+    def declare(self, name: str, kind: str, help_text: str, buckets: Optional[Tuple[float, ...]] = None):
+        self.families[name] = {"kind": kind, "help": help_text, "buckets": buckets, "samples": {}}
+
+    @staticmethod
+    def labels(labels: Dict[str, Any]) -> MetricLabels:
+        return tuple(sorted((name, str(value).lower() if isinstance(value, bool) else str(value)) for name, value in labels.items()))
+
+    def inc(self, name: str, amount: float = 1.0, **labels: Any):
+        samples = self.families[name]["samples"]
+        key = self.labels(labels)
+        samples[key] = samples.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels: Any):
+        self.families[name]["samples"][self.labels(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: Any):
+        family = self.families[name]
+        state = family["samples"].setdefault(self.labels(labels), [[0] * len(family["buckets"]), 0.0, 0])
+        index = bisect.bisect_left(family["buckets"], value)
+        if index < len(family["buckets"]): state[0][index] += 1
+        state[1] += value
+        state[2] += 1
+
+    def retain(self, name: str, label: str, keep: set):
+        samples = self.families[name]["samples"]
+        for key in [key for key in samples if dict(key).get(label) not in keep]:
+            del samples[key]
+
+    def render(self, openmetrics: bool = False) -> str:
+        for collect in self.collectors:
+            try:
+                collect()
+            except Exception as e:
+                print(f"Metrics collector failed: {e}")
+        lines = []
+        for name, family in self.families.items():
+            base = name[:-6] if openmetrics and family["kind"] == "counter" and name.endswith("_total") else name
+            lines += [f"# HELP {base} {family['help']}", f"# TYPE {base} {family['kind']}"]
+            for key, value in family["samples"].items():
+                if family["kind"] != "histogram":
+                    lines.append(f"{name}{format_metric_labels(key)} {float(value)!r}")
+                    continue
+                counts, total, count = value
+                for bound, cumulative in zip(family["buckets"], itertools.accumulate(counts)):
+                    lines.append(f"{name}_bucket{format_metric_labels(key + (('le', repr(float(bound))),))} {cumulative}")
+                lines.append(f"{name}_bucket{format_metric_labels(key + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{format_metric_labels(key)} {total!r}")
+                lines.append(f"{name}_count{format_metric_labels(key)} {count}")
+        if openmetrics: lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+def build_metrics_registry() -> MetricsRegistry:
+    metrics = MetricsRegistry()
+    for name, kind, help_text, buckets in (
+        ("status_monitor_probe_duration_seconds", "histogram", "Duration of each target probe.", METRICS_PROBE_BUCKETS),
+        ("status_monitor_probe_results_total", "counter", "Probe outcomes by target kind.", None),
+        ("status_monitor_probe_phase_seconds", "histogram", "Website check time by phase: dns, connect (TCP and TLS), server, ttfb and total.", METRICS_PROBE_BUCKETS),
+        ("status_monitor_loop_duration_seconds", "histogram", "Duration of one status_loop cycle.", METRICS_DURATION_BUCKETS),
+        ("status_monitor_loop_overruns_total", "counter", "status_loop cycles that took longer than the scheduler tick.", None),
+        (SPAN_METRIC, "histogram", "Duration of the phases of a status cycle.", METRICS_DURATION_BUCKETS),
+        ("status_monitor_discord_api_calls_total", "counter", "Discord API calls made by the cog.", None),
+        ("status_monitor_discord_api_errors_total", "counter", "Discord API calls that failed, by HTTP status.", None),
+        ("status_monitor_discord_api_duration_seconds", "histogram", "Duration of Discord API calls, including rate limit waits.", METRICS_DURATION_BUCKETS),
+        ("status_monitor_discord_rate_limits_total", "counter", "429 responses reported by discord.py.", None),
+        ("status_monitor_discord_rate_limit_wait_seconds_total", "counter", "Seconds discord.py slept after 429 responses.", None),
+        ("status_monitor_edit_pacer_wait_seconds_total", "counter", "Seconds the edit pacer held back embed edits.", None),
+        ("status_monitor_edit_queue_depth", "gauge", "Embed edits waiting in the edit pacer.", None),
+        ("status_monitor_writes_total", "counter", "Embed edits, API posts and state saves performed or skipped as unchanged.", None),
+        ("status_monitor_api_post_duration_seconds", "histogram", "Duration of API POST attempts.", METRICS_DURATION_BUCKETS),
+        ("status_monitor_api_post_failures_total", "counter", "Failed API POST attempts.", None),
+        ("status_monitor_api_deliveries_total", "counter", "API delivery queue outcomes.", None),
+        ("status_monitor_api_queue_depth", "gauge", "Snapshots waiting in the API delivery queue.", None),
+        ("status_monitor_api_in_flight", "gauge", "API deliveries currently being sent.", None),
+        ("status_monitor_http_pool_connections", "gauge", "HTTP pool requests holding (active) or waiting for (queued) a connection.", None),
+        ("status_monitor_http_pool_connects_total", "counter", "HTTP pool connections opened (created) or taken from keep-alive (reused).", None),
+        ("status_monitor_http_pool_limit", "gauge", "HTTP pool connection limit.", None),
+        ("status_monitor_http_pool_queue_waits_total", "counter", "Requests that waited for a free pool connection.", None),
+        ("status_monitor_http_pool_queue_wait_seconds_total", "counter", "Seconds requests waited for a free pool connection.", None),
+        ("status_monitor_discord_feed_requests_total", "counter", "Discord status feed cache outcomes.", None),
+        ("status_monitor_store_writes_total", "counter", "JSON store saves requested and actually written.", None),
+        ("status_monitor_targets", "gauge", "Targets known to the scheduler.", None),
+        ("status_monitor_update_requests_total", "counter", "Update requests, and how many shared a cycle with an earlier request.", None),
+        ("status_monitor_update_cycles_total", "counter", "Update cycles run by the coordinator.", None),
+        ("status_monitor_agents_live", "gauge", "Probe agents that synced within agent_timeout.", None),
+        ("status_monitor_agent_targets", "gauge", "Targets assigned to each probe agent.", None),
+        ("status_monitor_agent_syncs_total", "counter", "Sync requests received from probe agents.", None),
+        ("status_monitor_agent_reports_total", "counter", "Probe results received from probe agents.", None),
+        ("status_monitor_agent_rebalances_total", "counter", "Times the agent hash ring was rebuilt after agents joined or left.", None),
+        ("status_monitor_agent_aggregations_total", "counter", "Target results taken from agent quorum or probed locally.", None)
+    ):
+        metrics.declare(name, kind, help_text, buckets)
+    return metrics
+
+def timed_span(name: str):
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await method(self, *args, **kwargs)
+                finally:
+                    self.metrics.observe(SPAN_METRIC, time.perf_counter() - started, span=name)
+            return async_wrapper
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.metrics.observe(SPAN_METRIC, time.perf_counter() - started, span=name)
+        return wrapper
+    return decorate
+
+# The warnings discord.http logs before sleeping on a 429, matched by format string. tests/test_rate_limit_log.py pins them to the installed discord.py.
+RATE_LIMIT_LOG_FORMATS = {
+    "We are being rate limited. %s %s responded with 429. Retrying in %.2f seconds.": "route",
+    "Global rate limit has been hit. Retrying in %.2f seconds.": "global"
+}
+
+class RateLimitLogHandler(logging.Handler):
+    def __init__(self, metrics: MetricsRegistry):
+        super().__init__(logging.WARNING)
+        self.metrics = metrics
+        self.pending: Optional[float] = None
+
+    def emit(self, record: logging.LogRecord):
+        scope = RATE_LIMIT_LOG_FORMATS.get(record.msg)
+        if scope is None or not record.args:
+            return
+        if scope == "global":
+            # discord.py logs the route line first for the same 429; the global line reclassifies it.
+            self.pending = None
+            self.record("global", float(record.args[-1]))
+        else:
+            self.flush()
+            self.pending = float(record.args[-1])
+            try:
+                asyncio.get_running_loop().call_soon(self.flush)
+            except RuntimeError:
+                self.flush()
+
+    def flush(self):
+        if self.pending is not None:
+            seconds, self.pending = self.pending, None
+            self.record("route", seconds)
+
+    def record(self, scope: str, seconds: float):
+        self.metrics.inc("status_monitor_discord_rate_limits_total", scope=scope)
+        self.metrics.inc("status_monitor_discord_rate_limit_wait_seconds_total", seconds, scope=scope)
+
+class ProbeEngine:
+    def __init__(self, concurrency: int = 25, per_host: int = 4, deadline: float = 45.0):
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.deadline = deadline
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def configure(self, concurrency: int, per_host: int, deadline: float):
+        if concurrency != self.concurrency:
+            self.concurrency = max(1, concurrency)
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        if per_host != self.per_host:
+            self.per_host = max(1, per_host)
+            self.host_semaphores.clear()
+        self.deadline = deadline
+
+    def host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self.host_semaphores[host]
+
+    async def _guarded(self, host: Optional[str], factory: Callable[[], Awaitable[Any]]) -> Any:
+        if host is None:
+            async with self.semaphore:
+                return await factory()
+        # Wait for the host slot before taking a global one, so a busy host cannot hold slots other hosts need.
+        async with self.host_semaphore(host):
+            async with self.semaphore:
+                return await factory()
+
+    async def run(self, jobs: List[ProbeJob]) -> List[Any]:
+        if not jobs: return []
+        tasks = [asyncio.ensure_future(self._guarded(host, factory)) for host, factory, _ in jobs]
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending: task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            print(f"Probe cycle deadline of {self.deadline}s reached, {len(pending)} probe(s) timed out.")
+        results = []
+        for task, (_, _, fallback) in zip(tasks, jobs):
+            if task in done and task.exception() is None: results.append(task.result())
+            else: results.append(fallback)
+        return results
+
+PROBE_PLUGINS: Dict[str, Dict[str, Any]] = {}
+PROBE_DEFAULT_PORTS = {"tls": 443}
+
+def probe_plugin(scheme: str, timeout: float, concurrency: int, needs_port: bool = True):
+    def register(handler: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]):
+        PROBE_PLUGINS[scheme] = {"handler": handler, "timeout": timeout, "concurrency": concurrency, "needs_port": needs_port}
+        return handler
+    return register
+
+def is_probe_uri(value: Any) -> bool:
+    return isinstance(value, str) and "://" in value and value.split("://", 1)[0].lower() in PROBE_PLUGINS
+
+def parse_probe_uri(uri: str) -> Dict[str, Any]:
+    parsed = urlparse(uri.strip())
+    scheme = parsed.scheme.lower()
+    if scheme not in PROBE_PLUGINS:
+        raise ValueError(f"unknown probe type `{scheme}`, use one of: {', '.join(sorted(PROBE_PLUGINS))}")
+    if not parsed.hostname:
+        raise ValueError("the probe needs a host, e.g. `tcp://db.example.com:5432`")
+    try:
+        port = parsed.port or PROBE_DEFAULT_PORTS.get(scheme)
+    except ValueError:
+        raise ValueError("the port must be a number between 0 and 65535")
+    if PROBE_PLUGINS[scheme]["needs_port"] and not port:
+        raise ValueError(f"`{scheme}` probes need a port, e.g. `{scheme}://{parsed.hostname}:27015`")
+    params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+    for key in ("payload", "expect_hex"):
+        if key in params:
+            try:
+                bytes.fromhex(params[key])
+            except ValueError:
+                raise ValueError(f"`{key}` must be hexadecimal")
+    if "timeout" in params:
+        try:
+            params["timeout"] = float(params["timeout"])
+        except ValueError:
+            raise ValueError("`timeout` must be a number of seconds")
+    return {"scheme": scheme, "host": parsed.hostname, "port": port, "params": params}
+
+async def close_writer(writer: asyncio.StreamWriter):
+    writer.close()
+    with contextlib.suppress(OSError, ssl.SSLError, asyncio.TimeoutError):
+        await asyncio.wait_for(writer.wait_closed(), 2)
+
+@probe_plugin("tcp", timeout=5.0, concurrency=50)
+async def probe_tcp(target: Dict[str, Any]) -> Dict[str, Any]:
+    _, writer = await asyncio.open_connection(target["host"], target["port"])
+    await close_writer(writer)
+    return {}
+
+@probe_plugin("dns", timeout=5.0, concurrency=20, needs_port=False)
+async def probe_dns(target: Dict[str, Any]) -> Dict[str, Any]:
+    family = {"a": socket.AF_INET, "aaaa": socket.AF_INET6}.get(target["params"].get("type", "").lower(), socket.AF_UNSPEC)
+    infos = await asyncio.get_running_loop().getaddrinfo(target["host"], None, family=family, type=socket.SOCK_STREAM)
+    addresses = sorted({info[4][0] for info in infos})
+    expect = target["params"].get("expect")
+    if expect and expect not in addresses:
+        return {"status": "Unexpected Answer", "online": False, "detail": f"resolved to {', '.join(addresses[:3])}"}
+    return {"detail": f"{len(addresses)} address{'es' if len(addresses) != 1 else ''}"}
+
+@probe_plugin("tls", timeout=10.0, concurrency=20)
+async def probe_tls(target: Dict[str, Any]) -> Dict[str, Any]:
+    context = ssl.create_default_context(cafile=target["params"].get("ca"))
+    _, writer = await asyncio.open_connection(target["host"], target["port"], ssl=context, server_hostname=target["params"].get("sni", target["host"]))
+    certificate = writer.get_extra_info("peercert") or {}
+    await close_writer(writer)
+    expires = ssl.cert_time_to_seconds(certificate["notAfter"])
+    days = int((expires - time.time()) // 86400)
+    result = {"expires_utc": datetime.fromtimestamp(expires, timezone.utc).date().isoformat()}
+    if days < float(target["params"].get("warn_days", 14)):
+        return {**result, "status": "Partial Outage", "detail": f"certificate expires in {days} days"}
+    return {**result, "detail": f"certificate valid for {days} days"}
+
+class DatagramProbe(asyncio.DatagramProtocol):
+    def __init__(self):
+        self.response = asyncio.get_running_loop().create_future()
+
+    def datagram_received(self, data: bytes, addr: Any):
+        if not self.response.done(): self.response.set_result(data)
+
+    def error_received(self, exc: Exception):
+        if not self.response.done(): self.response.set_exception(exc)
+
+@probe_plugin("udp", timeout=3.0, concurrency=50)
+async def probe_udp(target: Dict[str, Any]) -> Dict[str, Any]:
+    params = target["params"]
+    payload = bytes.fromhex(params["payload"]) if "payload" in params else params.get("send", "ping").encode()
+    transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(DatagramProbe, remote_addr=(target["host"], target["port"]))
+    try:
+        transport.sendto(payload)
+        response = await protocol.response
+    finally:
+        transport.close()
+    expected = bytes.fromhex(params["expect_hex"]) if "expect_hex" in params else params.get("expect", "").encode()
+    if expected and expected not in response:
+        return {"status": "Unexpected Answer", "online": False}
+    return {}
+
+class ProbePlugins:
+    def __init__(self, overrides: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.settings: Dict[str, Dict[str, Any]] = {}
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.configure(overrides or {})
+
+    def configure(self, overrides: Dict[str, Dict[str, Any]]):
+        for scheme, plugin in PROBE_PLUGINS.items():
+            settings = {"timeout": plugin["timeout"], "concurrency": plugin["concurrency"], **(overrides.get(scheme) or {})}
+            if self.settings.get(scheme, {}).get("concurrency") != settings["concurrency"]:
+                self.semaphores[scheme] = asyncio.Semaphore(max(1, int(settings["concurrency"])))
+            self.settings[scheme] = settings
+
+    async def run(self, uri: str) -> Dict[str, Any]:
+        try:
+            target = parse_probe_uri(uri)
+        except ValueError as e:
+            return {"status": "Invalid Probe", "online": False, "latency_ms": None, "detail": str(e)}
+        scheme = target["scheme"]
+        async with self.semaphores[scheme]:
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(PROBE_PLUGINS[scheme]["handler"](target), target["params"].get("timeout", self.settings[scheme]["timeout"]))
+            except asyncio.TimeoutError:
+                return {"status": "Timed Out", "online": False, "latency_ms": None}
+            except ssl.SSLCertVerificationError as e:
+                return {"status": "Offline", "online": False, "latency_ms": None, "detail": (e.verify_message or "certificate verify failed")[:100]}
+            except (OSError, ssl.SSLError, KeyError, ValueError) as e:
+                return {"status": "Offline", "online": False, "latency_ms": None, "detail": (os.strerror(e.errno) if isinstance(e, ConnectionError) and e.errno else getattr(e, "strerror", None) or type(e).__name__)[:100]}
+        return {"status": "Operational", "online": True, "latency_ms": round((time.perf_counter() - started) * 1000, 1), **result}
+
+def ring_hash(value: str) -> int:
+    return int.from_bytes(hashlib.sha1(value.encode("utf-8")).digest()[:8], "big")
+
+class HashRing:
+    def __init__(self, nodes: List[str], vnodes: int = 64):
+        self.nodes = sorted(nodes)
+        self.points = sorted((ring_hash(f"{node}#{i}"), node) for node in self.nodes for i in range(vnodes))
+        self.hashes = [point for point, _ in self.points]
+
+    def lookup(self, key: str, count: int) -> List[str]:
+        count = min(count, len(self.nodes))
+        owners: List[str] = []
+        start = bisect.bisect(self.hashes, ring_hash(key))
+        for offset in range(len(self.points)):
+            if len(owners) >= count: break
+            node = self.points[(start + offset) % len(self.points)][1]
+            if node not in owners: owners.append(node)
+        return owners
+
+class AgentHub:
+    def __init__(self, is_failure: Callable[[Dict[str, Any]], bool], replicas: int = 3, quorum: float = 0.5, timeout: float = 30.0, sync_interval: float = 5.0):
+        self.is_failure = is_failure
+        self.configure(replicas, quorum, timeout, sync_interval)
+        self.agents: Dict[str, float] = {}
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        self.reports: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.urgent: Dict[str, set] = {}
+        self.ring = HashRing([])
+        self.owners: Optional[Dict[str, List[str]]] = None
+        self.arrived = asyncio.Event()
+        self.stats = {"syncs": 0, "reports": 0, "rebalances": 0}
+
+    def configure(self, replicas: int, quorum: float, timeout: float, sync_interval: float):
+        if getattr(self, "replicas", replicas) != replicas: self.owners = None
+        self.replicas, self.quorum, self.timeout, self.sync_interval = max(1, int(replicas)), quorum, timeout, sync_interval
+
+    def live_agents(self) -> List[str]:
+        now = time.monotonic()
+        for name in [name for name, seen in self.agents.items() if now - seen > self.timeout]:
+            del self.agents[name]
+        return sorted(self.agents)
+
+    def placement(self) -> Dict[str, List[str]]:
+        live = self.live_agents()
+        if live != self.ring.nodes:
+            print(f"Probe agents changed to [{', '.join(live) or 'none'}], rebalancing {len(self.targets)} targets.")
+            self.ring = HashRing(live)
+            self.owners = None
+            self.stats["rebalances"] += 1
+        if self.owners is None:
+            self.owners = {target: self.ring.lookup(target, self.replicas) for target in self.targets}
+        return self.owners
+
+    def set_targets(self, targets: Dict[str, Dict[str, Any]]):
+        if targets == self.targets: return
+        self.targets = targets
+        self.owners = None
+        for target in [t for t in self.reports if t not in targets]:
+            del self.reports[target]
+            self.urgent.pop(target, None)
+
+    def sync(self, agent: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        self.agents[agent] = time.monotonic()
+        self.stats["syncs"] += 1
+        now = time.time()
+        for item in results:
+            target = item.get("id") if isinstance(item, dict) else None
+            if target not in self.targets or not isinstance(item.get("result"), dict): continue
+            self.reports.setdefault(target, {})[agent] = {"result": item["result"], "at": now}
+            self.urgent.get(target, set()).discard(agent)
+            self.stats["reports"] += 1
+        if results:
+            self.arrived.set()
+            self.arrived = asyncio.Event()
+        assigned = [{**self.targets[t], "urgent": agent in self.urgent.get(t, ())} for t, owners in self.placement().items() if agent in owners]
+        return {"targets": assigned, "sync_interval": self.sync_interval}
+
+    def aggregate(self, target: str) -> Optional[Dict[str, Any]]:
+        owners = self.placement().get(target)
+        if not owners: return None
+        ttl = self.targets[target]["interval"] * 2 + self.sync_interval * 2
+        now = time.time()
+        fresh = [report["result"] for agent, report in self.reports.get(target, {}).items() if agent in owners and now - report["at"] <= ttl]
+        if not fresh: return None
+        failed = [result for result in fresh if self.is_failure(result)]
+        down = len(failed) > self.quorum * len(fresh)
+        side = sorted(failed if down else [result for result in fresh if not self.is_failure(result)], key=lambda r: r.get("latency_ms") or 0)
+        return {**side[len(side) // 2], "agents_up": len(fresh) - len(failed), "agents_total": len(fresh)}
+
+    async def recheck(self, target: str, timeout: float):
+        owners = self.placement().get(target)
+        if not owners: return
+        self.urgent[target] = set(owners)
+        deadline = time.monotonic() + timeout
+        try:
+            while self.urgent.get(target, set()) & set(self.live_agents()):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0: break
+                try:
+                    await asyncio.wait_for(self.arrived.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            self.urgent.pop(target, None)
+
+    def load(self) -> Dict[str, int]:
+        counts = {agent: 0 for agent in self.ring.nodes}
+        for owners in self.placement().values():
+            for agent in owners: counts[agent] = counts.get(agent, 0) + 1
+        return counts
+
+class ProbeAgent:
+    def __init__(self, hub_url: str, token: str, name: str, config: Dict[str, Any]):
+        self.sync_url = hub_url.rstrip("/") + "/agents/sync"
+        self.token, self.name, self.config = token, name, config
+        self.http = HttpClients(config)
+        self.engine = ProbeEngine(config["probe_concurrency"], config["probe_per_host"], config["probe_deadline"])
+        self.plugins = ProbePlugins(config["probe_types"])
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        self.due: Dict[str, float] = {}
+        self.pending: Deque[Dict[str, Any]] = deque(maxlen=10000)
+        self.sync_interval = float(config["agent_sync_interval"])
+
+    async def sync(self) -> bool:
+        sent = list(self.pending)
+        body = gzip.compress(json.dumps({"agent": self.name, "results": sent}).encode("utf-8"))
+        headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json", "Content-Encoding": "gzip"}
+        try:
+            async with self.http.session("delivery").post(self.sync_url, data=body, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                assignment = await response.json()
+            targets = {target["id"]: target for target in assignment["targets"]}
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError, TypeError) as e:
+            print(f"Agent '{self.name}' could not sync with {self.sync_url}: {e or type(e).__name__}")
+            return False
+        for _ in sent: self.pending.popleft()
+        if targets.keys() != self.targets.keys():
+            print(f"Agent '{self.name}' now probes {len(targets)} targets.")
+        self.targets = targets
+        self.sync_interval = float(assignment.get("sync_interval", self.sync_interval))
+        for target in [t for t in self.due if t not in targets]:
+            del self.due[target]
+        return True
+
+    async def probe(self, target: Dict[str, Any]) -> Dict[str, Any]:
+        if target["kind"] == "website": return await check_website(self.http, target["site"], self.config)
+        return await self.plugins.run(target["uri"])
+
+    async def probe_due(self) -> int:
+        now = time.monotonic()
+        due = [t for t in self.targets.values() if t.get("urgent") or self.due.get(t["id"], 0) <= now]
+        jobs = [(urlparse(t["site"]["url"] if t["kind"] == "website" else t["uri"]).hostname, lambda t=t: self.probe(t), {"status": "Timed Out", "online": False}) for t in due]
+        for target, result in zip(due, await self.engine.run(jobs)):
+            self.pending.append({"id": target["id"], "result": result})
+            self.due[target["id"]] = now + target["interval"]
+        return len(due)
+
+    async def run(self):
+        print(f"Probe agent '{self.name}' reporting to {self.sync_url}")
+        try:
+            while True:
+                await self.sync()
+                if await self.probe_due(): await self.sync()
+                await asyncio.sleep(self.sync_interval)
+        finally:
+            await self.http.close()
+
+class ComponentFeedError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"Discord status feed returned HTTP {status}")
+        self.status = status
+
+class ComponentFeedCache:
+    def __init__(self, url: str = DISCORD_COMPONENTS_URL, ttl: float = 60.0, stale_limit: float = 600.0):
+        self.url = url
+        self.ttl = ttl
+        self.stale_limit = stale_limit
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.inflight: Optional[asyncio.Future] = None
+        self.stats = {"hits": 0, "misses": 0, "revalidations": 0, "coalesced": 0, "errors": 0, "stale": 0}
+
+    def is_fresh(self) -> bool:
+        return self.fetched_at is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    def top_level(self) -> List[Dict[str, Any]]:
+        return self.groups.get(None, [])
+
+    def children(self, group_id: str) -> List[Dict[str, Any]]:
+        return self.groups.get(group_id, [])
+
+    def build_index(self, components: List[Dict[str, Any]]):
+        self.components = {c['id']: c for c in components}
+        self.groups = {}
+        for component in components:
+            self.groups.setdefault(component.get('group_id'), []).append(component)
+
+    async def get(self, session: aiohttp.ClientSession, force: bool = False) -> "ComponentFeedCache":
+        if not force and self.is_fresh():
+            self.stats["hits"] += 1
+            return self
+        if self.inflight is None:
+            self.inflight = asyncio.ensure_future(self._refresh(session))
+            self.inflight.add_done_callback(self._clear_inflight)
+        else:
+            self.stats["coalesced"] += 1
+        try:
+            await asyncio.shield(self.inflight)
+        except Exception:
+            if not self.components or time.monotonic() - self.fetched_at > self.stale_limit: raise
+            self.stats["stale"] += 1
+        return self
+
+    def _clear_inflight(self, future: asyncio.Future):
+        if self.inflight is future: self.inflight = None
+        if not future.cancelled(): future.exception()
+
+    async def _refresh(self, session: aiohttp.ClientSession):
+        headers = {}
+        if self.components:
+            if self.etag: headers["If-None-Match"] = self.etag
+            if self.last_modified: headers["If-Modified-Since"] = self.last_modified
+        try:
+            async with session.get(self.url, headers=headers, timeout=10) as resp:
+                if resp.status == 304 and self.components:
+                    self.stats["revalidations"] += 1
+                elif resp.status == 200:
+                    self.stats["misses"] += 1
+                    self.build_index((await resp.json(content_type=None)).get('components', []))
+                    self.etag = resp.headers.get("ETag")
+                    self.last_modified = resp.headers.get("Last-Modified")
+                else:
+                    raise ComponentFeedError(resp.status)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        self.fetched_at = time.monotonic()
+
+PresenceKey = Tuple[int, int]
+
+class PresenceTracker:
+    def __init__(self):
+        self.table: Dict[PresenceKey, Dict[str, Any]] = {}
+        self.reconciled_at: Dict[PresenceKey, float] = {}
+
+    def set(self, key: PresenceKey, status: str, raw_status: str) -> bool:
+        entry = self.table.get(key)
+        if entry and entry["raw_status"] == raw_status: return False
+        self.table[key] = {"status": status, "raw_status": raw_status, "changed_at": time.time()}
+        return True
+
+    def observe(self, member: discord.Member) -> bool:
+        return self.set((member.guild.id, member.id), BOT_STATUS_TEXT.get(member.status, "Offline"), str(member.status))
+
+    def mark_reconciled(self, key: PresenceKey):
+        self.reconciled_at[key] = time.monotonic()
+
+    def reconcile_due(self, key: PresenceKey, interval: float) -> bool:
+        if key not in self.table: return True
+        last = self.reconciled_at.get(key)
+        return last is None or time.monotonic() - last >= interval
+
+    def bot_data(self, key: PresenceKey) -> Dict[str, Any]:
+        entry = self.table[key]
+        changed = datetime.fromtimestamp(entry["changed_at"], timezone.utc).isoformat()
+        return {"status": entry["status"], "raw_status": entry["raw_status"], "status_since_utc": changed}
+
+    def prune(self, keys: List[PresenceKey]):
+        keep = set(keys)
+        for key in [k for k in self.table if k not in keep]:
+            del self.table[key]
+            self.reconciled_at.pop(key, None)
+
+class HistoryStore:
+    def __init__(self, path: str = HISTORY_FILE, raw_retention_days: float = 7, minute_retention_days: float = 14, hour_retention_days: float = 400):
+        self.path = path
+        self.retention = {None: raw_retention_days * 86400, 60: minute_retention_days * 86400, 3600: hour_retention_days * 86400}
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-history")
+        self.db: Optional[sqlite3.Connection] = None
+        self.target_ids: Dict[str, int] = {}
+        self.last_prune = 0.0
+
+    def connect(self) -> sqlite3.Connection:
+        if self.db is None:
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS targets (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);
+                CREATE TABLE IF NOT EXISTS samples (ts INTEGER NOT NULL, target INTEGER NOT NULL, up INTEGER NOT NULL, state TEXT, code INTEGER, latency_ms REAL);
+                CREATE INDEX IF NOT EXISTS samples_target_ts ON samples (target, ts);
+                CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts);
+                CREATE TABLE IF NOT EXISTS rollups (resolution INTEGER NOT NULL, target INTEGER NOT NULL, bucket INTEGER NOT NULL, checks INTEGER NOT NULL, ups INTEGER NOT NULL, latency_sum REAL NOT NULL, latency_count INTEGER NOT NULL, PRIMARY KEY (resolution, target, bucket)) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS rollup_latency (resolution INTEGER NOT NULL, target INTEGER NOT NULL, bucket INTEGER NOT NULL, bin INTEGER NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (resolution, target, bucket, bin)) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS incidents (id INTEGER PRIMARY KEY, target INTEGER NOT NULL, kind TEXT NOT NULL, started_at INTEGER NOT NULL, confirmed_at INTEGER NOT NULL, ended_at INTEGER, cause TEXT);
+                CREATE INDEX IF NOT EXISTS incidents_open ON incidents (target, kind) WHERE ended_at IS NULL;
+            """)
+            columns = {row[1] for row in self.db.execute("PRAGMA table_info(samples)")}
+            for column in PROBE_PHASES:
+                if column not in columns: self.db.execute(f"ALTER TABLE samples ADD COLUMN {column} REAL")
+            self.target_ids = {name: target_id for target_id, name in self.db.execute("SELECT id, name FROM targets")}
+        return self.db
+
+    def target_id(self, name: str) -> int:
+        if name not in self.target_ids:
+            cursor = self.db.execute("INSERT OR IGNORE INTO targets (name) VALUES (?)", (name,))
+            self.target_ids[name] = cursor.lastrowid if cursor.rowcount else self.db.execute("SELECT id FROM targets WHERE name = ?", (name,)).fetchone()[0]
+        return self.target_ids[name]
+
+    def record(self, samples: List[Dict[str, Any]]):
+        db = self.connect()
+        with db:
+            for sample in samples:
+                target, ts, up, latency, timings = self.target_id(sample["target"]), int(sample["ts"]), int(sample["up"]), sample.get("latency_ms"), sample.get("timings") or {}
+                db.execute(
+                    f"INSERT INTO samples (ts, target, up, state, code, latency_ms, {', '.join(PROBE_PHASES)}) VALUES (?, ?, ?, ?, ?, ?{', ?' * len(PROBE_PHASES)})",
+                    (ts, target, up, sample.get("state"), sample.get("code"), latency, *map(timings.get, PROBE_PHASES)))
+                for resolution in ROLLUP_RESOLUTIONS:
+                    bucket = ts - ts % resolution
+                    db.execute(
+                        "INSERT INTO rollups VALUES (?, ?, ?, 1, ?, ?, ?) ON CONFLICT (resolution, target, bucket) DO UPDATE SET "
+                        "checks = checks + 1, ups = ups + excluded.ups, latency_sum = latency_sum + excluded.latency_sum, latency_count = latency_count + excluded.latency_count",
+                        (resolution, target, bucket, up, latency or 0.0, int(latency is not None)))
+                    if latency is not None:
+                        db.execute(
+                            "INSERT INTO rollup_latency VALUES (?, ?, ?, ?, 1) ON CONFLICT (resolution, target, bucket, bin) DO UPDATE SET count = count + 1",
+                            (resolution, target, bucket, bisect.bisect_left(LATENCY_BINS_MS, latency)))
+        if time.time() - self.last_prune >= 3600:
+            self.prune()
+
+    def prune(self):
+        db, now = self.connect(), time.time()
+        with db:
+            db.execute("DELETE FROM samples WHERE ts < ?", (int(now - self.retention[None]),))
+            for resolution in (60, 3600):
+                db.execute("DELETE FROM rollups WHERE resolution = ? AND bucket < ?", (resolution, int(now - self.retention[resolution])))
+                db.execute("DELETE FROM rollup_latency WHERE resolution = ? AND bucket < ?", (resolution, int(now - self.retention[resolution])))
+        self.last_prune = now
+
+    def open_incident(self, target: str, kind: str, started_at: float, cause: Optional[str]) -> int:
+        db = self.connect()
+        with db:
+            target_id = self.target_id(target)
+            row = db.execute("SELECT id FROM incidents WHERE target = ? AND kind = ? AND ended_at IS NULL", (target_id, kind)).fetchone()
+            if row: return row[0]
+            return db.execute("INSERT INTO incidents (target, kind, started_at, confirmed_at, cause) VALUES (?, ?, ?, ?, ?)", (target_id, kind, int(started_at), int(time.time()), cause)).lastrowid
+
+    def close_incident(self, target: str, kind: str, ended_at: float) -> Optional[float]:
+        db = self.connect()
+        if target not in self.target_ids: return None
+        with db:
+            row = db.execute("SELECT id, started_at FROM incidents WHERE target = ? AND kind = ? AND ended_at IS NULL", (self.target_ids[target], kind)).fetchone()
+            if not row: return None
+            db.execute("UPDATE incidents SET ended_at = ? WHERE id = ?", (int(ended_at), row[0]))
+        return ended_at - row[1]
+
+    def incidents(self, seconds: float) -> List[Dict[str, Any]]:
+        db = self.connect()
+        names = {target_id: name for name, target_id in self.target_ids.items()}
+        rows = db.execute("SELECT target, kind, started_at, confirmed_at, ended_at, cause FROM incidents WHERE ended_at IS NULL OR ended_at >= ? ORDER BY started_at", (int(time.time() - seconds),))
+        return [{"target": names.get(target), "kind": kind, "started_at": started_at, "confirmed_at": confirmed_at, "ended_at": ended_at, "duration_s": ended_at - started_at if ended_at else None, "cause": cause} for target, kind, started_at, confirmed_at, ended_at, cause in rows]
+
+    @staticmethod
+    def resolution_for(seconds: float) -> int:
+        if seconds >= 30 * 86400: return 86400
+        if seconds >= 2 * 86400: return 3600
+        return 60
+
+    @staticmethod
+    def percentile(bins: List[Tuple[int, int]], pct: float) -> Optional[float]:
+        total = sum(count for _, count in bins)
+        if not total: return None
+        rank, seen = total * pct / 100, 0
+        for index, count in sorted(bins):
+            if seen + count >= rank:
+                lower = LATENCY_BINS_MS[index - 1] if index > 0 else 0.0
+                upper = LATENCY_BINS_MS[min(index, len(LATENCY_BINS_MS) - 1)]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return float(LATENCY_BINS_MS[-1])
+
+    def uptime(self, target: str, seconds: float) -> Optional[float]:
+        db = self.connect()
+        if target not in self.target_ids: return None
+        ups, checks = db.execute(
+            "SELECT SUM(ups), SUM(checks) FROM rollups WHERE resolution = ? AND target = ? AND bucket >= ?",
+            (self.resolution_for(seconds), self.target_ids[target], int(time.time() - seconds))).fetchone()
+        return 100.0 * ups / checks if checks else None
+
+    def latency_percentiles(self, target: str, seconds: float, percentiles: Tuple[float, ...] = (50, 95)) -> Dict[float, Optional[float]]:
+        db = self.connect()
+        if target not in self.target_ids: return {pct: None for pct in percentiles}
+        bins = db.execute(
+            "SELECT bin, SUM(count) FROM rollup_latency WHERE resolution = ? AND target = ? AND bucket >= ? GROUP BY bin",
+            (self.resolution_for(seconds), self.target_ids[target], int(time.time() - seconds))).fetchall()
+        return {pct: self.percentile(bins, pct) for pct in percentiles}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        db, now = self.connect(), time.time()
+        names = {target_id: name for name, target_id in self.target_ids.items()}
+        summary: Dict[str, Dict[str, Any]] = {}
+        for label, seconds in (("uptime_24h", 86400), ("uptime_7d", 7 * 86400)):
+            for target, ups, checks in db.execute("SELECT target, SUM(ups), SUM(checks) FROM rollups WHERE resolution = 3600 AND bucket >= ? GROUP BY target", (int(now - seconds),)):
+                if checks and target in names: summary.setdefault(names[target], {})[label] = round(100.0 * ups / checks, 2)
+        bins: Dict[int, List[Tuple[int, int]]] = {}
+        for target, index, count in db.execute("SELECT target, bin, SUM(count) FROM rollup_latency WHERE resolution = 3600 AND bucket >= ? GROUP BY target, bin", (int(now - 86400),)):
+            bins.setdefault(target, []).append((index, count))
+        for target, target_bins in bins.items():
+            if target in names:
+                summary.setdefault(names[target], {}).update({"latency_p50_ms": round(self.percentile(target_bins, 50)), "latency_p95_ms": round(self.percentile(target_bins, 95))})
+        return summary
+
+    async def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    def close(self):
+        def _close():
+            if self.db is not None: self.db.close(); self.db = None
+        self.executor.submit(_close)
+        self.executor.shutdown(wait=False)
+
+class EditPacer:
+    def __init__(self, min_spacing: float = 1.0, channel_gap: float = 5.0, window: float = SCHEDULER_TICK_SECONDS):
+        self.min_spacing = min_spacing
+        self.channel_gap = channel_gap
+        self.window = window
+        self.pending: Dict[DashboardKey, Tuple[int, Callable[[], Awaitable[None]]]] = {}
+        self.channel_last_edit: Dict[int, float] = {}
+        self.last_edit = float("-inf")
+        self.waited = 0.0
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def submit(self, key: DashboardKey, channel_id: int, edit: Callable[[], Awaitable[None]]):
+        self.pending[key] = (channel_id, edit)
+        self.wakeup.set()
+
+    def discard(self, key: DashboardKey):
+        self.pending.pop(key, None)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self.task: self.task.cancel()
+
+    def spacing(self) -> float:
+        return max(self.min_spacing, self.window / (len(self.pending) + 1))
+
+    async def run(self):
+        while True:
+            if not self.pending:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            now = time.monotonic()
+            wait = self.last_edit + self.spacing() - now
+            ready = next((key for key, (channel_id, _) in self.pending.items() if self.channel_last_edit.get(channel_id, float("-inf")) + self.channel_gap <= now), None)
+            if ready is None:
+                wait = max(wait, min(self.channel_last_edit[channel_id] + self.channel_gap for channel_id, _ in self.pending.values()) - now)
+            if wait > 0:
+                self.waited += wait
+                await asyncio.sleep(wait)
+                continue
+            channel_id, edit = self.pending.pop(ready)
+            self.last_edit = self.channel_last_edit[channel_id] = time.monotonic()
+            try:
+                await edit()
+            except Exception as e:
+                print(f"Failed to edit status embed in channel {channel_id}: {e}")
+
+class UpdateCoordinator:
+    def __init__(self, cycle: Callable[[set, set, List[Any]], Awaitable[None]], debounce: float = 2.0):
+        self.cycle = cycle
+        self.debounce = debounce
+        self.probe: set = set()
+        self.force: set = set()
+        self.targets: set = set()
+        self.due_at: Optional[float] = None
+        self.waiters: List[asyncio.Future] = []
+        self.running = False
+        self.stats = {"requested": 0, "folded": 0, "cycles": 0}
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def request(self, probe: bool = False, force: Tuple[int, ...] = (), targets: Tuple[Any, ...] = (), debounce: bool = False) -> asyncio.Future:
+        self.stats["requested"] += 1
+        if probe: self.probe.update(force)
+        self.force.update(force)
+        self.targets.update(targets)
+        now = time.monotonic()
+        if not debounce: self.due_at = now
+        elif self.due_at is None or self.due_at > now: self.due_at = now + self.debounce
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.wakeup.set()
+        return waiter
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self.task: self.task.cancel()
+
+    async def run(self):
+        while True:
+            wait = None if self.due_at is None else self.due_at - time.monotonic()
+            if wait is None or wait > 0:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            probe, force, targets, waiters = self.probe, self.force, list(self.targets), self.waiters
+            self.probe, self.force, self.targets, self.waiters, self.due_at = set(), set(), set(), [], None
+            self.running = True
+            self.stats["cycles"] += 1
+            self.stats["folded"] += len(waiters) - 1
+            try:
+                await self.cycle(probe, force, targets)
+            except Exception as e:
+                print(f"Status update cycle failed: {e}")
+            finally:
+                self.running = False
+                for waiter in waiters:
+                    if not waiter.done(): waiter.set_result(None)
+
+DeliveryKey = Tuple[int, str]
+
+class DeliveryError(Exception):
+    def __init__(self, message: str, permanent: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.permanent = permanent
+        self.retry_after = retry_after
+
+class DeliveryQueue:
+    def __init__(self, send: Callable[[DeliveryKey, Dict[str, Any]], Awaitable[None]], spool_path: str, limit: int = 100, concurrency: int = 4, base_delay: float = 2.0, max_delay: float = 300.0):
+        self.send = send
+        self.spool_path = spool_path
+        self.limit = limit
+        self.concurrency = concurrency
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.pending: Dict[DeliveryKey, Dict[str, Any]] = {}
+        self.sending: Dict[DeliveryKey, Dict[str, Any]] = {}
+        self.counters = {"delivered": 0, "failed": 0, "retries": 0, "superseded": 0, "dropped": 0}
+        self.latencies: Deque[float] = deque(maxlen=200)
+        self.request_ms_last: Optional[float] = None
+        self.spool_dirty = False
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.load_spool()
+
+    def load_spool(self):
+        try:
+            with open(self.spool_path, "r", encoding="utf-8") as f:
+                for item in json.load(f):
+                    self.pending[(int(item["guild_id"]), item["url"])] = {"payload": item["payload"], "queued_at": item["queued_at"], "attempts": item.get("attempts", 0), "due": 0.0}
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            pass
+
+    def spool_snapshot(self) -> List[Dict[str, Any]]:
+        entries = {**self.sending, **self.pending}
+        return [{"guild_id": guild_id, "url": url, "payload": entry["payload"], "queued_at": entry["queued_at"], "attempts": entry["attempts"]} for (guild_id, url), entry in entries.items()]
+
+    def write_spool(self, snapshot: List[Dict[str, Any]]):
+        atomic_write(self.spool_path, json.dumps(snapshot).encode("utf-8"))
+
+    def submit(self, key: DeliveryKey, payload: Dict[str, Any]):
+        previous = self.pending.get(key)
+        if previous:
+            self.counters["superseded"] += 1
+        elif len(self.pending) >= self.limit:
+            oldest = min(self.pending, key=lambda k: self.pending[k]["queued_at"])
+            del self.pending[oldest]
+            self.counters["dropped"] += 1
+            print(f"API delivery queue is full, dropped the snapshot for {oldest[1]}")
+        self.pending[key] = {"payload": payload, "queued_at": time.time(), "attempts": previous["attempts"] if previous else 0, "due": previous["due"] if previous else 0.0}
+        self.spool_dirty = True
+        self.wakeup.set()
+
+    def backoff(self, attempts: int, retry_after: Optional[float]) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        delay = random.uniform(delay / 2, delay)
+        return max(delay, retry_after or 0.0)
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self.task: self.task.cancel()
+        if self.spool_dirty or self.sending:
+            try:
+                self.write_spool(self.spool_snapshot())
+            except OSError as e:
+                print(f"Failed to write the API delivery spool: {e}")
+
+    async def run(self):
+        workers: Dict[DeliveryKey, asyncio.Task] = {}
+        while True:
+            now = time.monotonic()
+            for key in [k for k, entry in self.pending.items() if entry["due"] <= now and k not in self.sending][:max(0, self.concurrency - len(self.sending))]:
+                self.sending[key] = self.pending.pop(key)
+                workers[key] = asyncio.create_task(self.deliver(key, self.sending[key]))
+                workers[key].add_done_callback(lambda _, k=key: workers.pop(k, None))
+            self.wakeup.clear()
+            if self.spool_dirty:
+                self.spool_dirty = False
+                try:
+                    await asyncio.to_thread(self.write_spool, self.spool_snapshot())
+                except OSError as e:
+                    print(f"Failed to write the API delivery spool: {e}")
+            waits = [entry["due"] - time.monotonic() for key, entry in self.pending.items() if key not in self.sending]
+            timeout = max(0.0, min(waits)) if waits and len(self.sending) < self.concurrency else None
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def deliver(self, key: DeliveryKey, entry: Dict[str, Any]):
+        started = time.perf_counter()
+        try:
+            await self.send(key, entry["payload"])
+        except Exception as e:
+            permanent = isinstance(e, DeliveryError) and e.permanent
+            entry["attempts"] += 1
+            if permanent:
+                self.counters["failed"] += 1
+                print(f"API delivery to '{key[1]}' was rejected, dropping snapshot. Error: {e}")
+            else:
+                self.counters["retries"] += 1
+                delay = self.backoff(entry["attempts"], getattr(e, "retry_after", None))
+                target = self.pending.setdefault(key, entry)
+                target["attempts"], target["due"] = entry["attempts"], time.monotonic() + delay
+                print(f"API delivery to '{key[1]}' failed (attempt {entry['attempts']}), retrying in {delay:.0f}s. Error: {e}")
+        else:
+            self.counters["delivered"] += 1
+            self.latencies.append(time.time() - entry["queued_at"])
+            self.request_ms_last = round((time.perf_counter() - started) * 1000, 1)
+        finally:
+            self.sending.pop(key, None)
+            self.spool_dirty = True
+            self.wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        oldest = min((entry["queued_at"] for entry in self.pending.values()), default=None)
+        return {
+            "depth": len(self.pending), "in_flight": len(self.sending), **self.counters,
+            "oldest_pending_s": round(time.time() - oldest, 1) if oldest else None,
+            "latency_ms_avg": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else None,
+            "latency_ms_p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1) if latencies else None,
+            "request_ms_last": self.request_ms_last
+        }
+
+TargetKey = Tuple[Any, ...]
+
+class IncidentTracker:
+    def __init__(self, threshold: int = 2, window: int = 3, flap_window: float = 3600, flap_threshold: int = 6):
+        self.states: Dict[TargetKey, Dict[str, Any]] = {}
+        self.configure(threshold, window, flap_window, flap_threshold)
+
+    def configure(self, threshold: int, window: int, flap_window: float, flap_threshold: int):
+        self.threshold = max(1, threshold)
+        self.window = max(self.threshold, window)
+        self.flap_window = flap_window
+        self.flap_threshold = flap_threshold
+
+    def observe(self, key: TargetKey, result: Dict[str, Any], failed: bool) -> Tuple[Dict[str, Any], List[Tuple[str, float]]]:
+        state = self.states.get(key)
+        if state is None:
+            state = self.states[key] = {"down": False, "incident": False, "flapping": False, "since": None, "published": None, "last_failed": False, "checks": deque(maxlen=self.window), "transitions": deque()}
+        elif state["checks"].maxlen != self.window:
+            state["checks"] = deque(state["checks"], maxlen=self.window)
+        now = time.time()
+        state["checks"].append((now, failed))
+        state["last_failed"] = failed
+        failures = sum(1 for _, check_failed in state["checks"] if check_failed)
+        events: List[Tuple[str, float]] = []
+        if not state["down"] and failures >= self.threshold:
+            state["down"], state["since"], state["published"] = True, next(ts for ts, check_failed in state["checks"] if check_failed), result
+            state["transitions"].append(now)
+        elif state["down"] and len(state["checks"]) - failures >= self.threshold:
+            state["down"], state["since"] = False, None
+            state["transitions"].append(now)
+        if state["published"] is None or (not state["down"] and not failed):
+            state["published"] = result
+        while state["transitions"] and state["transitions"][0] < now - self.flap_window:
+            state["transitions"].popleft()
+        if not state["flapping"] and len(state["transitions"]) >= self.flap_threshold:
+            state["flapping"] = True
+            events.append(("flap_start", now))
+        elif state["flapping"] and len(state["transitions"]) <= self.flap_threshold // 2:
+            state["flapping"] = False
+            events.append(("flap_end", now))
+        if not state["flapping"] and state["down"] != state["incident"]:
+            state["incident"] = state["down"]
+            events.append(("down", state["since"]) if state["down"] else ("up", now))
+        if state["flapping"]:
+            return {**result, "status": "Flapping", "online": False, "flapping": True}, events
+        published = dict(state["published"])
+        if state["down"]:
+            published["down_since_utc"] = datetime.fromtimestamp(state["since"], timezone.utc).isoformat()
+        return published, events
+
+    def needs_reprobe(self, key: TargetKey) -> bool:
+        state = self.states.get(key)
+        return bool(state) and not state["flapping"] and state["down"] != state["last_failed"]
+
+    def prune(self, keys: Any):
+        for key in [k for k in self.states if k not in keys]:
+            del self.states[key]
+
+class TargetScheduler:
+    def __init__(self, min_interval: float = 30.0, max_factor: float = 4.0, backoff: float = 1.5):
+        self.min_interval = min_interval
+        self.max_factor = max_factor
+        self.backoff = backoff
+        self.heap: List[Tuple[float, int, TargetKey]] = []
+        self.entries: Dict[TargetKey, Dict[str, float]] = {}
+        self.counter = itertools.count()
+
+    def _push(self, key: TargetKey, due: float):
+        self.entries[key]["due"] = due
+        heapq.heappush(self.heap, (due, next(self.counter), key))
+
+    def sync(self, targets: Dict[TargetKey, float]):
+        now = time.monotonic()
+        for key in [k for k in self.entries if k not in targets]:
+            del self.entries[key]
+        for key, base in targets.items():
+            entry = self.entries.get(key)
+            if entry is None:
+                self.entries[key] = {"base": base, "interval": base}
+                self._push(key, now)
+            elif entry["base"] != base:
+                entry.update(base=base, interval=base)
+                self._push(key, min(entry["due"], now + base))
+
+    def pop_due(self, targets: Dict[TargetKey, float]) -> List[TargetKey]:
+        self.sync(targets)
+        now, due = time.monotonic(), []
+        while self.heap and self.heap[0][0] <= now:
+            when, _, key = heapq.heappop(self.heap)
+            entry = self.entries.get(key)
+            if entry is not None and entry["due"] == when and key not in due:
+                due.append(key)
+        return due
+
+    def requeue(self, keys: List[TargetKey]):
+        now = time.monotonic()
+        for key in keys:
+            if key in self.entries: self._push(key, now)
+
+    def record(self, key: TargetKey, changed: bool, failed: bool):
+        entry = self.entries.get(key)
+        if entry is None: return
+        if changed or failed:
+            entry["interval"] = max(self.min_interval, min(entry["base"], entry["base"] / self.max_factor))
+        else:
+            entry["interval"] = min(entry["base"] * self.max_factor, entry["interval"] * self.backoff)
+        self._push(key, time.monotonic() + entry["interval"])
+
+    def next_due_in(self, key: TargetKey) -> Optional[float]:
+        entry = self.entries.get(key)
+        return None if entry is None else max(0.0, entry["due"] - time.monotonic())
+
+class TitleModal(discord.ui.Modal, title="Change Embed Title & Layout"):
+    def __init__(self, cog: "StatusCog", guild_id: int):
         super().__init__()
         self.cog = cog
-        self.new_title = discord.ui.TextInput(label="New Embed Title", placeholder="e.g., Zygnal Status", default=self.cog.config.get("embed_title", "Service Status"))
+        self.guild_config = cog.guild_config(guild_id)
+        self.new_title = discord.ui.TextInput(label="New Embed Title", placeholder="e.g., Zygnal Status", default=self.guild_config.get("embed_title", "Service Status"), max_length=200)
+        self.layout = discord.ui.TextInput(label="Layout (auto, full or compact)", placeholder="auto switches to a summary for large lists", default=self.guild_config.get("dashboard_layout", "auto"), required=False, max_length=10)
         self.add_item(self.new_title)
+        self.add_item(self.layout)
 
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         new_title = self.new_title.value.strip()
-        self.cog.config["embed_title"] = new_title
+        layout = self.layout.value.strip().lower() or "auto"
+        if layout not in DASHBOARD_LAYOUTS:
+            await interaction.followup.send(embed=create_response_embed("❌ Invalid Layout", "The layout must be `auto`, `full` or `compact`.", color=discord.Color.red()), ephemeral=True)
+            return
+        self.guild_config["embed_title"] = new_title
+        self.guild_config["dashboard_layout"] = layout
         self.cog.save_config()
-        await interaction.followup.send(embed=create_response_embed("✅ Title Updated", f"The embed title has been set to **{new_title}**."), ephemeral=True)
-        await self.cog.trigger_update()
+        await interaction.followup.send(embed=create_response_embed("✅ Title Updated", f"The embed title has been set to **{new_title}** with the **{layout}** layout."), ephemeral=True)
+        await self.cog.trigger_update(interaction.guild_id, debounce=True)
 
 class ApiSettingsModal(discord.ui.Modal, title="API/Webhook Settings"):
-    def __init__(self, cog: "StatusCog"):
+    def __init__(self, cog: "StatusCog", guild_id: int):
         super().__init__()
         self.cog = cog
-        self.api_url = discord.ui.TextInput(label="API POST URL", placeholder="e.g., https://zygnalbot.com/api/receive_status.php", default=self.cog.config.get("api_post_url"), style=discord.TextStyle.long, required=False)
-        self.api_token = discord.ui.TextInput(label="Secret Token (optional)", placeholder="A secure password to authorize the request", default=self.cog.config.get("api_secret_token"), required=False)
+        self.guild_config = cog.guild_config(guild_id)
+        self.api_url = discord.ui.TextInput(label="API POST URL", placeholder="e.g., https://zygnalbot.com/api/receive_status.php", default=self.guild_config.get("api_post_url"), style=discord.TextStyle.long, required=False)
+        self.api_token = discord.ui.TextInput(label="Secret Token (optional)", placeholder="A secure password to authorize the request", default=self.guild_config.get("api_secret_token"), required=False)
+        extra = "\n".join(" ".join(filter(None, (d["url"], d.get("token")))) for d in self.guild_config.get("api_destinations", []))
+        self.api_extra = discord.ui.TextInput(label="Extra Destinations (one per line)", placeholder="https://example.com/receive_status.php token", default=extra, style=discord.TextStyle.long, required=False)
+        self.api_gzip = discord.ui.TextInput(label="Compress with gzip (yes/no)", default="yes" if self.guild_config.get("api_gzip") else "no", max_length=3, required=False)
+        self.api_delta = discord.ui.TextInput(label="Send only changes (yes/no)", default="yes" if self.guild_config.get("api_delta") else "no", max_length=3, required=False)
         self.add_item(self.api_url)
         self.add_item(self.api_token)
+        self.add_item(self.api_extra)
+        self.add_item(self.api_gzip)
+        self.add_item(self.api_delta)
 
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        self.cog.config["api_post_url"] = self.api_url.value.strip() or None
-        self.cog.config["api_secret_token"] = self.api_token.value.strip() or None
+        try:
+            extra = parse_destinations(self.api_extra.value)
+        except ValueError as e:
+            await interaction.followup.send(embed=create_response_embed("❌ Invalid Destinations", str(e), color=discord.Color.red()), ephemeral=True)
+            return
+        self.guild_config["api_post_url"] = self.api_url.value.strip() or None
+        self.guild_config["api_secret_token"] = self.api_token.value.strip() or None
+        self.guild_config["api_destinations"] = extra
+        self.guild_config["api_gzip"] = self.api_gzip.value.strip().lower() in ("yes", "y", "true", "on", "1")
+        self.guild_config["api_delta"] = self.api_delta.value.strip().lower() in ("yes", "y", "true", "on", "1")
         self.cog.save_config()
-        await interaction.followup.send(embed=create_response_embed("✅ API Settings Updated", "The API endpoint and token have been saved."), ephemeral=True)
+        await interaction.followup.send(embed=create_response_embed("✅ API Settings Updated", "The API endpoints and token have been saved."), ephemeral=True)
 
 class BotModal(discord.ui.Modal):
-    def __init__(self, cog: "StatusCog", action: str):
+    def __init__(self, cog: "StatusCog", action: str, guild_id: int):
         super().__init__(title=f"{action.title()} Bot")
         self.cog = cog
+        self.guild_id = guild_id
+        self.guild_config = cog.guild_config(guild_id)
         self.action = action
         self.bot_id = discord.ui.TextInput(label="Bot's User ID", placeholder="e.g., 123456789012345678", min_length=17, max_length=20)
         self.add_item(self.bot_id)
         if self.action == "add":
             self.bot_label = discord.ui.TextInput(label="Display Name", placeholder="e.g., Cortex-Bot", style=discord.TextStyle.short)
             self.add_item(self.bot_label)
+            self.interval = discord.ui.TextInput(label="Check Interval in Minutes (optional)", placeholder=f"Default: {self.guild_config.get('refresh_interval', 5)}", required=False, max_length=4)
+            self.add_item(self.interval)
 
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
@@ -71,16 +1772,17 @@ class BotModal(discord.ui.Modal):
             bot_id = int(self.bot_id.value.strip())
             if self.action == "add":
                 label = self.bot_label.value.strip()
-                if not any(b['id'] == bot_id for b in self.cog.config["bots"]):
-                    self.cog.config["bots"].append({"id": bot_id, "label": label})
+                interval = parse_interval_minutes(self.interval.value)
+                if bot_id not in self.cog.bot_index(self.guild_id):
+                    self.guild_config["bots"].append({"id": bot_id, "label": label, **({"interval": interval} if interval else {})})
                     self.cog.save_config()
                     embed = create_response_embed("✅ Bot Added", f"Bot **{label}** (`{bot_id}`) will now be monitored.")
                 else:
                     embed = create_response_embed("⚠️ Already Exists", f"Bot with ID `{bot_id}` is already being monitored.", color=discord.Color.orange())
             elif self.action == "remove":
-                bot_to_remove = next((b for b in self.cog.config["bots"] if b['id'] == bot_id), None)
+                bot_to_remove = self.cog.bot_index(self.guild_id).get(bot_id)
                 if bot_to_remove:
-                    self.cog.config["bots"].remove(bot_to_remove)
+                    self.guild_config["bots"].remove(bot_to_remove)
                     self.cog.save_config()
                     embed = create_response_embed("🗑️ Bot Removed", f"Bot **{bot_to_remove['label']}** (`{bot_id}`) has been removed.")
                 else:
@@ -88,18 +1790,24 @@ class BotModal(discord.ui.Modal):
         except ValueError:
             embed = create_response_embed("❌ Invalid ID", "A Bot ID must be a number.", color=discord.Color.red())
         await interaction.followup.send(embed=embed, ephemeral=True)
-        await self.cog.trigger_update()
+        await self.cog.trigger_update(interaction.guild_id, debounce=True)
 
 class WebsiteModal(discord.ui.Modal):
-    def __init__(self, cog: "StatusCog", action: str):
+    def __init__(self, cog: "StatusCog", action: str, guild_id: int):
         super().__init__(title=f"{action.title()} Website")
         self.cog = cog
+        self.guild_id = guild_id
+        self.guild_config = cog.guild_config(guild_id)
         self.action = action
         self.url = discord.ui.TextInput(label="Website URL", placeholder="e.g., https://google.com")
         self.add_item(self.url)
         if self.action == "add":
             self.label = discord.ui.TextInput(label="Display Name", placeholder="e.g., Google Search")
             self.add_item(self.label)
+            self.interval = discord.ui.TextInput(label="Check Interval in Minutes (optional)", placeholder=f"Default: {self.guild_config.get('refresh_interval', 5)}", required=False, max_length=4)
+            self.add_item(self.interval)
+            self.check_options = discord.ui.TextInput(label="Check Options (optional)", placeholder="e.g., method=HEAD expect=200,301 keyword=Welcome timeout=5 redirects=no slow=800", required=False)
+            self.add_item(self.check_options)
 
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
@@ -107,32 +1815,39 @@ class WebsiteModal(discord.ui.Modal):
         if not url.startswith(("http://", "https://")): url = "https://" + url
         if self.action == "add":
             label = self.label.value.strip() or url
-            if not any(w['url'] == url for w in self.cog.config["websites"]):
-                self.cog.config["websites"].append({"url": url, "label": label})
+            interval = parse_interval_minutes(self.interval.value)
+            try:
+                options = parse_check_options(self.check_options.value)
+            except ValueError as e:
+                await interaction.followup.send(embed=create_response_embed("❌ Invalid Check Options", str(e), color=discord.Color.red()), ephemeral=True)
+                return
+            if url not in self.cog.website_index(self.guild_id):
+                self.guild_config["websites"].append({"url": url, "label": label, **({"interval": interval} if interval else {}), **options})
                 self.cog.save_config()
                 embed = create_response_embed("✅ Website Added", f"**{label}** (`{url}`) will now be monitored.")
             else:
                 embed = create_response_embed("⚠️ Already Exists", f"Website `{url}` is already monitored.", color=discord.Color.orange())
         elif self.action == "remove":
-            website_to_remove = next((w for w in self.cog.config["websites"] if w['url'] == url), None)
+            website_to_remove = self.cog.website_index(self.guild_id).get(url)
             if website_to_remove:
-                self.cog.config["websites"].remove(website_to_remove)
+                self.guild_config["websites"].remove(website_to_remove)
                 self.cog.save_config()
                 embed = create_response_embed("🗑️ Website Removed", f"Website `{url}` has been removed.")
             else:
                 embed = create_response_embed("❌ Not Found", f"Website `{url}` is not on the monitoring list.", color=discord.Color.red())
         await interaction.followup.send(embed=embed, ephemeral=True)
-        await self.cog.trigger_update()
+        await self.cog.trigger_update(interaction.guild_id, debounce=True)
 
 class ServiceModal(discord.ui.Modal):
-    def __init__(self, cog: "StatusCog", action: str):
+    def __init__(self, cog: "StatusCog", action: str, guild_id: int):
         super().__init__(title=f"{action.title()} Service")
         self.cog = cog
+        self.guild_config = cog.guild_config(guild_id)
         self.action = action
         self.service_name = discord.ui.TextInput(label="Service Name", placeholder="e.g., Database Server")
         self.add_item(self.service_name)
         if self.action == "add":
-            self.service_status = discord.ui.TextInput(label="Initial Status", placeholder="e.g., Operational, Under Maintenance")
+            self.service_status = discord.ui.TextInput(label="Status or Probe", placeholder="e.g., Operational, or tcp://db.example.com:5432 to check it")
             self.add_item(self.service_status)
 
     async def on_submit(self, interaction: discord.Interaction):
@@ -140,29 +1855,72 @@ class ServiceModal(discord.ui.Modal):
         name = self.service_name.value.strip()
         if self.action == "add":
             status = self.service_status.value.strip() or "Operational"
-            self.cog.config["services"][name] = status
+            if "://" in status:
+                try:
+                    parse_probe_uri(status)
+                except ValueError as e:
+                    await interaction.followup.send(embed=create_response_embed("❌ Invalid Probe", f"`{status}`: {e}.", color=discord.Color.red()), ephemeral=True)
+                    return
+            self.guild_config["services"][name] = status
             self.cog.save_config()
-            embed = create_response_embed("✅ Service Added", f"Service **{name}** added with status: `{status}`.")
+            if is_probe_uri(status):
+                embed = create_response_embed("✅ Service Added", f"Service **{name}** added and will be checked with `{status}`.")
+            else:
+                embed = create_response_embed("✅ Service Added", f"Service **{name}** added with status: `{status}`.")
         elif self.action == "remove":
-            if name in self.cog.config["services"]:
-                del self.cog.config["services"][name]
+            if name in self.guild_config["services"]:
+                del self.guild_config["services"][name]
                 self.cog.save_config()
                 embed = create_response_embed("🗑️ Service Removed", f"Service **{name}** has been removed.")
             else:
                 embed = create_response_embed("❌ Not Found", f"Service **{name}** is not on the list.", color=discord.Color.red())
         await interaction.followup.send(embed=embed, ephemeral=True)
-        await self.cog.trigger_update()
+        await self.cog.trigger_update(interaction.guild_id, debounce=True)
 
 class WebsiteButtonsView(discord.ui.View):
-    def __init__(self, websites: List[Dict[str, str]]):
+    def __init__(self, cog: "StatusCog", websites: List[Dict[str, str]], browse: bool = False):
         super().__init__(timeout=None)
-        for website in websites[:25]:
-            self.add_item(discord.ui.Button(label=website.get("label", website["url"]), style=discord.ButtonStyle.link, url=website["url"]))
+        self.cog = cog
+        if not browse: self.remove_item(self.browse_pages)
+        for website in websites[:LINK_BUTTON_LIMIT - 5 if browse else LINK_BUTTON_LIMIT]:
+            self.add_item(discord.ui.Button(label=website.get("label", website["url"])[:80], style=discord.ButtonStyle.link, url=website["url"]))
+
+    @discord.ui.button(label="Browse Full List", style=discord.ButtonStyle.secondary, emoji="📖", row=4, custom_id="status_dashboard:browse")
+    async def browse_pages(self, interaction: discord.Interaction, button: discord.ui.Button):
+        pages = self.cog.render_pages(interaction.guild_id)
+        await interaction.response.send_message(embeds=pages[0], view=StatusPagesView(pages), ephemeral=True)
+
+class StatusPagesView(discord.ui.View):
+    def __init__(self, pages: List[List[discord.Embed]]):
+        super().__init__(timeout=300)
+        self.pages = pages
+        self.page = 0
+        self.sync_buttons()
+
+    def sync_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= len(self.pages) - 1
+        self.page_label.label = f"Page {self.page + 1}/{len(self.pages)}"
+
+    async def show(self, interaction: discord.Interaction, page: int):
+        self.page = max(0, min(page, len(self.pages) - 1))
+        self.sync_buttons()
+        await interaction.response.edit_message(embeds=self.pages[self.page], view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_page(self, i: discord.Interaction, b: discord.ui.Button): await self.show(i, self.page - 1)
+
+    @discord.ui.button(label="Page", style=discord.ButtonStyle.secondary, disabled=True)
+    async def page_label(self, i: discord.Interaction, b: discord.ui.Button): pass
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_page(self, i: discord.Interaction, b: discord.ui.Button): await self.show(i, self.page + 1)
 
 class DiscordServiceSelect(discord.ui.Select):
-    def __init__(self, cog: "StatusCog", all_services: List[Dict[str, Any]]):
+    def __init__(self, cog: "StatusCog", guild_id: int, all_services: List[Dict[str, Any]]):
         self.cog = cog
-        monitored = self.cog.config.get("monitored_discord_services", [])
+        self.guild_config = cog.guild_config(guild_id)
+        monitored = self.guild_config.get("monitored_discord_services", [])
         options = [
             discord.SelectOption(label=service['name'], value=service['id'], default=service['id'] in monitored)
             for service in all_services
@@ -170,17 +1928,65 @@ class DiscordServiceSelect(discord.ui.Select):
         super().__init__(placeholder="Select Discord services to monitor...", min_values=0, max_values=len(options), options=options)
 
     async def callback(self, interaction: discord.Interaction):
-        self.cog.config["monitored_discord_services"] = self.values
+        self.guild_config["monitored_discord_services"] = self.values
         self.cog.save_config()
         all_labels = {opt.value: opt.label for opt in self.options}
         selected_labels = [all_labels[v] for v in self.values]
         await interaction.response.send_message(embed=create_response_embed("✅ Services Updated", f"Now monitoring: **{', '.join(selected_labels) or 'None'}**."), ephemeral=True)
-        await self.cog.trigger_update()
+        await self.cog.trigger_update(interaction.guild_id, targets=(("discord_services",),), debounce=True)
 
 class DiscordServiceView(discord.ui.View):
-    def __init__(self, cog: "StatusCog", all_services: List[Dict[str, Any]]):
+    def __init__(self, cog: "StatusCog", guild_id: int, all_services: List[Dict[str, Any]]):
         super().__init__(timeout=180)
-        self.add_item(DiscordServiceSelect(cog, all_services))
+        self.add_item(DiscordServiceSelect(cog, guild_id, all_services))
+
+class DashboardRemoveView(discord.ui.View):
+    def __init__(self, cog: "StatusCog", guild_id: int, dashboards: List[Dict[str, int]]):
+        super().__init__(timeout=180)
+        self.cog = cog
+        self.guild_id = guild_id
+        guild = cog.bot.get_guild(guild_id)
+        options = []
+        for dashboard in dashboards[:25]:
+            channel = guild.get_channel_or_thread(dashboard["channel_id"]) if guild else None
+            options.append(discord.SelectOption(label=f"#{channel.name}" if channel else f"Channel {dashboard['channel_id']}", value=str(dashboard["message_id"])))
+        self.select = discord.ui.Select(placeholder="Select a status embed...", options=options)
+        self.select.callback = self.remove
+        self.add_item(self.select)
+
+    async def remove(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        message_id = int(self.select.values[0])
+        dashboard = next((d for d in self.cog.guild_config(self.guild_id)["dashboards"] if d["message_id"] == message_id), None)
+        if dashboard:
+            await self.cog.delete_dashboard(self.guild_id, dashboard)
+            await interaction.followup.send(embed=create_response_embed("🗑️ Status Embed Removed", f"The status embed in <#{dashboard['channel_id']}> has been deleted."), ephemeral=True)
+        else:
+            await interaction.followup.send(embed=create_response_embed("❌ Not Found", "That status embed no longer exists.", color=discord.Color.red()), ephemeral=True)
+
+class ImportConfirmView(discord.ui.View):
+    def __init__(self, cog: "StatusCog", guild_id: int, author_id: int, batch: Dict[str, Any]):
+        super().__init__(timeout=300)
+        self.cog = cog
+        self.guild_id = guild_id
+        self.author_id = author_id
+        self.batch = batch
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="Import", style=discord.ButtonStyle.success, emoji="📥")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.edit_message(view=None)
+        added = self.cog.apply_import(self.guild_id, self.batch)
+        await interaction.followup.send(embed=create_response_embed("✅ Import Complete", f"Imported **{added}** targets. Running one refresh for the whole batch."), ephemeral=True)
+        await self.cog.trigger_update(interaction.guild_id, debounce=True)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.edit_message(embed=create_response_embed("Import Cancelled", "Nothing was changed."), view=None)
 
 class AdminPanelView(discord.ui.View):
     def __init__(self, cog: "StatusCog"):
@@ -188,26 +1994,24 @@ class AdminPanelView(discord.ui.View):
         self.cog = cog
 
     @discord.ui.button(label="Manage Bots", style=discord.ButtonStyle.secondary, emoji="🤖", custom_id="admin_panel:manage_bots")
-    async def manage_bots(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(BotModal(self.cog, "add"))
+    async def manage_bots(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(BotModal(self.cog, "add", i.guild_id))
 
     @discord.ui.button(label="Manage Websites", style=discord.ButtonStyle.secondary, emoji="🌐", custom_id="admin_panel:manage_websites")
-    async def manage_websites(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(WebsiteModal(self.cog, "add"))
+    async def manage_websites(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(WebsiteModal(self.cog, "add", i.guild_id))
 
     @discord.ui.button(label="Manage Services", style=discord.ButtonStyle.secondary, emoji="⚙️", custom_id="admin_panel:manage_services")
-    async def manage_services(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(ServiceModal(self.cog, "add"))
+    async def manage_services(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(ServiceModal(self.cog, "add", i.guild_id))
 
     @discord.ui.button(label="Discord Services", style=discord.ButtonStyle.secondary, emoji="📢", row=1, custom_id="admin_panel:discord_services")
     async def manage_discord_services(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            async with self.cog.session.get("https://discordstatus.com/api/v2/components.json") as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    all_services = [{"id": s['id'], "name": s['name']} for s in data.get('components', []) if not s.get('group_id')]
-                    view = DiscordServiceView(self.cog, all_services)
-                    await interaction.followup.send(embed=create_response_embed("📢 Manage Discord Services", "Select which official Discord services you want to display on the status embed."), view=view, ephemeral=True)
-                else:
-                    await interaction.followup.send(embed=create_response_embed("❌ Error", f"Could not fetch Discord service list (Status: {resp.status})."), ephemeral=True)
+            feed = await self.cog.component_feed.get(self.cog.http.session("probe"))
+            all_services = [{"id": s['id'], "name": s['name']} for s in feed.top_level()]
+            view = DiscordServiceView(self.cog, interaction.guild_id, all_services)
+            await interaction.followup.send(embed=create_response_embed("📢 Manage Discord Services", "Select which official Discord services you want to display on the status embed."), view=view, ephemeral=True)
+        except ComponentFeedError as e:
+            await interaction.followup.send(embed=create_response_embed("❌ Error", f"Could not fetch Discord service list (Status: {e.status})."), ephemeral=True)
         except Exception as e:
             await interaction.followup.send(embed=create_response_embed("❌ Error", f"An unexpected error occurred: {e}"), ephemeral=True)
 
@@ -217,11 +2021,18 @@ class AdminPanelView(discord.ui.View):
         b_b = discord.ui.Button(label="Remove Bot", style=discord.ButtonStyle.danger, emoji="🤖")
         w_b = discord.ui.Button(label="Remove Website", style=discord.ButtonStyle.danger, emoji="🌐")
         s_b = discord.ui.Button(label="Remove Service", style=discord.ButtonStyle.danger, emoji="⚙️")
-        async def b_cb(i: discord.Interaction): await i.response.send_modal(BotModal(self.cog, "remove"))
-        async def w_cb(i: discord.Interaction): await i.response.send_modal(WebsiteModal(self.cog, "remove"))
-        async def s_cb(i: discord.Interaction): await i.response.send_modal(ServiceModal(self.cog, "remove"))
-        b_b.callback, w_b.callback, s_b.callback = b_cb, w_cb, s_cb
-        view.add_item(b_b); view.add_item(w_b); view.add_item(s_b)
+        d_b = discord.ui.Button(label="Remove Status Embed", style=discord.ButtonStyle.danger, emoji="📌")
+        async def b_cb(i: discord.Interaction): await i.response.send_modal(BotModal(self.cog, "remove", i.guild_id))
+        async def w_cb(i: discord.Interaction): await i.response.send_modal(WebsiteModal(self.cog, "remove", i.guild_id))
+        async def s_cb(i: discord.Interaction): await i.response.send_modal(ServiceModal(self.cog, "remove", i.guild_id))
+        async def d_cb(i: discord.Interaction):
+            dashboards = self.cog.guild_config(i.guild_id)["dashboards"]
+            if not dashboards:
+                await i.response.send_message(embed=create_response_embed("❌ Not Found", "This server has no status embeds.", color=discord.Color.red()), ephemeral=True)
+                return
+            await i.response.send_message(embed=create_response_embed("📌 Remove a Status Embed", "Select the status embed to delete."), view=DashboardRemoveView(self.cog, i.guild_id, dashboards), ephemeral=True)
+        b_b.callback, w_b.callback, s_b.callback, d_b.callback = b_cb, w_cb, s_cb, d_cb
+        view.add_item(b_b); view.add_item(w_b); view.add_item(s_b); view.add_item(d_b)
         await interaction.response.send_message(embed=create_response_embed("🗑️ Remove an Item", "Select the type of item you want to remove."), view=view, ephemeral=True)
 
     @discord.ui.button(label="Post/Move Status", style=discord.ButtonStyle.primary, emoji="📌", row=2, custom_id="admin_panel:post_status")
@@ -231,7 +2042,7 @@ class AdminPanelView(discord.ui.View):
 
     @discord.ui.button(label="API Settings", style=discord.ButtonStyle.secondary, emoji="🔗", row=2, custom_id="admin_panel:api_settings")
     async def api_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.send_modal(ApiSettingsModal(self.cog))
+        await interaction.response.send_modal(ApiSettingsModal(self.cog, interaction.guild_id))
 
     @discord.ui.button(label="Set Interval", style=discord.ButtonStyle.secondary, emoji="⏱️", row=3, custom_id="admin_panel:set_interval")
     async def set_interval(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -241,36 +2052,87 @@ class AdminPanelView(discord.ui.View):
         async def cb(i: discord.Interaction):
             await i.response.defer(ephemeral=True)
             minutes = int(sel.values[0])
-            self.cog.config["refresh_interval"] = minutes
+            self.cog.guild_config(i.guild_id)["refresh_interval"] = minutes
             self.cog.save_config()
-            self.cog.status_loop.change_interval(minutes=minutes)
-            await i.followup.send(embed=create_response_embed("⏱️ Interval Updated", f"Status will now refresh every **{minutes} minute(s)**."), ephemeral=True)
+            await i.followup.send(embed=create_response_embed("⏱️ Interval Updated", f"Targets without their own interval will now be checked every **{minutes} minute(s)**, backing off while they stay stable."), ephemeral=True)
         sel.callback = cb
         view.add_item(sel)
-        await interaction.response.send_message(embed=create_response_embed("⏱️ Set Refresh Interval", "Choose how often the status embed should update."), view=view, ephemeral=True)
+        await interaction.response.send_message(embed=create_response_embed("⏱️ Set Refresh Interval", "Choose the default check interval. Stable targets are checked less often, changed or failing targets more often."), view=view, ephemeral=True)
+
+    @discord.ui.button(label="Uptime & Incidents", style=discord.ButtonStyle.secondary, emoji="📈", row=3, custom_id="admin_panel:history")
+    async def show_history(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self.cog.history:
+            return await interaction.response.send_message(embed=create_response_embed("📈 History Disabled", "Set `history_enabled` to `true` in `status_config.json` to record uptime and incidents.", discord.Color.orange()), ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        report = await self.cog.history.call(self.cog.history_report, self.cog.history_rows(interaction.guild_id))
+        await interaction.followup.send(embed=create_response_embed("📈 Uptime & Incidents", report), ephemeral=True)
+
+    @discord.ui.button(label="API Delivery", style=discord.ButtonStyle.secondary, emoji="📤", row=3, custom_id="admin_panel:api_delivery")
+    async def show_delivery(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_message(embed=create_response_embed("📤 API Delivery", self.cog.delivery_report(interaction.guild_id)), ephemeral=True)
 
     @discord.ui.button(label="Change Title", style=discord.ButtonStyle.secondary, emoji="✏️", row=4, custom_id="admin_panel:change_title")
-    async def change_title(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(TitleModal(self.cog))
+    async def change_title(self, i: discord.Interaction, b: discord.ui.Button): await i.response.send_modal(TitleModal(self.cog, i.guild_id))
 
     @discord.ui.button(label="Refresh & POST", style=discord.ButtonStyle.success, emoji="🔄", row=4, custom_id="admin_panel:refresh")
     async def refresh_status(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        await self.cog.trigger_update()
+        await self.cog.trigger_update(interaction.guild_id, probe=True)
         await interaction.followup.send(embed=create_response_embed("🔄 Status Refreshed", "The status has been manually refreshed and posted to the API endpoint."), ephemeral=True)
 
 class StatusCog(commands.Cog, name="Status Monitor"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.config_store = JsonStore(CONFIG_FILE, indent=4)
+        self.status_store = JsonStore(STATUS_DATA_FILE)
+        self.targets = TargetIndex()
         self.config = self.load_config()
+        self.http = HttpClients(self.config)
+        self.metrics = build_metrics_registry()
+        self.metrics.collectors.append(self.collect_metrics)
+        self.metrics_runner: Optional[web.AppRunner] = None
+        self.agent_hub = AgentHub(self.result_failed, self.config["agent_replicas"], self.config["agent_quorum"], self.config["agent_timeout"], self.config["agent_sync_interval"])
+        self.agent_runner: Optional[web.AppRunner] = None
+        self.rate_limit_log = RateLimitLogHandler(self.metrics)
+        logging.getLogger("discord.http").addHandler(self.rate_limit_log)
         self.waiting_for_channel = {}
-        self.status_data = {}
+        self.status_data: Dict[int, Dict[str, Any]] = {}
+        self.results: Dict[TargetKey, Dict[str, Any]] = {}
+        self.force_refresh = True
+        self.dashboard_messages: Dict[DashboardKey, discord.Message] = {}
+        self.render_signatures: Dict[DashboardKey, str] = {}
+        self.fragment_cache: Dict[Tuple[int, str, str], Tuple[Tuple[Any, ...], str]] = {}
+        self.data_signatures: Dict[int, str] = {}
+        self.write_stats = {kind: {"performed": 0, "skipped": 0} for kind in ("edit", "post", "save")}
+        self.probe_engine = ProbeEngine(self.config["probe_concurrency"], self.config["probe_per_host"], self.config["probe_deadline"])
+        self.probe_plugins = ProbePlugins(self.config["probe_types"])
+        self.component_feed = ComponentFeedCache(ttl=self.config["discord_feed_ttl"], stale_limit=self.config["discord_feed_stale_limit"])
+        self.presence = PresenceTracker()
+        self.presence_push_tasks: Dict[int, asyncio.Task] = {}
+        self.publish_lock = asyncio.Lock()
+        self.scheduler = TargetScheduler(self.config["adaptive_min_interval"], self.config["adaptive_max_factor"])
+        self.edit_pacer = EditPacer(self.config["edit_min_spacing"], self.config["edit_channel_gap"], SCHEDULER_TICK_SECONDS)
+        self.updates = UpdateCoordinator(self.run_update, self.config["update_debounce"])
+        self.delta_stream = os.urandom(8).hex()
+        self.delta_state: Dict[DeliveryKey, Dict[str, Any]] = {}
+        self.delivery = DeliveryQueue(self.deliver_payload, DELIVERY_SPOOL_FILE, self.config["delivery_queue_limit"], self.config["delivery_concurrency"], self.config["delivery_retry_base"], self.config["delivery_retry_max"])
+        self.history = HistoryStore(HISTORY_FILE, self.config["history_raw_retention_days"], self.config["history_minute_retention_days"], self.config["history_hour_retention_days"]) if self.config["history_enabled"] else None
+        self.history_summary: Dict[str, Dict[str, Any]] = {}
+        self.history_summary_at = float("-inf")
+        self.incidents = IncidentTracker(self.config["incident_fail_threshold"], self.config["incident_window"], self.config["flap_window"], self.config["flap_threshold"])
+        self.reprobe_tasks: Dict[TargetKey, asyncio.Task] = {}
         self.bot.loop.create_task(self._init_async())
 
     async def _init_async(self):
-        self.session = aiohttp.ClientSession()
+        self.http.session("probe")
+        self.http.session("delivery")
         await self.register_persistent_views()
-        self.status_loop.change_interval(minutes=self.config.get("refresh_interval", 5))
+        await self.adopt_legacy_config()
+        await self.start_metrics_server()
+        await self.start_agent_hub()
+        self.edit_pacer.start()
+        self.delivery.start()
+        self.updates.start()
         if not self.status_loop.is_running():
             self.status_loop.start()
 
@@ -278,9 +2140,35 @@ class StatusCog(commands.Cog, name="Status Monitor"):
         await self.bot.wait_until_ready()
         if not hasattr(self.bot, 'persistent_views_added_status'):
             self.bot.add_view(AdminPanelView(self))
+            self.bot.add_view(WebsiteButtonsView(self, [], browse=True))
             self.bot.persistent_views_added_status = True
             print("Status Monitor Admin Panel View successfully registered.")
 
+    async def adopt_legacy_config(self):
+        legacy = self.config.get("unassigned_legacy")
+        if not legacy or not legacy.get("channel_id"): return
+        try:
+            channel = self.bot.get_channel(legacy["channel_id"]) or await self.bot.fetch_channel(legacy["channel_id"])
+        except discord.HTTPException:
+            print("Could not resolve the guild of the legacy status channel. Run status-setup in that server to adopt it.")
+            return
+        self.adopt_legacy(channel.guild.id)
+
+    def adopt_legacy(self, guild_id: int):
+        legacy = self.config.pop("unassigned_legacy", None)
+        if legacy is None: return
+        self.config["guilds"][str(guild_id)] = migrate_guild_config(legacy)
+        self.save_config()
+
+    def guild_config(self, guild_id: int) -> Dict[str, Any]:
+        guilds = self.config["guilds"]
+        if str(guild_id) not in guilds:
+            guilds[str(guild_id)] = copy.deepcopy(GUILD_DEFAULTS)
+        return guilds[str(guild_id)]
+
+    def guild_configs(self) -> List[Tuple[int, Dict[str, Any]]]:
+        return [(int(guild_id), section) for guild_id, section in self.config["guilds"].items()]
+
     @commands.Cog.listener()
     async def on_message(self, message):
         if message.author.bot: return
@@ -299,13 +2187,16 @@ class StatusCog(commands.Cog, name="Status Monitor"):
                 if not permissions.send_messages or not permissions.embed_links:
                     await message.reply(embed=create_response_embed("❌ Permissions Missing", f"I need **Send Messages** and **Embed Links** permissions in {selected_channel.mention}.", color=discord.Color.red()))
                     return
-                await self.delete_old_status_message()
+                section = self.guild_config(message.guild.id)
+                for dashboard in [d for d in section["dashboards"] if d["channel_id"] == selected_channel.id]:
+                    await self.delete_dashboard(message.guild.id, dashboard)
                 init_embed = discord.Embed(title="Service Status", description=f"{STATUS_EMOJI['Loading']} Initializing...", color=STATUS_COLOR["Maintenance"])
-                msg = await selected_channel.send(embed=init_embed)
-                self.config.update({"channel_id": msg.channel.id, "message_id": msg.id})
+                msg = await self.discord_call("channel_send", selected_channel.send(embed=init_embed))
+                section["dashboards"].append({"channel_id": msg.channel.id, "message_id": msg.id})
+                self.dashboard_messages[(msg.channel.id, msg.id)] = msg
                 self.save_config()
                 await message.reply(embed=create_response_embed("✅ Success", f"Status embed posted to {selected_channel.mention}."))
-                await self.trigger_update()
+                await self.trigger_update(message.guild.id)
             except discord.Forbidden:
                 await message.reply(embed=create_response_embed("❌ Permissions Error", "I was blocked. Please check my role/channel permissions.", color=discord.Color.red()))
             except Exception as e:
@@ -314,175 +2205,656 @@ class StatusCog(commands.Cog, name="Status Monitor"):
 
     def cog_unload(self):
         self.status_loop.cancel()
-        if self.session: asyncio.create_task(self.session.close())
+        self.updates.stop()
+        self.edit_pacer.stop()
+        self.delivery.stop()
+        for task in self.presence_push_tasks.values(): task.cancel()
+        for task in self.reprobe_tasks.values(): task.cancel()
+        if self.history: self.history.close()
+        self.config_store.close()
+        self.status_store.close()
+        logging.getLogger("discord.http").removeHandler(self.rate_limit_log)
+        if self.metrics_runner: asyncio.create_task(self.metrics_runner.cleanup())
+        if self.agent_runner: asyncio.create_task(self.agent_runner.cleanup())
+        asyncio.create_task(self.http.close())
+
+    async def start_http_server(self, name: str, app: web.Application, host: str, port: int, path: str) -> Optional[web.AppRunner]:
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+            print(f"{name} listening on http://{host}:{port}{path}")
+            return runner
+        except OSError as e:
+            print(f"Could not start the {name.lower()}: {e}")
+            await runner.cleanup()
+            return None
+
+    async def start_metrics_server(self):
+        if not self.config["metrics_enabled"]: return
+        app = web.Application()
+        app.router.add_get("/metrics", self.serve_metrics)
+        self.metrics_runner = await self.start_http_server("Metrics endpoint", app, self.config["metrics_host"], self.config["metrics_port"], "/metrics")
+
+    async def start_agent_hub(self):
+        if not self.config["agent_hub_enabled"]: return
+        if not self.config["agent_token"]:
+            print("The probe agent hub needs an agent_token in the config; not starting it.")
+            return
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/agents/sync", self.serve_agent_sync)
+        self.agent_runner = await self.start_http_server("Probe agent hub", app, self.config["agent_hub_host"], self.config["agent_hub_port"], "/agents/sync")
+
+    async def serve_agent_sync(self, request: web.Request) -> web.Response:
+        if not hmac.compare_digest(request.headers.get("Authorization", "").encode(), f"Bearer {self.config['agent_token']}".encode()):
+            return web.json_response({"error": "unauthorized"}, status=401)
+        try:
+            body = await request.json()
+            agent, results = str(body["agent"])[:64], body.get("results") or []
+            if not agent or not isinstance(results, list): raise ValueError("agent and results are required")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return web.json_response({"error": str(e) or "invalid request"}, status=400)
+        return web.json_response(self.agent_hub.sync(agent, results))
+
+    def agent_targets(self) -> Dict[str, Dict[str, Any]]:
+        intervals = self.scheduler_targets()
+        targets: Dict[str, Dict[str, Any]] = {}
+        for _, section in self.guild_configs():
+            for site in section["websites"]:
+                key = ("website", site['url'])
+                targets[self.history_target(key)] = {"id": self.history_target(key), "kind": "website", "site": site, "interval": intervals[key]}
+            for uri in filter(is_probe_uri, section["services"].values()):
+                key = ("service", uri)
+                targets[self.history_target(key)] = {"id": self.history_target(key), "kind": "service", "uri": uri, "interval": intervals[key]}
+        return targets
+
+    async def agent_or_local(self, key: TargetKey, local: Callable[[], Awaitable[Dict[str, Any]]], recheck: bool = False) -> Dict[str, Any]:
+        target = self.history_target(key)
+        if self.agent_runner and recheck: await self.agent_hub.recheck(target, self.config["agent_recheck_timeout"])
+        result = self.agent_hub.aggregate(target) if self.agent_runner else None
+        self.metrics.inc("status_monitor_agent_aggregations_total", source="agents" if result else "local")
+        return result if result is not None else await local()
+
+    async def serve_metrics(self, request: web.Request) -> web.Response:
+        openmetrics = "application/openmetrics-text" in request.headers.get("Accept", "")
+        content_type = "application/openmetrics-text; version=1.0.0; charset=utf-8" if openmetrics else "text/plain; version=0.0.4; charset=utf-8"
+        return web.Response(body=self.metrics.render(openmetrics).encode("utf-8"), headers={"Content-Type": content_type})
+
+    def collect_metrics(self):
+        metrics = self.metrics
+        for kind, counts in self.write_stats.items():
+            for result, value in counts.items():
+                metrics.set("status_monitor_writes_total", value, kind=kind, result=result)
+        delivery = self.delivery.stats()
+        for result in ("delivered", "failed", "retries", "superseded", "dropped"):
+            metrics.set("status_monitor_api_deliveries_total", delivery[result], result=result)
+        metrics.set("status_monitor_api_queue_depth", delivery["depth"])
+        metrics.set("status_monitor_api_in_flight", delivery["in_flight"])
+        for pool, stats in self.http.stats().items():
+            for state in ("active", "queued"):
+                metrics.set("status_monitor_http_pool_connections", stats[state], pool=pool, state=state)
+            for how in ("created", "reused"):
+                metrics.set("status_monitor_http_pool_connects_total", stats[how], pool=pool, connection=how)
+            metrics.set("status_monitor_http_pool_limit", stats["limit"], pool=pool)
+            metrics.set("status_monitor_http_pool_queue_waits_total", stats["queue_waits"], pool=pool)
+            metrics.set("status_monitor_http_pool_queue_wait_seconds_total", stats["queue_wait_ms_total"] / 1000, pool=pool)
+        for result, value in self.component_feed.stats.items():
+            metrics.set("status_monitor_discord_feed_requests_total", value, result=result)
+        for store, json_store in (("config", self.config_store), ("status", self.status_store)):
+            for result, value in json_store.stats.items():
+                metrics.set("status_monitor_store_writes_total", value, store=store, result=result)
+        metrics.set("status_monitor_edit_pacer_wait_seconds_total", self.edit_pacer.waited)
+        metrics.set("status_monitor_edit_queue_depth", len(self.edit_pacer.pending))
+        metrics.set("status_monitor_targets", len(self.scheduler.entries))
+        metrics.set("status_monitor_update_requests_total", self.updates.stats["requested"], result="requested")
+        metrics.set("status_monitor_update_requests_total", self.updates.stats["folded"], result="folded")
+        metrics.set("status_monitor_update_cycles_total", self.updates.stats["cycles"])
+        if self.agent_runner:
+            metrics.set("status_monitor_agents_live", len(self.agent_hub.ring.nodes))
+            for agent, count in self.agent_hub.load().items():
+                metrics.set("status_monitor_agent_targets", count, agent=agent)
+            metrics.retain("status_monitor_agent_targets", "agent", set(self.agent_hub.ring.nodes))
+            for kind in ("syncs", "reports", "rebalances"):
+                metrics.set(f"status_monitor_agent_{kind}_total", self.agent_hub.stats[kind])
+        targets = {self.history_target(key) for key in self.scheduler.entries}
+        metrics.retain("status_monitor_probe_duration_seconds", "target", targets)
+        metrics.retain("status_monitor_probe_phase_seconds", "target", targets)
+
+    async def discord_call(self, route: str, call: Awaitable[Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return await call
+        except discord.HTTPException as e:
+            self.metrics.inc("status_monitor_discord_api_errors_total", route=route, status=e.status)
+            raise
+        finally:
+            self.metrics.inc("status_monitor_discord_api_calls_total", route=route)
+            self.metrics.observe("status_monitor_discord_api_duration_seconds", time.perf_counter() - started, route=route)
+
+    async def timed_probe(self, key: TargetKey, factory: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        result = await factory()
+        self.metrics.observe("status_monitor_probe_duration_seconds", time.perf_counter() - started, kind=key[0], target=self.history_target(key))
+        return result
 
     def load_config(self) -> Dict[str, Any]:
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        default_config = {
-            "channel_id": None, "message_id": None, "bots": [], "websites": [], "services": {},
-            "refresh_interval": 5, "embed_title": "Service Status",
-            "monitored_discord_services": [],
-            "api_post_url": None, "api_secret_token": None
-        }
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f: config = json.load(f)
+        default_config = copy.deepcopy(CONFIG_DEFAULTS)
+        config = self.config_store.load()
+        if config is None:
+            config = default_config
+        else:
+            if "guilds" not in config:
+                legacy = {key: config.pop(key) for key in LEGACY_GUILD_KEYS if key in config}
+                guild_id = legacy.pop("guild_id", None)
+                if guild_id: config["guilds"] = {str(guild_id): migrate_guild_config(legacy)}
+                elif any(legacy.get(key) for key in ("channel_id", "bots", "websites", "services")): config["unassigned_legacy"] = legacy
             for key, value in default_config.items():
                 config.setdefault(key, value)
-        except (FileNotFoundError, json.JSONDecodeError):
-            config = default_config
-        self.save_config(config)
+            for section in config["guilds"].values():
+                for key, value in GUILD_DEFAULTS.items():
+                    section.setdefault(key, copy.deepcopy(value))
+        self.config_store.save(lambda: config)
         return config
 
-    def save_config(self, config_data: Optional[Dict[str, Any]] = None):
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(config_data or self.config, f, indent=4)
+    def save_config(self):
+        self.targets.invalidate()
+        self.config_store.save(lambda: self.config)
 
     def save_status_data(self):
-        with open(STATUS_DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.status_data, f, indent=4)
+        self.status_store.save(lambda: {str(guild_id): data for guild_id, data in self.status_data.items()})
+
+    def bot_index(self, guild_id: int) -> Dict[int, Dict[str, Any]]:
+        return self.targets.lookup(guild_id, self.guild_config(guild_id))[0]
+
+    def website_index(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
+        return self.targets.lookup(guild_id, self.guild_config(guild_id))[1]
+
+    async def get_dashboard_message(self, dashboard: Dict[str, int]) -> discord.Message:
+        key = dashboard_key(dashboard)
+        if key in self.dashboard_messages: return self.dashboard_messages[key]
+        channel = self.bot.get_channel(dashboard["channel_id"]) or await self.discord_call("channel_fetch", self.bot.fetch_channel(dashboard["channel_id"]))
+        self.dashboard_messages[key] = await self.discord_call("message_fetch", channel.fetch_message(dashboard["message_id"]))
+        return self.dashboard_messages[key]
+
+    def forget_dashboard(self, guild_id: int, dashboard: Dict[str, int]):
+        key = dashboard_key(dashboard)
+        self.dashboard_messages.pop(key, None)
+        self.render_signatures.pop(key, None)
+        self.edit_pacer.discard(key)
+        dashboards = self.guild_config(guild_id)["dashboards"]
+        if dashboard in dashboards:
+            dashboards.remove(dashboard)
+            self.save_config()
 
-    async def delete_old_status_message(self):
-        if self.config.get("channel_id") and self.config.get("message_id"):
-            try:
-                channel = await self.bot.fetch_channel(self.config["channel_id"])
-                message = await channel.fetch_message(self.config["message_id"])
-                await message.delete()
-            except (discord.NotFound, discord.Forbidden): pass
-            finally: self.config.update({"channel_id": None, "message_id": None}); self.save_config()
+    async def delete_dashboard(self, guild_id: int, dashboard: Dict[str, int]):
+        try:
+            message = await self.get_dashboard_message(dashboard)
+            await self.discord_call("message_delete", message.delete())
+        except (discord.NotFound, discord.Forbidden): pass
+        finally: self.forget_dashboard(guild_id, dashboard)
 
-    async def fetch_website_status(self, url: str) -> (str, bool):
+    async def fetch_website_status(self, site: Dict[str, Any]) -> Dict[str, Any]:
+        return await check_website(self.http, site, self.config)
+
+    async def fetch_bot_status(self, guild: discord.Guild, bot_id: int) -> Dict[str, Any]:
+        key = (guild.id, bot_id)
         try:
-            async with self.session.get(url, timeout=10) as response:
-                return ("Online", True) if 200 <= response.status < 300 else (f"Status {response.status}", False)
-        except (asyncio.TimeoutError, aiohttp.ClientError): return "Offline", False
+            if member := guild.get_member(bot_id):
+                self.presence.observe(member)
+            elif self.presence.reconcile_due(key, self.config["presence_reconcile_interval"]):
+                self.presence.observe(await self.discord_call("member_fetch", guild.fetch_member(bot_id)))
+                self.presence.mark_reconciled(key)
+            return self.presence.bot_data(key)
+        except discord.NotFound:
+            self.presence.set(key, "Not Found in Server", "not_found")
+            self.presence.mark_reconciled(key)
+            return self.presence.bot_data(key)
+        except discord.Forbidden: return {"status": "No Permissions"}
+        except Exception: return {"status": "Error Fetching"}
+
+    def monitored_bot(self, member: discord.Member) -> bool:
+        return str(member.guild.id) in self.config["guilds"] and member.id in self.bot_index(member.guild.id)
+
+    def presence_changed(self, member: discord.Member):
+        self.results[("bot", member.guild.id, member.id)] = self.presence.bot_data((member.guild.id, member.id))
+        task = self.presence_push_tasks.get(member.guild.id)
+        if task and not task.done(): return
+        self.presence_push_tasks[member.guild.id] = asyncio.create_task(self.push_presence_changes(member.guild.id))
+
+    async def push_presence_changes(self, guild_id: int):
+        await asyncio.sleep(self.config["presence_debounce"])
+        await self.publish_guild(guild_id, self.compose_guild_status(guild_id))
+
+    @commands.Cog.listener()
+    async def on_presence_update(self, before: discord.Member, after: discord.Member):
+        if self.monitored_bot(after) and self.presence.observe(after):
+            self.presence_changed(after)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if self.monitored_bot(member) and self.presence.observe(member):
+            self.presence_changed(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if self.monitored_bot(member) and self.presence.set((member.guild.id, member.id), "Not Found in Server", "not_found"):
+            self.presence_changed(member)
 
-    async def trigger_update(self):
+    async def fetch_discord_feed(self, monitored_ids: List[str]) -> Dict[str, Any]:
+        try:
+            self.component_feed.ttl, self.component_feed.stale_limit = self.config["discord_feed_ttl"], self.config["discord_feed_stale_limit"]
+            all_components = (await self.component_feed.get(self.http.session("probe"))).components
+            components = {}
+            for service_id in monitored_ids:
+                if comp := all_components.get(service_id):
+                    status_map = {"operational": "Operational", "degraded_performance": "Partial Outage", "partial_outage": "Partial Outage", "major_outage": "Offline", "under_maintenance": "Maintenance"}
+                    status_text = status_map.get(comp['status'], comp['status'].replace("_", " ").title())
+                    components[service_id] = {"name": comp['name'], "status": status_text, "raw_status": comp['status']}
+            return {"status": "ok", "components": components}
+        except ComponentFeedError as e:
+            return {"status": f"API Error ({e.status})", "raw_status": "api_error", "components": {}}
+        except Exception:
+            return {"status": "Failed to Fetch", "raw_status": "fetch_failed", "components": {}}
+
+    async def trigger_update(self, guild_id: int, probe: bool = False, targets: Tuple[TargetKey, ...] = (), debounce: bool = False):
         if not self.status_loop.is_running():
             self.status_loop.start()
-        await self.status_loop.coro(self)
-
-    async def fetch_all_statuses(self) -> Dict[str, Any]:
-        guild = self.bot.get_guild(self.config.get("guild_id"))
-        if not guild and self.config.get("channel_id"):
-             try:
-                channel = await self.bot.fetch_channel(self.config["channel_id"])
-                guild = channel.guild
-                self.config["guild_id"] = guild.id
-                self.save_config()
-             except (discord.NotFound, discord.Forbidden):
-                 print("Could not find guild to fetch member statuses.")
-                 return {}
+        self.updates.start()
+        self.updates.debounce = self.config["update_debounce"]
+        await self.updates.request(probe=probe, force=(guild_id,), targets=targets, debounce=debounce)
+
+    async def run_update(self, probe: set, force: set, targets: List[TargetKey]):
+        started = time.perf_counter()
+        if probe: self.scheduler.requeue([key for guild_id, section in self.guild_configs() if guild_id in probe for key, _ in self.section_targets(guild_id, section)])
+        self.scheduler.requeue(targets)
+        await self.update_status_embed(force)
+        duration = time.perf_counter() - started
+        self.metrics.observe("status_monitor_loop_duration_seconds", duration)
+        if duration > SCHEDULER_TICK_SECONDS:
+            self.metrics.inc("status_monitor_loop_overruns_total")
+
+    def section_targets(self, guild_id: int, section: Dict[str, Any]) -> List[Tuple[TargetKey, float]]:
+        default = section["refresh_interval"] * 60
+        targets = [(("bot", guild_id, b['id']), b.get("interval", 0) * 60 or default) for b in section["bots"]]
+        targets += [(("website", w['url']), w.get("interval", 0) * 60 or default) for w in section["websites"]]
+        targets += [(("service", uri), default) for uri in filter(is_probe_uri, section["services"].values())]
+        if section["monitored_discord_services"]: targets.append((("discord_services",), default))
+        return targets
+
+    def scheduler_targets(self) -> Dict[TargetKey, float]:
+        targets: Dict[TargetKey, float] = {}
+        for guild_id, section in self.guild_configs():
+            for key, seconds in self.section_targets(guild_id, section):
+                targets[key] = min(targets.get(key, seconds), seconds)
+        return targets
+
+    @timed_span("fetch_all_statuses")
+    async def fetch_all_statuses(self, due: Optional[List[TargetKey]] = None) -> Dict[int, Dict[str, Any]]:
+        guild_configs = self.guild_configs()
+        keys: List[TargetKey] = []
+        jobs: List[ProbeJob] = []
+        seen, due_keys = set(), set(due or ())
+        def add(key: TargetKey, host: Optional[str], factory: Callable[[], Awaitable[Any]], fallback: Any):
+            if key in seen: return
+            seen.add(key)
+            if due is None or key in due_keys or key not in self.results:
+                keys.append(key); jobs.append((host, lambda: self.timed_probe(key, factory), fallback))
+
+        bot_keys = []
+        for guild_id, section in guild_configs:
+            guild = self.bot.get_guild(guild_id)
+            for bot_info in section["bots"] if guild else []:
+                bot_keys.append((guild_id, bot_info['id']))
+                add(("bot", guild_id, bot_info['id']), None, lambda g=guild, b=bot_info['id']: self.fetch_bot_status(g, b), {"status": "Timed Out"})
+            for site in section["websites"]:
+                add(("website", site['url']), urlparse(site['url']).hostname, lambda w=site: self.agent_or_local(("website", w['url']), lambda: self.fetch_website_status(w)), {"status": "Timed Out", "online": False})
+            for uri in filter(is_probe_uri, section["services"].values()):
+                add(("service", uri), urlparse(uri).hostname, lambda u=uri: self.agent_or_local(("service", u), lambda: self.probe_plugins.run(u)), {"status": "Timed Out", "online": False})
+        self.presence.prune(bot_keys)
+
+        monitored_ids = sorted({service_id for _, section in guild_configs for service_id in section["monitored_discord_services"]})
+        if monitored_ids:
+            fallback = {"status": "Timed Out", "raw_status": "fetch_failed", "components": {}}
+            add(("discord_services",), urlparse(DISCORD_COMPONENTS_URL).hostname, lambda: self.fetch_discord_feed(monitored_ids), fallback)
+
+        self.probe_engine.configure(self.config["probe_concurrency"], self.config["probe_per_host"], self.config["probe_deadline"])
+        self.probe_plugins.configure(self.config["probe_types"])
+        if self.agent_runner:
+            self.agent_hub.configure(self.config["agent_replicas"], self.config["agent_quorum"], self.config["agent_timeout"], self.config["agent_sync_interval"])
+            self.agent_hub.set_targets(self.agent_targets())
+        probed = list(zip(keys, await self.probe_engine.run(jobs)))
+        self.incidents.configure(self.config["incident_fail_threshold"], self.config["incident_window"], self.config["flap_window"], self.config["flap_threshold"])
+        for key, result in probed:
+            await self.apply_result(key, result)
+        for key in [k for k in self.results if k not in self.scheduler.entries]:
+            del self.results[key]
+        self.incidents.prune(self.scheduler.entries)
+        await self.record_history(probed)
+
+        return {guild_id: self.compose_guild_status(guild_id) for guild_id, _ in guild_configs}
+
+    async def apply_result(self, key: TargetKey, result: Dict[str, Any]) -> bool:
+        failed = self.result_failed(result)
+        self.metrics.inc("status_monitor_probe_results_total", kind=key[0], outcome="timeout" if result.get("status") == "Timed Out" else ("failed" if failed else "ok"))
+        for phase, ms in (result.get("timings") or {}).items():
+            if ms is not None: self.metrics.observe("status_monitor_probe_phase_seconds", ms / 1000, target=self.history_target(key), phase=phase[:-3])
+        published = result
+        if key[0] == "website":
+            published, events = self.incidents.observe(key, result, failed)
+            for kind, at in events:
+                await self.record_incident(key, kind, at, result)
+            if self.incidents.needs_reprobe(key) and key not in self.reprobe_tasks:
+                self.reprobe_tasks[key] = asyncio.create_task(self.reprobe(key))
+        previous = self.results.get(key)
+        self.results[key] = published
+        changed = self.result_signature(published) != self.result_signature(previous)
+        self.scheduler.record(key, changed=changed, failed=failed)
+        return changed
+
+    async def record_incident(self, key: TargetKey, kind: str, at: float, result: Dict[str, Any]):
+        target = self.history_target(key)
+        print({
+            "down": f"Incident opened for {target}: {result.get('status')}", "up": f"Incident resolved for {target}",
+            "flap_start": f"{target} is flapping, holding its status until it settles", "flap_end": f"{target} stopped flapping"
+        }[kind])
+        if not self.history: return
+        try:
+            if kind in ("down", "flap_start"):
+                await self.history.call(self.history.open_incident, target, "down" if kind == "down" else "flapping", at, result.get("status") if kind == "down" else None)
+            else:
+                await self.history.call(self.history.close_incident, target, "down" if kind == "up" else "flapping", at)
+        except sqlite3.Error as e:
+            print(f"Failed to record incident for {target}: {e}")
 
+    async def reprobe(self, key: TargetKey):
+        try:
+            while self.incidents.needs_reprobe(key):
+                await asyncio.sleep(self.config["incident_reprobe_delay"])
+                site = next((self.website_index(guild_id)[key[1]] for guild_id, _ in self.guild_configs() if key[1] in self.website_index(guild_id)), None)
+                if site is None: return
+                result = await self.timed_probe(key, lambda: self.agent_or_local(key, lambda: self.fetch_website_status(site), recheck=True))
+                changed = await self.apply_result(key, result)
+                await self.record_history([(key, result)])
+                for guild_id, _ in self.guild_configs() if changed else []:
+                    if key[1] in self.website_index(guild_id):
+                        await self.publish_guild(guild_id, self.compose_guild_status(guild_id))
+        finally:
+            self.reprobe_tasks.pop(key, None)
+
+    @staticmethod
+    def history_target(key: TargetKey) -> str:
+        return ":".join(str(part) for part in key)
+
+    def history_rows(self, guild_id: int) -> List[Tuple[str, str]]:
+        section = self.guild_config(guild_id)
+        rows = [(b.get("label") or str(b["id"]), self.history_target(("bot", guild_id, b["id"]))) for b in section["bots"]]
+        rows += [(w.get("label") or w["url"], self.history_target(("website", w["url"]))) for w in section["websites"]]
+        rows += [(name, self.history_target(("service", uri))) for name, uri in section["services"].items() if is_probe_uri(uri)]
+        return rows
+
+    def history_report(self, rows: List[Tuple[str, str]], incident_days: int = 7) -> str:
+        def percent(value: Optional[float]) -> str:
+            return "–" if value is None else f"{value:.2f}%"
+        lines = []
+        for label, target in rows:
+            uptime = {window: self.history.uptime(target, seconds) for window, seconds in HISTORY_REPORT_WINDOWS.items()}
+            if all(value is None for value in uptime.values()): continue
+            p95 = self.history.latency_percentiles(target, 86400, (95,))[95]
+            latency = f" · p95 {round(p95)} ms" if p95 is not None else ""
+            lines.append(f"**{label}**: " + " · ".join(f"{window} {percent(value)}" for window, value in uptime.items()) + latency)
+        labels = {target: label for label, target in rows}
+        incidents = [incident for incident in self.history.incidents(incident_days * 86400) if incident["target"] in labels]
+        if incidents:
+            lines.append(f"\n**Incidents, last {incident_days} days**")
+            for incident in incidents[-10:]:
+                what = incident["cause"] or ("Flapping" if incident["kind"] == "flapping" else "Down")
+                ended = f", resolved after {max(1, round(incident['duration_s'] / 60))} min" if incident["ended_at"] else ", ongoing"
+                lines.append(f"{STATUS_EMOJI['Offline'] if incident['kind'] == 'down' else STATUS_EMOJI['Partial Outage']} **{labels[incident['target']]}**: {what} <t:{incident['started_at']}:R>{ended}")
+        return "\n".join(lines)[:EMBED_DESCRIPTION_LIMIT] if lines else "No history recorded for this server's targets yet."
+
+    async def record_history(self, probed: List[Tuple[TargetKey, Dict[str, Any]]]):
+        if not self.history: return
+        now, samples = time.time(), []
+        for key, result in probed:
+            if key[0] == "discord_services":
+                for service_id, service in result["components"].items():
+                    samples.append({"target": f"discord:{service_id}", "ts": now, "up": service["raw_status"] == "operational", "state": service["status"]})
+            else:
+                samples.append({"target": self.history_target(key), "ts": now, "up": not self.result_failed(result), "state": result.get("status"), "code": result.get("code"), "latency_ms": result.get("latency_ms"), "timings": result.get("timings")})
+        try:
+            await self.history.call(self.history.record, samples)
+            if time.monotonic() - self.history_summary_at >= self.config["history_summary_interval"]:
+                self.history_summary = await self.history.call(self.history.summary)
+                self.history_summary_at = time.monotonic()
+        except sqlite3.Error as e:
+            print(f"Failed to write status history: {e}")
+
+    def compose_guild_status(self, guild_id: int) -> Dict[str, Any]:
+        section = self.guild_config(guild_id)
         status_data = {
             "bots": [], "websites": [], "discord_services": [], "custom_services": [],
             "last_updated_utc": datetime.now(timezone.utc).isoformat()
         }
-
-        if guild:
-            for bot_info in self.config.get("bots", []):
-                bot_data = {"label": bot_info['label'], "id": bot_info['id']}
-                try:
-                    bot = guild.get_member(bot_info['id']) or await guild.fetch_member(bot_info['id'])
-                    status_map = { discord.Status.online: "Online", discord.Status.idle: "Idle", discord.Status.dnd: "Do Not Disturb", discord.Status.offline: "Offline", discord.Status.invisible: "Invisible"}
-                    bot_data["status"] = status_map.get(bot.status, "Offline")
-                    bot_data["raw_status"] = str(bot.status)
-                except discord.NotFound: bot_data["status"] = "Not Found in Server"
-                except discord.Forbidden: bot_data["status"] = "No Permissions"
-                except Exception: bot_data["status"] = "Error Fetching"
-                status_data["bots"].append(bot_data)
-
-        for site in self.config.get("websites", []):
-            stat, ok = await self.fetch_website_status(site['url'])
-            status_data["websites"].append({"label": site['label'], "url": site['url'], "status": stat, "online": ok})
-
-        monitored_ids = self.config.get("monitored_discord_services", [])
-        if monitored_ids:
-            try:
-                async with self.session.get("https://discordstatus.com/api/v2/components.json", timeout=10) as resp:
-                    if resp.status == 200:
-                        all_components = {c['id']: c for c in (await resp.json()).get('components', [])}
-                        for service_id in monitored_ids:
-                            if comp := all_components.get(service_id):
-                                status_map = {"operational": "Operational", "degraded_performance": "Partial Outage", "partial_outage": "Partial Outage", "major_outage": "Offline", "under_maintenance": "Maintenance"}
-                                status_text = status_map.get(comp['status'], comp['status'].replace("_", " ").title())
-                                status_data["discord_services"].append({"name": comp['name'], "status": status_text, "raw_status": comp['status']})
-                            else:
-                                service_name_guess = service_id.replace("_", " ").title()
-                                status_data["discord_services"].append({"name": service_name_guess, "status": "Not Found in API", "raw_status": "not_found"})
-                    else:
-                         status_data["discord_services"].append({"name": "Discord API", "status": f"API Error ({resp.status})", "raw_status": "api_error"})
-            except Exception:
-                status_data["discord_services"].append({"name": "Discord API", "status": "Failed to Fetch", "raw_status": "fetch_failed"})
-
-        for name, status in self.config.get("services", {}).items():
-            status_data["custom_services"].append({"name": name, "status": status})
-
+        def public(key: TargetKey, result: Dict[str, Any]) -> Dict[str, Any]:
+            return {**{k: v for k, v in result.items() if k not in VOLATILE_RESULT_KEYS}, **self.history_summary.get(self.history_target(key), {})}
+        for bot_info in section["bots"]:
+            key = ("bot", guild_id, bot_info['id'])
+            result = self.results.get(key, {"status": "Guild Unavailable"})
+            status_data["bots"].append({"label": bot_info['label'], "id": bot_info['id'], **public(key, result)})
+        for site in section["websites"]:
+            key = ("website", site['url'])
+            result = self.results.get(key, {"status": "Loading", "online": False})
+            status_data["websites"].append({"label": site['label'], "url": site['url'], **public(key, result)})
+        feed = self.results.get(("discord_services",))
+        if section["monitored_discord_services"] and feed:
+            if feed["status"] != "ok":
+                status_data["discord_services"].append({"name": "Discord API", "status": feed["status"], "raw_status": feed["raw_status"]})
+            for service_id in section["monitored_discord_services"] if feed["status"] == "ok" else []:
+                if service := feed["components"].get(service_id):
+                    status_data["discord_services"].append({**service, **self.history_summary.get(f"discord:{service_id}", {})})
+                else:
+                    service_name_guess = service_id.replace("_", " ").title()
+                    status_data["discord_services"].append({"name": service_name_guess, "status": "Not Found in API", "raw_status": "not_found"})
+        for name, status in section["services"].items():
+            if is_probe_uri(status):
+                key = ("service", status)
+                result = self.results.get(key, {"status": "Loading", "online": False})
+                status_data["custom_services"].append({"name": name, "probe": status.split("://", 1)[0].lower(), **public(key, result)})
+            else:
+                status_data["custom_services"].append({"name": name, "status": status})
         return status_data
 
-    async def update_status_embed(self):
-        if not self.config.get("channel_id") or not self.config.get("message_id"): return
+    @staticmethod
+    def result_signature(result: Optional[Dict[str, Any]]) -> Any:
+        if result is None: return None
+        if "components" in result: return (result["status"], tuple(sorted((cid, c["raw_status"]) for cid, c in result["components"].items())))
+        return (result.get("status"), result.get("online"))
+
+    @staticmethod
+    def result_failed(result: Dict[str, Any]) -> bool:
+        if "components" in result: return result["status"] != "ok"
+        if "online" in result: return not result["online"]
+        return result.get("status") != "Online"
+
+    def count_write(self, kind: str, performed: bool):
+        self.write_stats[kind]["performed" if performed else "skipped"] += 1
+
+    @staticmethod
+    def data_signature(data: Dict[str, Any]) -> str:
+        return json.dumps({k: v for k, v in data.items() if k != "last_updated_utc"}, sort_keys=True, default=str)
+
+    def fragment(self, guild_id: int, kind: str, entry: Dict[str, Any], seen: set) -> str:
+        key = (guild_id, kind, entry_id(entry))
+        seen.add(key)
+        signature = tuple(map(entry.get, FRAGMENT_FIELDS))
+        cached = self.fragment_cache.get(key)
+        if cached and cached[0] == signature: return cached[1]
+        text = FRAGMENT_RENDERERS[kind](entry)[:EMBED_FRAGMENT_LIMIT]
+        self.fragment_cache[key] = (signature, text)
+        return text
+
+    def render_sections(self, guild_id: int, compact: bool = False) -> List[Tuple[str, List[Tuple[str, str]]]]:
+        status_data = self.status_data.get(guild_id, {})
+        seen: set = set()
+        if compact:
+            summary, attention = [], []
+            for kind, noun, word in (("bots", "bots", "online"), ("websites", "websites", "online"), ("discord_services", "Discord services", "operational"), ("custom_services", "services", "operational")):
+                entries = status_data.get(kind) or []
+                if not entries: continue
+                healthy = sum(1 for entry in entries if entry_healthy(kind, entry))
+                emoji = STATUS_EMOJI["Online"] if healthy == len(entries) else (STATUS_EMOJI["Offline"] if healthy == 0 else STATUS_EMOJI["Partial Outage"])
+                summary.append(("\n", f"{emoji} **{healthy}/{len(entries)}** {noun} {word}"))
+                for entry in entries:
+                    if entry_healthy(kind, entry): continue
+                    text = self.fragment(guild_id, kind, entry, seen)
+                    attention.append(("\n\n" if attention else "\n", f"**[Discord]**\n{text}" if kind == "discord_services" else text))
+            sections = [("### **__Summary__**", summary)] if summary else []
+            if attention: sections.append(("### **__Needs Attention__**", attention))
+            return sections
+
+        sections = []
+        for kind, heading in (("bots", "### **__Bots__**"), ("websites", "### **__Websites__**")):
+            lines = [self.fragment(guild_id, kind, entry, seen) for entry in status_data.get(kind) or []]
+            if lines: sections.append((heading, [("\n" if index == 0 else "\n\n", line) for index, line in enumerate(lines)]))
+        other: List[Tuple[str, str]] = []
+        if status_data.get("discord_services"):
+            other.append(("\n\n", "**[Discord]**"))
+            other += [("\n", self.fragment(guild_id, "discord_services", service, seen)) for service in status_data["discord_services"]]
+        other += [("\n\n", self.fragment(guild_id, "custom_services", service, seen)) for service in status_data.get("custom_services") or []]
+        if other: sections.append(("### **__Other Services__**", other))
+        for key in [key for key in self.fragment_cache if key[0] == guild_id and key not in seen]:
+            del self.fragment_cache[key]
+        return sections
+
+    def dashboard_layout(self, guild_id: int) -> str:
+        layout = self.guild_config(guild_id).get("dashboard_layout", "auto")
+        if layout in ("full", "compact"): return layout
+        status_data = self.status_data.get(guild_id, {})
+        targets = sum(len(status_data.get(kind) or []) for kind in FRAGMENT_RENDERERS)
+        return "compact" if targets > self.config["dashboard_compact_threshold"] else "full"
+
+    def render_pages(self, guild_id: int, compact: bool = False) -> List[List[discord.Embed]]:
+        title = self.guild_config(guild_id).get("embed_title", "Service Status")
+        note = "\n\n…more targets need attention. Use **Browse Full List** to see everything."
+        limit = EMBED_DESCRIPTION_LIMIT - len(note) if compact else EMBED_DESCRIPTION_LIMIT
+        pages = pack_embed_pages(self.render_sections(guild_id, compact), EMBED_TOTAL_LIMIT - len(title) - EMBED_FOOTER_RESERVE, limit)
+        if not pages:
+            pages = [["All monitored targets are healthy." if compact and self.status_data.get(guild_id) else "No services are currently being monitored."]]
+        if compact and len(pages) > 1:
+            pages = [pages[0][:-1] + [pages[0][-1] + note]]
+        numbered = len(pages) > 1
+        return [
+            [discord.Embed(title=(f"{title} ({number}/{len(pages)})" if numbered else title) if index == 0 else None, description=description, color=STATUS_COLOR["Operational"]) for index, description in enumerate(page)]
+            for number, page in enumerate(pages, 1)
+        ]
+
+    def render_dashboard(self, guild_id: int) -> Tuple[List[discord.Embed], List[Dict[str, Any]], bool, str]:
+        compact = self.dashboard_layout(guild_id) == "compact"
+        pages = self.render_pages(guild_id, compact)
+        websites = self.guild_config(guild_id)["websites"]
+        browse = compact or len(pages) > 1 or len(websites) > LINK_BUTTON_LIMIT
+        shown = websites[:LINK_BUTTON_LIMIT - 5 if browse else LINK_BUTTON_LIMIT]
+        signature = json.dumps([[embed.to_dict() for embed in pages[0]], [(w.get("label"), w["url"]) for w in shown], browse], sort_keys=True, default=str)
+        return pages[0], websites, browse, signature
+
+    @timed_span("update_status_embed")
+    async def update_status_embed(self, force: Optional[set] = None):
+        due = self.scheduler.pop_due(self.scheduler_targets())
+        force = set(force or ())
+        if self.force_refresh:
+            force.update(guild_id for guild_id, _ in self.guild_configs())
+            self.force_refresh = False
+        if not due and not force: return
+        for guild_id, status_data in (await self.fetch_all_statuses(due)).items():
+            await self.publish_guild(guild_id, status_data, guild_id in force)
+
+    @timed_span("publish_guild")
+    async def publish_guild(self, guild_id: int, status_data: Dict[str, Any], force: bool = False):
+        async with self.publish_lock:
+            section = self.guild_config(guild_id)
+            data_signature = self.data_signature(status_data)
+            data_changed = force or data_signature != self.data_signatures.get(guild_id)
+            if data_changed:
+                self.status_data[guild_id] = status_data
+                self.data_signatures[guild_id] = data_signature
+                self.save_status_data()
+                self.post_data_to_api(guild_id)
+            self.count_write("save", data_changed)
+            if self.api_destinations(guild_id): self.count_write("post", data_changed)
+
+            if not section["dashboards"]: return
+            rendered = self.render_dashboard(guild_id)
+            for dashboard in section["dashboards"]:
+                key = dashboard_key(dashboard)
+                if not force and self.render_signatures.get(key) == rendered[-1]:
+                    self.count_write("edit", False)
+                    continue
+                self.edit_pacer.submit(key, dashboard["channel_id"], lambda g=guild_id, d=dashboard, r=rendered: self.edit_dashboard(g, d, r))
+
+    async def edit_dashboard(self, guild_id: int, dashboard: Dict[str, int], rendered: Tuple[List[discord.Embed], List[Dict[str, Any]], bool, str]):
+        if dashboard not in self.guild_config(guild_id)["dashboards"]: return
+        key = dashboard_key(dashboard)
+        embeds, websites, browse, render_signature = rendered
         try:
-            channel = self.bot.get_channel(self.config["channel_id"]) or await self.bot.fetch_channel(self.config["channel_id"])
-            message = await channel.fetch_message(self.config["message_id"])
+            message = await self.get_dashboard_message(dashboard)
+            embeds[-1].set_footer(text=f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", icon_url=message.guild.icon.url if message.guild and message.guild.icon else None)
+            await self.discord_call("message_edit", message.edit(embeds=embeds, view=WebsiteButtonsView(self, websites, browse)))
         except (discord.NotFound, discord.Forbidden):
-            self.config.update({"channel_id": None, "message_id": None}); self.save_config()
+            self.forget_dashboard(guild_id, dashboard)
             return
-
-        await message.edit(embed=discord.Embed(title=f"{STATUS_EMOJI['Loading']} Checking Status...", color=STATUS_COLOR["Maintenance"]), view=None)
-
-        self.status_data = await self.fetch_all_statuses()
-        self.save_status_data()
-        await self.post_data_to_api()
-
-        embed = discord.Embed(title=self.config.get("embed_title", "Service Status"), color=STATUS_COLOR["Operational"])
-        description = []
-
-        if self.status_data.get("bots"):
-            lines = []
-            for bot in self.status_data["bots"]:
-                emoji = STATUS_EMOJI["Online"] if bot["status"] == "Online" else (STATUS_EMOJI["Partial Outage"] if bot["status"] in ["Idle", "Do Not Disturb"] else STATUS_EMOJI["Offline"])
-                lines.append(f"{emoji} **{bot['label']}**\n> Status: **{bot['status']}**")
-            description.append("### **__Bots__**\n" + "\n\n".join(lines))
-
-        if self.status_data.get("websites"):
-            lines = []
-            for site in self.status_data["websites"]:
-                emoji = STATUS_EMOJI['Online'] if site['online'] else STATUS_EMOJI['Offline']
-                lines.append(f"{emoji} [{site['label']}]({site['url']})\n> Status: **{site['status']}**")
-            description.append("### **__Websites__**\n" + "\n\n".join(lines))
-
-        other_services_section = []
-        if self.status_data.get("discord_services") or self.status_data.get("custom_services"):
-             other_services_section.append("### **__Other Services__**")
-
-        if self.status_data.get("discord_services"):
-            lines = ["**[Discord]**"]
-            for service in self.status_data["discord_services"]:
-                emoji = STATUS_EMOJI.get(service['status'], "❔")
-                lines.append(f"> {emoji} **{service['name']}**: {service['status']}")
-            other_services_section.append("\n".join(lines))
-
-        if self.status_data.get("custom_services"):
-            lines = []
-            for service in self.status_data["custom_services"]:
-                emoji = STATUS_EMOJI.get(service.get('status', 'Not Found'), '❔')
-                lines.append(f"**[{service['name']}]**\n> {emoji} Status: **{service['status']}**")
-            other_services_section.append("\n\n".join(lines))
-
-        if other_services_section:
-            description.append("\n\n".join(other_services_section))
-
-        embed.description = "\n".join(description) or "No services are currently being monitored."
-        embed.set_footer(text=f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", icon_url=channel.guild.icon.url if channel.guild.icon else None)
-
-        view = WebsiteButtonsView(self.config.get("websites", []))
-        await message.edit(embed=embed, view=view)
-
-    async def post_data_to_api(self):
-        url = self.config.get("api_post_url")
-        token = self.config.get("api_secret_token")
-        if not url or not self.status_data:
+        self.render_signatures[key] = render_signature
+        self.count_write("edit", True)
+
+    def api_destinations(self, guild_id: int) -> List[Dict[str, Any]]:
+        section = self.guild_config(guild_id)
+        destinations = [{"url": section["api_post_url"], "token": section.get("api_secret_token")}] if section.get("api_post_url") else []
+        destinations += section.get("api_destinations", [])
+        return [{**destination, "gzip": section.get("api_gzip", False), "delta": section.get("api_delta", False)} for destination in destinations]
+
+    def delivery_report(self, guild_id: int) -> str:
+        destinations = self.api_destinations(guild_id)
+        if not destinations:
+            return "No API destinations are configured. Add one under **API Settings**."
+        lines, now = [], time.monotonic()
+        for destination in destinations:
+            key = (guild_id, destination["url"])
+            entry = self.delivery.sending.get(key) or self.delivery.pending.get(key)
+            if key in self.delivery.sending: state = "sending now"
+            elif entry is None: state = "up to date"
+            elif entry["attempts"]: state = f"failed {entry['attempts']}x, next retry <t:{int(time.time() + max(0.0, entry['due'] - now))}:R>"
+            else: state = "queued"
+            lines.append(f"**{destination['url']}**: {state}")
+        stats = self.delivery.stats()
+        latency = f"{stats['latency_ms_avg']} ms avg, {stats['latency_ms_p95']} ms p95" if stats["latency_ms_avg"] is not None else "no deliveries yet"
+        lines.append(f"\n**All servers**: {stats['depth']} queued, {stats['in_flight']} sending\nDelivered {stats['delivered']}, retried {stats['retries']}, rejected {stats['failed']}, dropped {stats['dropped']}, replaced {stats['superseded']}\nQueue to delivery: {latency}")
+        return "\n".join(lines)[:EMBED_DESCRIPTION_LIMIT]
+
+    def post_data_to_api(self, guild_id: int):
+        status_data = self.status_data.get(guild_id)
+        if not status_data:
             return
+        for destination in self.api_destinations(guild_id):
+            self.delivery.submit((guild_id, destination["url"]), status_data)
+
+    async def deliver_payload(self, key: DeliveryKey, status_data: Dict[str, Any]):
+        destination = urlparse(key[1]).hostname or key[1]
+        started = time.perf_counter()
+        try:
+            await self.post_payload(key, status_data)
+        except Exception as e:
+            self.metrics.inc("status_monitor_api_post_failures_total", destination=destination, permanent=isinstance(e, DeliveryError) and e.permanent)
+            raise
+        finally:
+            self.metrics.observe("status_monitor_api_post_duration_seconds", time.perf_counter() - started, destination=destination)
+
+    @timed_span("post_data_to_api")
+    async def post_payload(self, key: DeliveryKey, status_data: Dict[str, Any]):
+        guild_id, url = key
+        destination = next((d for d in self.api_destinations(guild_id) if d["url"] == url), None)
+        if destination is None:
+            raise DeliveryError("destination is no longer configured", permanent=True)
+        token = destination.get("token")
 
         final_url = url
         if token:
@@ -492,34 +2864,197 @@ class StatusCog(commands.Cog, name="Status Monitor"):
                 final_url += f"?token={token}"
 
         headers = {"Content-Type": "application/json"}
-
-        try:
-            async with self.session.post(final_url, json=self.status_data, headers=headers, timeout=15) as response:
+        if destination["gzip"]:
+            headers["Content-Encoding"] = "gzip"
+
+        for _ in range(2):
+            envelope = self.delivery_envelope(key, status_data) if destination["delta"] else status_data
+            body = json.dumps(envelope).encode("utf-8")
+            if destination["gzip"]:
+                body = gzip.compress(body)
+            async with self.http.session("delivery").post(final_url, data=body, headers=headers, timeout=aiohttp.ClientTimeout(total=self.config["delivery_timeout"])) as response:
+                if response.status == 409 and envelope.get("type") == "delta":
+                    print(f"API endpoint '{url}' reported a sequence gap, resending a full snapshot.")
+                    self.delta_state.pop(key, None)
+                    continue
                 if response.status >= 400:
-                    print(f"Error posting to API: Status {response.status} - {await response.text()}")
-                else:
-                    print(f"Successfully posted status data to API (Status: {response.status})")
-        except Exception as e:
-            print(f"Failed to post data to API endpoint '{url}'. Error: {e}")
-
-    @tasks.loop(minutes=5)
+                    retry_after = response.headers.get("Retry-After", "")
+                    raise DeliveryError(
+                        f"Status {response.status} - {(await response.text())[:200]}",
+                        permanent=response.status < 500 and response.status not in (408, 425, 429),
+                        retry_after=float(retry_after) if retry_after.isdigit() else None
+                    )
+                if destination["delta"]:
+                    full_at = time.monotonic() if envelope["type"] == "full" else self.delta_state[key]["full_at"]
+                    self.delta_state[key] = {"seq": envelope["seq"], "payload": status_data, "full_at": full_at}
+                print(f"Successfully posted status data to API (Status: {response.status})")
+                return
+        raise DeliveryError("endpoint rejected the full snapshot with a sequence conflict")
+
+    def delivery_envelope(self, key: DeliveryKey, status_data: Dict[str, Any]) -> Dict[str, Any]:
+        state = self.delta_state.get(key)
+        seq = state["seq"] + 1 if state else 1
+        full = {"type": "full", "stream": self.delta_stream, "seq": seq, "data": status_data}
+        if not state or time.monotonic() - state["full_at"] >= self.config["api_full_resync_interval"]:
+            return full
+        delta = {"type": "delta", "stream": self.delta_stream, "seq": seq, **status_delta(state["payload"], status_data)}
+        return delta if len(json.dumps(delta)) < len(json.dumps(status_data)) else full
+
+    @tasks.loop(seconds=SCHEDULER_TICK_SECONDS)
     async def status_loop(self):
-        await self.update_status_embed()
+        self.updates.start()
+        await self.updates.request()
 
     @status_loop.before_loop
     async def before_status_loop(self):
         await self.bot.wait_until_ready()
         try:
-            with open(STATUS_DATA_FILE, "r", encoding="utf-8") as f:
-                self.status_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            stored = self.status_store.load() or {}
+            if "last_updated_utc" not in stored:
+                self.status_data = {int(guild_id): data for guild_id, data in stored.items()}
+                self.data_signatures = {guild_id: self.data_signature(data) for guild_id, data in self.status_data.items()}
+        except (PersistenceError, ValueError, AttributeError) as e:
+            print(f"Starting without cached status data: {e}")
             self.status_data = {}
 
+    def validate_import(self, guild_id: int, targets: Dict[str, Any], replace: bool) -> Tuple[Dict[str, Any], List[str], int]:
+        section = self.guild_config(guild_id)
+        batch: Dict[str, Any] = {"bots": [], "websites": [], "services": {}, "replace": replace}
+        problems: List[str] = []
+        skipped = 0
+        seen_bots = set() if replace else set(self.bot_index(guild_id))
+        seen_urls = set() if replace else {normalize_url(url) for url in self.website_index(guild_id)}
+        def entries(kind: str, noun: str) -> List[Any]:
+            value = targets.get(kind) or []
+            if isinstance(value, list): return value
+            problems.append(f"{noun}: expected a list, got `{value}`.")
+            return []
+        for position, entry in enumerate(entries("bots", "Bots"), 1):
+            try:
+                bot_id = int(str(entry.get("id", "")).strip())
+                if bot_id <= 0: raise ValueError
+            except (ValueError, AttributeError):
+                problems.append(f"Bot #{position}: `{entry.get('id') if isinstance(entry, dict) else entry}` is not a valid ID.")
+                continue
+            if bot_id in seen_bots:
+                skipped += 1
+                continue
+            seen_bots.add(bot_id)
+            interval = parse_interval_minutes(str(entry.get("interval") or ""))
+            batch["bots"].append({"id": bot_id, "label": str(entry.get("label") or bot_id), **({"interval": interval} if interval else {})})
+        for position, entry in enumerate(entries("websites", "Websites"), 1):
+            if isinstance(entry, str): entry = {"url": entry}
+            if not isinstance(entry, dict):
+                problems.append(f"Website #{position}: `{entry}` must be a URL or an object with a `url`.")
+                continue
+            url = str(entry.get("url") or "").strip()
+            if url and not url.startswith(("http://", "https://")): url = "https://" + url
+            if not urlparse(url).hostname or any(char.isspace() for char in url):
+                problems.append(f"Website #{position}: `{entry.get('url')}` is not a valid URL.")
+                continue
+            try:
+                options = check_options_from_entry(entry)
+            except ValueError as e:
+                problems.append(f"Website #{position} (`{url}`): {e}")
+                continue
+            if normalize_url(url) in seen_urls:
+                skipped += 1
+                continue
+            seen_urls.add(normalize_url(url))
+            interval = parse_interval_minutes(str(entry.get("interval") or ""))
+            batch["websites"].append({"url": url, "label": str(entry.get("label") or url), **({"interval": interval} if interval else {}), **options})
+        services = targets.get("services") or {}
+        if isinstance(services, list):
+            listed, services = services, {}
+            for position, entry in enumerate(listed, 1):
+                if isinstance(entry, dict): services[str(entry.get("name", ""))] = entry.get("status")
+                else: problems.append(f"Service #{position}: `{entry}` must be an object with `name` and `status`.")
+        elif not isinstance(services, dict):
+            problems.append(f"Services: expected names mapped to statuses, got `{services}`.")
+            services = {}
+        for name, status in services.items():
+            name = str(name).strip()
+            if not name:
+                problems.append("Services: a service without a name was ignored.")
+                continue
+            if "://" in str(status or ""):
+                try:
+                    parse_probe_uri(str(status))
+                except ValueError as e:
+                    problems.append(f"Service `{name}`: {e}.")
+                    continue
+            if not replace and section["services"].get(name) == status:
+                skipped += 1
+                continue
+            batch["services"][name] = str(status or "Operational")
+        return batch, problems, skipped
+
+    async def probe_import(self, batch: Dict[str, Any]) -> List[str]:
+        jobs: List[ProbeJob] = [(urlparse(site["url"]).hostname, lambda w=site: self.fetch_website_status(w), {"status": "Timed Out", "online": False}) for site in batch["websites"]]
+        results = await self.probe_engine.run(jobs)
+        return [f"[{site['label']}]({site['url']}): {result['status']}" for site, result in zip(batch["websites"], results) if self.result_failed(result)]
+
+    def apply_import(self, guild_id: int, batch: Dict[str, Any]) -> int:
+        section = self.guild_config(guild_id)
+        if batch["replace"]:
+            section["bots"], section["websites"], section["services"] = [], [], {}
+        known_bots, known_urls = set(self.bot_index(guild_id)), {normalize_url(url) for url in self.website_index(guild_id)}
+        bots = [bot for bot in batch["bots"] if bot["id"] not in known_bots]
+        websites = [site for site in batch["websites"] if normalize_url(site["url"]) not in known_urls]
+        section["bots"].extend(bots)
+        section["websites"].extend(websites)
+        section["services"].update(batch["services"])
+        self.save_config()
+        return len(bots) + len(websites) + len(batch["services"])
+
+    @commands.hybrid_command(name="status-export", description="Exports the monitored bots, websites and services as JSON, CSV or YAML.")
+    @commands.has_permissions(administrator=True)
+    async def status_export(self, ctx: commands.Context, file_format: Literal["json", "csv", "yaml"] = "json"):
+        try:
+            data = serialize_targets(self.guild_config(ctx.guild.id), file_format)
+        except ValueError as e:
+            await ctx.send(embed=create_response_embed("❌ Export Failed", str(e), color=discord.Color.red()), ephemeral=True)
+            return
+        await ctx.send(file=discord.File(io.BytesIO(data), filename=f"status-targets.{file_format}"), ephemeral=True)
+
+    @commands.hybrid_command(name="status-import", description="Imports bots, websites and services from a JSON, CSV or YAML file.")
+    @commands.has_permissions(administrator=True)
+    async def status_import(self, ctx: commands.Context, file: discord.Attachment, mode: Literal["merge", "replace"] = "merge", probe: bool = True):
+        await ctx.defer(ephemeral=True)
+        if file.size > IMPORT_MAX_BYTES:
+            await ctx.send(embed=create_response_embed("❌ File Too Large", f"Import files are limited to {IMPORT_MAX_BYTES // 1024} KB.", color=discord.Color.red()), ephemeral=True)
+            return
+        try:
+            targets = parse_target_file(file.filename, await file.read())
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            await ctx.send(embed=create_response_embed("❌ Invalid File", str(e)[:1000], color=discord.Color.red()), ephemeral=True)
+            return
+        except Exception as e:
+            await ctx.send(embed=create_response_embed("❌ Invalid File", f"Could not parse `{file.filename}`: {str(e)[:900]}", color=discord.Color.red()), ephemeral=True)
+            return
+        batch, problems, skipped = self.validate_import(ctx.guild.id, targets, mode == "replace")
+        unreachable = await self.probe_import(batch) if probe and batch["websites"] else []
+        lines = [
+            f"**{len(batch['bots'])}** bots, **{len(batch['websites'])}** websites and **{len(batch['services'])}** services are ready to import" + (" and will **replace** the current lists." if mode == "replace" else "."),
+            f"**{skipped}** entries are already monitored or duplicated and will be skipped." if skipped else ""
+        ]
+        if problems:
+            lines.append(f"\n**{len(problems)} invalid entries will be ignored:**\n" + "\n".join(problems[:10]) + (f"\n…and {len(problems) - 10} more." if len(problems) > 10 else ""))
+        if unreachable:
+            lines.append(f"\n**{len(unreachable)} websites failed the test probe** (they will still be imported):\n" + "\n".join(unreachable[:10]) + (f"\n…and {len(unreachable) - 10} more." if len(unreachable) > 10 else ""))
+        embed = create_response_embed("📥 Import Preview", "\n".join(line for line in lines if line)[:4000])
+        if not (batch["bots"] or batch["websites"] or batch["services"] or mode == "replace"):
+            await ctx.send(embed=embed, ephemeral=True)
+            return
+        await ctx.send(embed=embed, view=ImportConfirmView(self, ctx.guild.id, ctx.author.id, batch), ephemeral=True)
+
     @commands.hybrid_command(name="status-setup", description="Opens the admin panel for the status monitor.")
     @commands.has_permissions(administrator=True)
     async def status_setup(self, ctx: commands.Context):
-        if 'guild_id' not in self.config or not self.config['guild_id']:
-            self.config['guild_id'] = ctx.guild.id
+        if "unassigned_legacy" in self.config:
+            self.adopt_legacy(ctx.guild.id)
+        if str(ctx.guild.id) not in self.config["guilds"]:
+            self.guild_config(ctx.guild.id)
             self.save_config()
 
         embed = discord.Embed(
@@ -529,9 +3064,10 @@ class StatusCog(commands.Cog, name="Status Monitor"):
                 "• **Manage Items**: Add/remove bots, websites, and custom services.\n"
                 "• **Discord Services**: Choose which official Discord services to monitor.\n"
                 "• **API Settings**: Set the URL and token to post status data to your website. [**New!**]\n"
-                "• **Post/Move Status**: Set the channel for the public status embed.\n"
-                "• **Settings**: Adjust the refresh interval and embed title.\n"
-                "• **Refresh & POST**: Manually trigger an immediate update and send it to your API."
+                "• **Post/Move Status**: Add a status embed to a channel, or re-post the one already there. A server can have any number of status embeds.\n"
+                "• **Settings**: Adjust the refresh interval, embed title and layout. Large lists are split into pages or summarized automatically.\n"
+                "• **Refresh & POST**: Manually trigger an immediate update and send it to your API.\n\n"
+                "Use `status-import` with a JSON, CSV or YAML attachment to add many targets at once, and `status-export` to download the current lists."
             ),
             color=discord.Color.dark_grey()
         )
@@ -539,3 +3075,20 @@ class StatusCog(commands.Cog, name="Status Monitor"):
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(StatusCog(bot))
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Run a standalone probe agent that checks the targets the bot's agent hub assigns to it and reports the results back.")
+    parser.add_argument("mode", choices=["agent"])
+    parser.add_argument("--hub", required=True, help="base URL of the bot's agent hub, e.g. http://10.0.0.5:9465")
+    parser.add_argument("--token", default=os.environ.get("STATUS_AGENT_TOKEN", ""), help="agent_token from the bot's config (default: $STATUS_AGENT_TOKEN)")
+    parser.add_argument("--name", default=socket.gethostname(), help="unique agent name (default: hostname)")
+    parser.add_argument("--config", help="JSON file with probe settings that override the defaults, e.g. probe_concurrency or probe_types")
+    args = parser.parse_args()
+    agent_config = copy.deepcopy(CONFIG_DEFAULTS)
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f: agent_config.update(json.load(f))
+    try:
+        asyncio.run(ProbeAgent(args.hub, args.token, args.name, agent_config).run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,308 @@
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+import discord
+from aiohttp import web
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COG_FILE = os.path.join(REPO_DIR, "Discord-Statuses-website.py")
+GUILD_ID, CHANNEL_ID, MESSAGE_ID = 1000, 2000, 3000
+COMPONENTS = [
+    {"id": f"component{i}", "name": name, "status": "operational", "group_id": None}
+    for i, name in enumerate(("API", "Gateway", "Media Proxy", "Voice", "Search", "Push Notifications"))
+]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def load_cog_module():
+    spec = importlib.util.spec_from_file_location("status_monitor_cog", COG_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def git_version() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "-C", REPO_DIR, "describe", "--always", "--dirty"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576, 1)
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return round(peak / (1048576 if sys.platform == "darwin" else 1024), 1)
+        except ImportError:
+            return None
+
+def spread(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values: return {"min": None, "median": None, "max": None}
+    return {"min": round(min(values), 1), "median": round(statistics.median(values), 1), "max": round(max(values), 1)}
+
+class StandInServers:
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float, timeout_rate: float, hang_seconds: float, seed: int):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.random = random.Random(seed)
+        self.counts = {"website": 0, "components": 0, "receiver": 0}
+        self.runner: Optional[web.AppRunner] = None
+        self.base = ""
+
+    async def website(self, request: web.Request) -> web.Response:
+        self.counts["website"] += 1
+        roll = self.random.random()
+        if roll < self.timeout_rate:
+            await asyncio.sleep(self.hang_seconds)
+        else:
+            await asyncio.sleep(max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms)) / 1000)
+        return web.Response(status=500 if roll < self.timeout_rate + self.error_rate else 200, text="ok")
+
+    async def components(self, request: web.Request) -> web.Response:
+        self.counts["components"] += 1
+        if request.headers.get("If-None-Match") == '"bench"':
+            return web.Response(status=304)
+        return web.json_response({"components": COMPONENTS}, headers={"ETag": '"bench"'})
+
+    async def receiver(self, request: web.Request) -> web.Response:
+        self.counts["receiver"] += 1
+        json.loads(await request.read())
+        return web.json_response({"status": "success"})
+
+    async def start(self) -> str:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_route("*", "/site/{n}", self.website)
+        app.router.add_get("/api/v2/components.json", self.components)
+        app.router.add_post("/receive_status.php", self.receiver)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        port = free_port()
+        await web.TCPSite(self.runner, "127.0.0.1", port, backlog=1024).start()
+        self.base = f"http://127.0.0.1:{port}/"
+        return self.base
+
+    async def stop(self):
+        if self.runner: await self.runner.cleanup()
+
+class FakeLoop:
+    def create_task(self, coro):
+        coro.close()
+
+class FakeMember:
+    def __init__(self, guild: "FakeGuild", member_id: int):
+        self.guild = guild
+        self.id = member_id
+        self.status = discord.Status.online
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.icon = None
+        self.members: Dict[int, FakeMember] = {}
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self.members.get(member_id)
+
+    async def fetch_member(self, member_id: int) -> FakeMember:
+        return self.members[member_id]
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", message_id: int):
+        self.channel = channel
+        self.guild = channel.guild
+        self.id = message_id
+        self.edits = 0
+        self.embed_chars = 0
+
+    async def edit(self, **kwargs: Any):
+        self.edits += 1
+        self.embed_chars = sum(len(embed.description or "") for embed in kwargs.get("embeds") or [])
+
+    async def delete(self):
+        pass
+
+class FakeChannel:
+    def __init__(self, guild: FakeGuild, channel_id: int):
+        self.guild = guild
+        self.id = channel_id
+        self.message = FakeMessage(self, MESSAGE_ID)
+        self.fetches = 0
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        self.fetches += 1
+        return self.message
+
+class FakeBot:
+    def __init__(self, guild: FakeGuild, channel: FakeChannel):
+        self.loop = FakeLoop()
+        self.guild = guild
+        self.channel = channel
+        self.guilds = [guild]
+
+    def get_guild(self, guild_id: int) -> Optional[FakeGuild]:
+        return self.guild if guild_id == self.guild.id else None
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channel if channel_id == self.channel.id else None
+
+    async def fetch_channel(self, channel_id: int) -> FakeChannel:
+        return self.channel
+
+    async def wait_until_ready(self):
+        pass
+
+def write_config(base: str, websites: int, bots: int, args: argparse.Namespace):
+    os.makedirs("data/DcStatuses", exist_ok=True)
+    section = {
+        "dashboards": [{"channel_id": CHANNEL_ID, "message_id": MESSAGE_ID}],
+        "bots": [{"id": 10_000 + i, "label": f"Bot {i}"} for i in range(bots)],
+        "websites": [{"url": f"{base}site/{i}", "label": f"Site {i}", "timeout": args.site_timeout} for i in range(websites)],
+        "services": {"Bench Service": "Operational"},
+        "monitored_discord_services": [component["id"] for component in COMPONENTS],
+        "api_post_url": f"{base}receive_status.php", "api_secret_token": "bench", "api_gzip": args.gzip
+    }
+    config = {
+        "guilds": {str(GUILD_ID): section},
+        "probe_per_host": args.concurrency, "probe_pool_per_host": args.concurrency, "probe_pool_limit": max(100, args.concurrency),
+        "probe_concurrency": args.concurrency, "history_enabled": not args.no_history
+    }
+    with open("data/DcStatuses/status_config.json", "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+def span_totals(cog: Any, module: Any) -> Dict[str, float]:
+    samples = cog.metrics.families[module.SPAN_METRIC]["samples"]
+    return {dict(labels)["span"]: state[1] for labels, state in samples.items()}
+
+async def settle(cog: Any, timeout: float = 120.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if not cog.edit_pacer.pending and not cog.delivery.pending and not cog.delivery.sending:
+            return
+        await asyncio.sleep(0.005)
+
+async def run_cycle(cog: Any, module: Any) -> Dict[str, float]:
+    cog.scheduler = module.TargetScheduler(cog.config["adaptive_min_interval"], cog.config["adaptive_max_factor"])
+    cog.force_refresh = True
+    spans = span_totals(cog, module)
+    started = time.perf_counter()
+    await cog.update_status_embed()
+    cycle = time.perf_counter() - started
+    await settle(cog)
+    settled = time.perf_counter() - started
+    fetch = span_totals(cog, module).get("fetch_all_statuses", 0.0) - spans.get("fetch_all_statuses", 0.0)
+    return {"fetch_ms": fetch * 1000, "cycle_ms": cycle * 1000, "settle_ms": settled * 1000}
+
+async def run_scale(module: Any, servers: StandInServers, targets: int, args: argparse.Namespace) -> Dict[str, Any]:
+    shutil.rmtree("data", ignore_errors=True)
+    bots = int(targets * args.bot_ratio)
+    websites = targets - bots
+    write_config(servers.base, websites, bots, args)
+    guild = FakeGuild(GUILD_ID)
+    for i in range(bots):
+        guild.members[10_000 + i] = FakeMember(guild, 10_000 + i)
+    channel = FakeChannel(guild, CHANNEL_ID)
+    cog = module.StatusCog(FakeBot(guild, channel))
+    cog.component_feed.url = f"{servers.base}api/v2/components.json"
+    cog.edit_pacer.min_spacing = cog.edit_pacer.channel_gap = cog.edit_pacer.window = 0
+    cog.config["incident_reprobe_delay"] = args.reprobe_delay
+    cog.http.session("probe")
+    cog.edit_pacer.start()
+    cog.delivery.start()
+    try:
+        cycles, requests = [], []
+        for _ in range(args.cycles):
+            before = dict(servers.counts, discord_edits=channel.message.edits, discord_fetches=channel.fetches)
+            cycles.append(await run_cycle(cog, module))
+            after = dict(servers.counts, discord_edits=channel.message.edits, discord_fetches=channel.fetches)
+            requests.append({name: after[name] - before[name] for name in after})
+        tracemalloc.start()
+        await run_cycle(cog, module)
+        heap_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        probe_results = cog.metrics.families["status_monitor_probe_results_total"]["samples"]
+        return {
+            "targets": targets, "websites": websites, "bots": bots, "cycles": len(cycles),
+            "fetch_ms": spread([c["fetch_ms"] for c in cycles]),
+            "cycle_ms": spread([c["cycle_ms"] for c in cycles]),
+            "settle_ms": spread([c["settle_ms"] for c in cycles]),
+            "requests_per_cycle": {name: round(statistics.mean(r[name] for r in requests), 1) for name in requests[0]} if requests else {},
+            "probe_outcomes": {f"{dict(labels)['kind']}:{dict(labels)['outcome']}": int(value) for labels, value in sorted(probe_results.items())},
+            "embed_chars": channel.message.embed_chars,
+            "python_heap_peak_mb": round(heap_peak / 1048576, 1), "rss_mb": rss_mb()
+        }
+    finally:
+        for task in cog.reprobe_tasks.values(): task.cancel()
+        cog.cog_unload()
+        await asyncio.sleep(0.1)
+
+async def main(args: argparse.Namespace):
+    module = load_cog_module()
+    workdir = tempfile.mkdtemp(prefix="refresh_bench_")
+    previous_dir = os.getcwd()
+    os.chdir(workdir)
+    servers = StandInServers(args.latency_ms, args.jitter_ms, args.error_rate, args.timeout_rate, args.site_timeout + 1, args.seed)
+    await servers.start()
+    try:
+        results = []
+        for targets in args.targets:
+            with contextlib.redirect_stdout(sys.stderr):
+                result = await run_scale(module, servers, targets, args)
+            results.append(result)
+            print(json.dumps(result), flush=True)
+        report = {
+            "benchmark": "refresh_cycle", "version": git_version(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(), "platform": platform.platform(),
+            "settings": {key: value for key, value in vars(args).items() if key != "output"},
+            "results": results
+        }
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(os.path.join(previous_dir, args.output), "w", encoding="utf-8") as f: f.write(text + "\n")
+        print(text)
+    finally:
+        await servers.stop()
+        os.chdir(previous_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure fetch_all_statuses and full update_status_embed cycles against local stand-in servers.")
+    parser.add_argument("--targets", type=lambda v: [int(x) for x in v.split(",")], default=[10, 100, 1000, 5000], help="comma-separated target counts to run")
+    parser.add_argument("--cycles", type=int, default=3, help="timed cycles per target count")
+    parser.add_argument("--bot-ratio", type=float, default=0.1, help="share of targets that are bots, the rest are websites")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="mean response latency of the simulated websites")
+    parser.add_argument("--jitter-ms", type=float, default=25.0, help="standard deviation of the simulated latency")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="share of website requests answered with HTTP 500")
+    parser.add_argument("--timeout-rate", type=float, default=0.005, help="share of website requests that hang past the probe timeout")
+    parser.add_argument("--site-timeout", type=float, default=2.0, help="per-website probe timeout in seconds")
+    parser.add_argument("--concurrency", type=int, default=25, help="probe_concurrency, also used as the per-host limit since all stand-ins share one host")
+    parser.add_argument("--reprobe-delay", type=float, default=5.0, help="incident_reprobe_delay for confirming failures")
+    parser.add_argument("--gzip", action="store_true", help="gzip API POST bodies")
+    parser.add_argument("--no-history", action="store_true", help="disable the SQLite status history")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    asyncio.run(main(parser.parse_args()))
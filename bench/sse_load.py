@@ -0,0 +1,159 @@
+import argparse
+import asyncio
+import json
+import os
+import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+
+import aiohttp
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHP_FILES = ("index.php", "receive_status.php", "status_stream.php")
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values: return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * pct))] * 1000, 1)
+
+def serve_php(workers: int, max_streams: Optional[int]) -> Dict[str, Any]:
+    root = tempfile.mkdtemp(prefix="sse_load_")
+    for name in PHP_FILES:
+        shutil.copy(os.path.join(REPO_DIR, name), root)
+    stream_path = os.path.join(root, "status_stream.php")
+    if max_streams:
+        with open(stream_path, "r", encoding="utf-8", newline="") as f: source = f.read()
+        with open(stream_path, "w", encoding="utf-8", newline="") as f: f.write(re.sub(r"define\('MAX_STREAMS', [^;]*\);", f"define('MAX_STREAMS', {max_streams});", source))
+    with open(os.path.join(root, "receive_status.php"), "r", encoding="utf-8") as f:
+        token = re.search(r"define\('SECRET_TOKEN', '([^']*)'\)", f.read()).group(1)
+    port = free_port()
+    process = subprocess.Popen(["php", "-S", f"127.0.0.1:{port}", "-t", root], env={**os.environ, "PHP_CLI_SERVER_WORKERS": str(workers)}, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return {"root": root, "process": process, "base": f"http://127.0.0.1:{port}/", "token": token}
+
+class Viewer:
+    def __init__(self):
+        self.status: Optional[int] = None
+        self.ready = asyncio.Event()
+        self.received: Dict[int, float] = {}
+        self.heartbeats = 0
+
+    async def run(self, session: aiohttp.ClientSession, url: str):
+        try:
+            async with session.get(url, headers={"Accept": "text/event-stream"}) as response:
+                self.status = response.status
+                if response.status != 200:
+                    self.ready.set()
+                    return
+                event, data = None, []
+                async for raw in response.content:
+                    line = raw.decode("utf-8").rstrip("\r\n")
+                    if line.startswith(":"):
+                        self.heartbeats += 1
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[5:].strip())
+                    elif not line and data:
+                        self.handle(event, json.loads("\n".join(data)))
+                        event, data = None, []
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.ready.set()
+
+    def handle(self, event: Optional[str], payload: Dict[str, Any]):
+        self.ready.set()
+        marker = payload.get("bench") if event == "snapshot" else (payload.get("fields") or {}).get("bench")
+        if marker and marker["seq"] not in self.received:
+            self.received[marker["seq"]] = time.time() - marker["sent_at"]
+
+async def publish(session: aiohttp.ClientSession, url: str, seq: int):
+    payload = {
+        "bots": [], "websites": [], "discord_services": [],
+        "custom_services": [{"name": "Load Test", "status": "Operational"}],
+        "last_updated_utc": datetime.now(timezone.utc).isoformat(),
+        "bench": {"seq": seq, "sent_at": time.time()}
+    }
+    async with session.post(url, json=payload) as response:
+        if response.status != 200:
+            raise RuntimeError(f"receive_status.php answered {response.status}: {await response.text()}")
+
+async def run_step(base: str, token: str, viewers: int, updates: int, interval: float, max_latency: float, connect_timeout: float) -> Dict[str, Any]:
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout)) as session:
+        await publish(session, f"{base}receive_status.php?token={token}", 0)
+        clients = [Viewer() for _ in range(viewers)]
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(client.run(session, f"{base}status_stream.php")) for client in clients]
+        try:
+            await asyncio.wait_for(asyncio.gather(*(client.ready.wait() for client in clients)), connect_timeout)
+        except asyncio.TimeoutError:
+            pass
+        connect_seconds = time.perf_counter() - started
+        connected = [client for client in clients if client.status == 200]
+        for seq in range(1, updates + 1):
+            await publish(session, f"{base}receive_status.php?token={token}", seq)
+            await asyncio.sleep(interval)
+        await asyncio.sleep(max_latency)
+        for task in tasks: task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    latencies = [latency for client in connected for seq, latency in client.received.items() if seq > 0]
+    expected = len(connected) * updates
+    result = {
+        "viewers": viewers, "connected": len(connected),
+        "rejected": sum(1 for client in clients if client.status == 503),
+        "failed": sum(1 for client in clients if client.status not in (200, 503)),
+        "connect_seconds": round(connect_seconds, 2),
+        "deliveries": len(latencies), "expected_deliveries": expected,
+        "latency_ms_p50": percentile(latencies, 0.5), "latency_ms_p95": percentile(latencies, 0.95),
+        "latency_ms_max": round(max(latencies) * 1000, 1) if latencies else None
+    }
+    result["sustained"] = result["connected"] == viewers and result["deliveries"] == expected and (result["latency_ms_p95"] or 0) <= max_latency * 1000
+    return result
+
+async def main(args: argparse.Namespace):
+    server = None
+    base, token = args.base, args.token
+    if args.serve:
+        server = serve_php(args.workers, args.max_streams)
+        base, token = server["base"], server["token"]
+        await asyncio.sleep(1)
+    try:
+        results = []
+        for viewers in args.steps:
+            result = await run_step(base, token, viewers, args.updates, args.interval, args.max_latency, args.connect_timeout)
+            results.append(result)
+            print(json.dumps(result), flush=True)
+            if not result["sustained"] and args.stop_on_failure: break
+        sustained = [r["viewers"] for r in results if r["sustained"]]
+        print(json.dumps({"max_sustained_viewers": max(sustained) if sustained else 0, "workers": args.workers if args.serve else None, "steps": results}, indent=2))
+    finally:
+        if server:
+            server["process"].terminate()
+            server["process"].wait()
+            shutil.rmtree(server["root"], ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ramp concurrent SSE viewers against status_stream.php and report how many one node sustains.")
+    parser.add_argument("--base", default="http://127.0.0.1:8080/", help="URL of the directory that holds the PHP files, with a trailing slash")
+    parser.add_argument("--token", default="", help="SECRET_TOKEN configured in receive_status.php")
+    parser.add_argument("--serve", action="store_true", help="start PHP's built-in server on a copy of the PHP files instead of using --base")
+    parser.add_argument("--workers", type=int, default=10, help="PHP workers for the --serve copy, like a small php-fpm pool's pm.max_children")
+    parser.add_argument("--max-streams", type=int, help="override MAX_STREAMS for the --serve copy instead of sizing it from --workers")
+    parser.add_argument("--steps", type=lambda v: [int(x) for x in v.split(",")], default=[1, 2, 5, 10, 20])
+    parser.add_argument("--updates", type=int, default=5, help="status updates published per step")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds between updates")
+    parser.add_argument("--max-latency", type=float, default=3.0, help="p95 fan-out latency in seconds a step may reach and still count as sustained")
+    parser.add_argument("--connect-timeout", type=float, default=20.0)
+    parser.add_argument("--stop-on-failure", action="store_true")
+    asyncio.run(main(parser.parse_args()))
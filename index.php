@@ -1,6 +1,23 @@
 <?php
 
 $statusFile = 'status.json';
+$cacheFile = 'status.html.cache';
+
+$stat = @stat($statusFile);
+$etag = $stat ? sprintf('"%x-%x-%x"', $stat['ino'], $stat['mtime'], $stat['size']) : '"empty"';
+header('ETag: ' . $etag);
+header('Cache-Control: no-cache');
+$clientTags = array_map(fn($tag) => preg_replace('/^W\//', '', trim($tag)), explode(',', $_SERVER['HTTP_IF_NONE_MATCH'] ?? ''));
+if (in_array($etag, $clientTags, true)) {
+    http_response_code(304);
+    exit;
+}
+$cached = @file_get_contents($cacheFile);
+if ($cached !== false && str_starts_with($cached, $etag . "\n")) {
+    echo substr($cached, strlen($etag) + 1);
+    exit;
+}
+ob_start();
 
 function getStatusData(string $filePath): array {
     if (!file_exists($filePath) || filesize($filePath) === 0) {
@@ -29,7 +46,7 @@ function getStatusStyles(string $status): array {
             'dot' => 'bg-red-500'
         ];
     }
-    if (str_contains($status, 'partial') || str_contains($status, 'degraded')) { 
+    if (str_contains($status, 'partial') || str_contains($status, 'degraded') || str_contains($status, 'flapping')) { 
         return [
             'text' => 'text-amber-400',
             'icon_bg' => 'bg-amber-400/10',
@@ -59,7 +76,7 @@ function getStatusIcon(string $status): string {
     if (str_contains($status, 'operational') || str_contains($status, 'online')) {
         return '<svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path></svg>';
     }
-    if (str_contains($status, 'partial') || str_contains($status, 'degraded')) {
+    if (str_contains($status, 'partial') || str_contains($status, 'degraded') || str_contains($status, 'flapping')) {
         return '<svg class="w-5 h-5" fill="none" stroke="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"></path></svg>';
     }
     if (str_contains($status, 'offline') || str_contains($status, 'error') || str_contains($status, 'failed') || str_contains($status, 'outage')) {
@@ -92,7 +109,7 @@ function getOverallStatus(array $data): array {
             $hasOutage = true;
             break; 
         }
-        if (str_contains($status, 'partial') || str_contains($status, 'degraded')) {
+        if (str_contains($status, 'partial') || str_contains($status, 'degraded') || str_contains($status, 'flapping')) {
             $hasIssue = true;
         }
     }
@@ -127,7 +144,7 @@ if (!empty($data['last_updated_utc'])) {
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="refresh" content="60">
+    <noscript><meta http-equiv="refresh" content="60"></noscript>
     <title>Zygnal Status Page</title>
     <script src="https://cdn.tailwindcss.com"></script>
     <link rel="preconnect" href="https://fonts.googleapis.com">
@@ -182,7 +199,7 @@ if (!empty($data['last_updated_utc'])) {
 </head>
 <body class="text-gray-200">
 
-    <div class="container mx-auto p-4 md:p-8 max-w-3xl">
+    <div id="status-root" class="container mx-auto p-4 md:p-8 max-w-3xl">
 
         <header class="mb-8 text-center">
             <h1 class="text-5xl md:text-6xl font-black text-transparent bg-clip-text bg-gradient-to-r from-cyan-300 to-blue-500">Zygnal Status</h1>
@@ -190,7 +207,7 @@ if (!empty($data['last_updated_utc'])) {
         </header>
 
         <?php $overallStyles = $overallStatus['styles']; ?>
-        <div class="glass-card p-6 mb-10 text-center transition-all duration-500 status-glow-<?php echo substr($overallStyles['dot'], 3); ?>">
+        <div id="overall-status" class="glass-card p-6 mb-10 text-center transition-all duration-500 status-glow-<?php echo substr($overallStyles['dot'], 3); ?>">
             <div class="flex items-center justify-center gap-4">
                 <div class="p-3 rounded-full <?php echo $overallStyles['icon_bg']; ?>">
                     <?php echo getStatusIcon($overallStatus['text']); ?>
@@ -201,7 +218,7 @@ if (!empty($data['last_updated_utc'])) {
             </div>
         </div>
         
-        <div class="glass-card p-4 md:p-6 space-y-6">
+        <div id="components" class="glass-card p-4 md:p-6 space-y-6">
             <?php if (empty($data)): ?>
                 <div class="text-center py-8">
                     <p class="text-gray-400">The first status report has not been received yet.</p>
@@ -250,11 +267,172 @@ if (!empty($data['last_updated_utc'])) {
         </div>
 
         <footer class="text-center mt-10 text-gray-500 text-sm">
-            <p>Last updated: <?php echo htmlspecialchars($lastUpdated); ?></p>
-            <p class="mt-1 opacity-75">This page automatically refreshes every 60 seconds.</p>
+            <p>Last updated: <span id="last-updated"><?php echo htmlspecialchars($lastUpdated); ?></span></p>
+            <p class="mt-1 opacity-75">This page updates live as statuses change.</p>
         </footer>
 
     </div>
 
+    <script id="status-data" type="application/json"><?php echo json_encode((object)$data, JSON_HEX_TAG | JSON_HEX_AMP | JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE); ?></script>
+    <script>
+        (function () {
+            if (!window.EventSource) {
+                setTimeout(function () { location.reload(); }, 60000);
+                return;
+            }
+            var STYLES = <?php echo json_encode(['operational' => getStatusStyles('operational'), 'outage' => getStatusStyles('outage'), 'partial' => getStatusStyles('partial'), 'maintenance' => getStatusStyles('maintenance'), 'unknown' => getStatusStyles('')]); ?>;
+            var ICONS = <?php echo json_encode(['operational' => getStatusIcon('operational'), 'partial' => getStatusIcon('partial'), 'offline' => getStatusIcon('offline'), 'maintenance' => getStatusIcon('maintenance'), 'unknown' => getStatusIcon('')]); ?>;
+            var TITLES = { bots: 'Bots', websites: 'Websites', discord_services: 'Discord Services', custom_services: 'Other Services' };
+            var state = JSON.parse(document.getElementById('status-data').textContent);
+            var stream = null;
+            var refetchTimer = null;
+
+            function has(text, word) { return text.indexOf(word) !== -1; }
+            function escapeHtml(value) {
+                return String(value === undefined || value === null ? '' : value).replace(/[&<>"']/g, function (c) {
+                    return { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;' }[c];
+                });
+            }
+            function styleKey(status) {
+                status = String(status || '').toLowerCase();
+                if (has(status, 'operational') || has(status, 'online')) return 'operational';
+                if (has(status, 'outage') && !has(status, 'partial')) return 'outage';
+                if (has(status, 'partial') || has(status, 'degraded') || has(status, 'flapping')) return 'partial';
+                if (has(status, 'maintenance')) return 'maintenance';
+                return 'unknown';
+            }
+            function iconKey(status) {
+                status = String(status || '').toLowerCase();
+                if (has(status, 'operational') || has(status, 'online')) return 'operational';
+                if (has(status, 'partial') || has(status, 'degraded') || has(status, 'flapping')) return 'partial';
+                if (has(status, 'offline') || has(status, 'error') || has(status, 'failed') || has(status, 'outage')) return 'offline';
+                if (has(status, 'maintenance')) return 'maintenance';
+                return 'unknown';
+            }
+            function overallStatus(data) {
+                var all = [].concat(data.bots || [], data.websites || [], data.discord_services || [], data.custom_services || []);
+                if (!all.length) return ['Awaiting Status Data', 'maintenance'];
+                var issue = false;
+                for (var i = 0; i < all.length; i++) {
+                    var status = String(all[i].status || '').toLowerCase();
+                    if (has(status, 'offline') || (has(status, 'outage') && !has(status, 'partial')) || has(status, 'error')) return ['Major Service Outage', 'outage'];
+                    if (has(status, 'partial') || has(status, 'degraded') || has(status, 'flapping')) issue = true;
+                }
+                return issue ? ['Partial Service Disruption', 'partial'] : ['All Systems Operational', 'operational'];
+            }
+            function formatUpdated(value) {
+                if (!value) return 'Never';
+                var date = new Date(value);
+                if (isNaN(date.getTime())) return 'Invalid Date';
+                return date.toLocaleString('en-US', { timeZone: 'Europe/Berlin', dateStyle: 'long', timeStyle: 'long' });
+            }
+            function render() {
+                var overall = overallStatus(state);
+                var styles = STYLES[overall[1]];
+                var card = document.getElementById('overall-status');
+                card.className = 'glass-card p-6 mb-10 text-center transition-all duration-500 status-glow-' + styles.dot.substring(3);
+                card.innerHTML = '<div class="flex items-center justify-center gap-4"><div class="p-3 rounded-full ' + styles.icon_bg + '">' + ICONS[iconKey(overall[0])] + '</div><h2 class="text-2xl md:text-3xl font-bold ' + styles.text + '">' + escapeHtml(overall[0]) + '</h2></div>';
+                var html = Object.keys(state).length ? '' : '<div class="text-center py-8"><p class="text-gray-400">The first status report has not been received yet.</p><p class="text-gray-500 text-sm">This page will update automatically.</p></div>';
+                Object.keys(TITLES).forEach(function (key) {
+                    var items = state[key] || [];
+                    if (!items.length) return;
+                    html += '<section><h3 class="text-xl font-bold text-gray-100 mb-4 px-2">' + TITLES[key] + '</h3><div class="space-y-3">';
+                    items.forEach(function (item) {
+                        var itemStyles = STYLES[styleKey(item.status)];
+                        var tag = key === 'websites' ? 'a' : 'div';
+                        var link = tag === 'a' ? ' href="' + escapeHtml(item.url) + '" target="_blank" rel="noopener noreferrer"' : '';
+                        html += '<' + tag + link + ' class="flex items-center justify-between p-4 rounded-xl border ' + itemStyles.border + ' bg-black/10 hover:bg-black/20 transition-all duration-300">'
+                            + '<div class="flex items-center gap-4"><div class="p-2 rounded-full ' + itemStyles.icon_bg + ' ' + itemStyles.text + '">' + ICONS[iconKey(item.status)] + '</div>'
+                            + '<span class="font-semibold text-gray-200">' + escapeHtml(item.label !== undefined && item.label !== null ? item.label : item.name) + '</span></div>'
+                            + '<div class="flex items-center gap-2"><div class="status-dot ' + itemStyles.dot + '"></div><span class="font-medium ' + itemStyles.text + '">' + escapeHtml(item.status) + '</span></div></' + tag + '>';
+                    });
+                    html += '</div></section>';
+                });
+                document.getElementById('components').innerHTML = html;
+                document.getElementById('last-updated').textContent = formatUpdated(state.last_updated_utc);
+            }
+            function entryId(entry) {
+                var id = entry.id !== undefined && entry.id !== null ? entry.id : entry.url !== undefined && entry.url !== null ? entry.url : entry.name;
+                return String(id === undefined || id === null ? '' : id);
+            }
+            function applyDelta(doc, delta) {
+                var next = Object.assign({}, doc);
+                Object.keys(delta.fields || {}).forEach(function (key) { next[key] = delta.fields[key]; });
+                (delta.removed || []).forEach(function (key) { delete next[key]; });
+                Object.keys(delta.lists || {}).forEach(function (key) { next[key] = delta.lists[key]; });
+                var changed = delta.changed || {};
+                for (var key in changed) {
+                    var list = (next[key] || []).slice();
+                    var positions = {};
+                    list.forEach(function (entry, position) { positions[entryId(entry)] = position; });
+                    for (var id in changed[key]) {
+                        if (!(id in positions)) return null;
+                        list[positions[id]] = changed[key][id];
+                    }
+                    next[key] = list;
+                }
+                return next;
+            }
+            function refetch(delay, done) {
+                if (refetchTimer) return;
+                refetchTimer = setTimeout(function () {
+                    fetch(location.href, { cache: 'no-cache' })
+                        .then(function (response) { return response.text(); })
+                        .then(function (html) {
+                            var next = new DOMParser().parseFromString(html, 'text/html').getElementById('status-data');
+                            if (!next) return;
+                            state = JSON.parse(next.textContent);
+                            render();
+                        })
+                        .catch(function () {})
+                        .finally(function () {
+                            refetchTimer = null;
+                            done();
+                        });
+                }, delay);
+            }
+            function refetchSoon() {
+                refetch(1000 + Math.random() * 9000, connect);
+            }
+            function poll(rounds) {
+                refetch(45000 + Math.random() * 30000, function () { rounds > 1 ? poll(rounds - 1) : connect(); });
+            }
+            function connect() {
+                if (stream) stream.close();
+                stream = new EventSource('status_stream.php?lastEventId=' + (state._event || 0));
+                stream.addEventListener('snapshot', function (event) {
+                    state = JSON.parse(event.data);
+                    state._event = Number(event.lastEventId);
+                    render();
+                });
+                stream.addEventListener('patch', function (event) {
+                    var next = applyDelta(state, JSON.parse(event.data));
+                    if (next === null) {
+                        refetchSoon();
+                        return;
+                    }
+                    state = next;
+                    state._event = Number(event.lastEventId);
+                    render();
+                });
+                stream.onerror = function () {
+                    if (stream.readyState === EventSource.CLOSED) {
+                        stream = null;
+                        poll(5);
+                    }
+                };
+            }
+            connect();
+        })();
+    </script>
+
 </body>
 </html>
+<?php
+$html = ob_get_contents();
+ob_end_flush();
+$tempCache = $cacheFile . '.' . getmypid() . '.tmp';
+if (@file_put_contents($tempCache, $etag . "\n" . $html) !== false) {
+    @rename($tempCache, $cacheFile);
+}
+?>
@@ -1,8 +1,62 @@
 <?php
 
 define('SECRET_TOKEN', '9iu3nTA3OMpb16TAHYLK3pFgF4ZY1VSy');
+define('EVENT_LOG_LIMIT', 200);
 
 $outputFile = 'status.json';
+$lockFile = 'status.json.lock';
+$eventLog = 'status.events';
+
+function entryId(array $entry): string {
+    return (string)($entry['id'] ?? $entry['url'] ?? $entry['name'] ?? '');
+}
+
+function applyDelta(array $document, array $delta): ?array {
+    foreach ($delta['fields'] ?? [] as $key => $value) {
+        $document[$key] = $value;
+    }
+    foreach ($delta['removed'] ?? [] as $key) {
+        unset($document[$key]);
+    }
+    foreach ($delta['lists'] ?? [] as $key => $list) {
+        $document[$key] = $list;
+    }
+    foreach ($delta['changed'] ?? [] as $key => $entries) {
+        $positions = [];
+        foreach ($document[$key] ?? [] as $position => $entry) {
+            $positions[entryId($entry)] = $position;
+        }
+        foreach ($entries as $id => $entry) {
+            if (!isset($positions[(string)$id])) {
+                return null;
+            }
+            $document[$key][$positions[(string)$id]] = $entry;
+        }
+    }
+    return $document;
+}
+
+function writeAtomically(string $path, string $contents): bool {
+    $tempPath = $path . '.' . getmypid() . '.tmp';
+    if (file_put_contents($tempPath, $contents) === false) {
+        return false;
+    }
+    if (!rename($tempPath, $path)) {
+        @unlink($tempPath);
+        return false;
+    }
+    return true;
+}
+
+function appendEvent(string $path, array $event): void {
+    $line = json_encode($event, JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE) . "\n";
+    $lines = @file($path, FILE_IGNORE_NEW_LINES | FILE_SKIP_EMPTY_LINES) ?: [];
+    if (count($lines) >= EVENT_LOG_LIMIT) {
+        writeAtomically($path, implode("\n", array_slice($lines, -intdiv(EVENT_LOG_LIMIT, 2))) . "\n" . $line);
+    } else {
+        file_put_contents($path, $line, FILE_APPEND);
+    }
+}
 
 header('Content-Type: text/plain');
 
@@ -29,17 +83,71 @@ if ($jsonPayload === false || empty($jsonPayload)) {
     die('Error: No data received in the request body.');
 }
 
-json_decode($jsonPayload);
-if (json_last_error() !== JSON_ERROR_NONE) {
+$encoding = strtolower(trim($_SERVER['HTTP_CONTENT_ENCODING'] ?? ''));
+if ($encoding === 'gzip') {
+    $jsonPayload = @gzdecode($jsonPayload);
+    if ($jsonPayload === false) {
+        http_response_code(400);
+        die('Error: Request body is not valid gzip data.');
+    }
+} elseif ($encoding !== '' && $encoding !== 'identity') {
+    http_response_code(415);
+    die('Error: Unsupported Content-Encoding.');
+}
+
+$payload = json_decode($jsonPayload, true);
+if (json_last_error() !== JSON_ERROR_NONE || !is_array($payload)) {
     http_response_code(400); 
     die('Error: Invalid JSON format received.');
 }
 
-if (file_put_contents($outputFile, $jsonPayload, LOCK_EX) === false) {
+$lock = fopen($lockFile, 'c');
+if ($lock === false || !flock($lock, LOCK_EX)) {
+    http_response_code(500);
+    die('Error: Could not lock the status file. Check server permissions.');
+}
+
+$current = file_exists($outputFile) ? json_decode(file_get_contents($outputFile), true) : null;
+$type = $payload['type'] ?? null;
+if ($type === 'full') {
+    $document = is_array($payload['data'] ?? null) ? $payload['data'] : [];
+} elseif ($type === 'delta') {
+    $sync = is_array($current) ? ($current['_sync'] ?? []) : [];
+    if (($sync['stream'] ?? null) !== ($payload['stream'] ?? null) || ($sync['seq'] ?? null) !== ($payload['seq'] ?? 0) - 1) {
+        http_response_code(409);
+        die('Error: Sequence gap, a full snapshot is required.');
+    }
+    $document = applyDelta($current, $payload);
+    if ($document === null) {
+        http_response_code(409);
+        die('Error: Delta references an unknown entry, a full snapshot is required.');
+    }
+} else {
+    $document = $payload;
+}
+
+if ($type !== null) {
+    $document['_sync'] = ['stream' => $payload['stream'] ?? null, 'seq' => $payload['seq'] ?? null];
+}
+
+$previousEvent = is_array($current) ? (int)($current['_event'] ?? 0) : 0;
+$eventId = max($previousEvent + 1, (int)floor(microtime(true) * 1000));
+$document['_event'] = $eventId;
+
+if (!writeAtomically($outputFile, json_encode($document, JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE))) {
     http_response_code(500); 
     die('Error: Could not write data to the status file. Check server permissions.');
 }
 
+$event = ['id' => $eventId, 'prev' => $previousEvent, 'event' => $type === 'delta' ? 'patch' : 'snapshot'];
+if ($type === 'delta') {
+    $event['data'] = [
+        'fields' => $payload['fields'] ?? [], 'lists' => $payload['lists'] ?? [],
+        'changed' => $payload['changed'] ?? [], 'removed' => $payload['removed'] ?? []
+    ];
+}
+appendEvent($eventLog, $event);
+
 http_response_code(200); 
 echo 'Success: Status data received and updated successfully.';
 
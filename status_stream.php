@@ -0,0 +1,104 @@
+<?php
+
+define('PHP_WORKERS', (int)(getenv('PHP_FPM_MAX_CHILDREN') ?: getenv('PHP_CLI_SERVER_WORKERS') ?: 5));
+define('STREAM_SHARE', 0.5);
+define('MAX_STREAMS', max(1, (int)floor(PHP_WORKERS * STREAM_SHARE)));
+define('STREAM_LIFETIME', 300);
+define('HEARTBEAT_INTERVAL', 15);
+define('POLL_INTERVAL_MS', 1000);
+
+$statusFile = 'status.json';
+$eventLog = 'status.events';
+$slotDir = 'stream_slots';
+
+function readDocument(string $path): ?array {
+    $content = @file_get_contents($path);
+    $data = $content === false ? null : json_decode($content, true);
+    return is_array($data) ? $data : null;
+}
+
+function readEvents(string $path): array {
+    $events = [];
+    foreach (@file($path, FILE_IGNORE_NEW_LINES | FILE_SKIP_EMPTY_LINES) ?: [] as $line) {
+        $event = json_decode($line, true);
+        if (is_array($event) && isset($event['id'], $event['event'])) {
+            $events[] = $event;
+        }
+    }
+    return $events;
+}
+
+function sendEvent(int $id, string $type, array $data): void {
+    echo "id: {$id}\nevent: {$type}\ndata: " . json_encode($data, JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE) . "\n\n";
+}
+
+function claimSlot(string $dir) {
+    @mkdir($dir, 0755, true);
+    $start = random_int(0, MAX_STREAMS - 1);
+    for ($i = 0; $i < MAX_STREAMS; $i++) {
+        $handle = @fopen(sprintf('%s/slot%d.lock', $dir, ($start + $i) % MAX_STREAMS), 'c');
+        if ($handle !== false && flock($handle, LOCK_EX | LOCK_NB)) {
+            return $handle;
+        }
+        if ($handle !== false) {
+            fclose($handle);
+        }
+    }
+    return null;
+}
+
+$slot = claimSlot($slotDir);
+if ($slot === null) {
+    http_response_code(503);
+    header('Retry-After: 60');
+    header('Content-Type: text/plain');
+    die('Error: Too many live viewers, please retry shortly.');
+}
+
+set_time_limit(STREAM_LIFETIME + 30);
+@ini_set('zlib.output_compression', '0');
+while (ob_get_level() > 0) {
+    ob_end_flush();
+}
+header('Content-Type: text/event-stream');
+header('Cache-Control: no-cache');
+header('X-Accel-Buffering: no');
+
+$lastId = (int)($_SERVER['HTTP_LAST_EVENT_ID'] ?? $_GET['lastEventId'] ?? 0);
+echo "retry: 5000\n\n";
+flush();
+
+$started = time();
+$lastWrite = time();
+$logStamp = false;
+while (time() - $started < STREAM_LIFETIME && !connection_aborted()) {
+    clearstatcache();
+    $stat = @stat($eventLog);
+    $stamp = $stat ? [$stat['ino'], $stat['mtime'], $stat['size']] : null;
+    if ($stamp !== $logStamp) {
+        $logStamp = $stamp;
+        $pending = array_values(array_filter(readEvents($eventLog), fn($event) => $event['id'] > $lastId));
+        $needsSnapshot = $lastId === 0 || ($pending !== [] && (($pending[0]['prev'] ?? null) !== $lastId || in_array('snapshot', array_column($pending, 'event'), true)));
+        if ($needsSnapshot && ($document = readDocument($statusFile)) !== null && ($lastId === 0 || (int)($document['_event'] ?? 0) !== $lastId)) {
+            $lastId = (int)($document['_event'] ?? 0);
+            unset($document['_sync'], $document['_event']);
+            sendEvent($lastId, 'snapshot', $document);
+            $lastWrite = time();
+        } elseif (!$needsSnapshot) {
+            foreach ($pending as $event) {
+                sendEvent($event['id'], 'patch', $event['data'] ?? []);
+                $lastId = $event['id'];
+                $lastWrite = time();
+            }
+        }
+        flush();
+    }
+    if (time() - $lastWrite >= HEARTBEAT_INTERVAL) {
+        echo ": heartbeat\n\n";
+        flush();
+        $lastWrite = time();
+    }
+    usleep(POLL_INTERVAL_MS * 1000);
+}
+
+?>
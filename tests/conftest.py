@@ -0,0 +1,32 @@
+import contextlib
+import importlib.util
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Discord-Statuses-website.py")
+
+def load_status_module():
+    if "status_monitor" not in sys.modules:
+        spec = importlib.util.spec_from_file_location("status_monitor", MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["status_monitor"] = module
+        spec.loader.exec_module(module)
+    return sys.modules["status_monitor"]
+
+@pytest.fixture(scope="session")
+def status():
+    return load_status_module()
+
+@contextlib.asynccontextmanager
+async def serve(app: web.Application):
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host, port = runner.addresses[0][:2]
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
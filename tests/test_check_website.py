@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from aiohttp import web
+
+from conftest import serve
+
+def stub_site():
+    async def page(request: web.Request) -> web.Response:
+        body = b"status: all good " * 200
+        if request.headers.get("Range"):
+            return web.Response(status=206, body=body[:64], headers={"Content-Range": f"bytes 0-63/{len(body)}"})
+        return web.Response(body=body)
+    app = web.Application()
+    app.router.add_get("/", page)
+    return app
+
+async def check(status, base, **site):
+    http = status.HttpClients(dict(status.CONFIG_DEFAULTS))
+    try:
+        results = [await status.check_website(http, {"url": f"{base}/", **site}, status.CONFIG_DEFAULTS) for _ in range(3)]
+        return results, http.pools["probe"].stats()
+    finally:
+        await http.close()
+
+def test_headers_only_get_reuses_its_connection(status):
+    async def main():
+        async with serve(stub_site()) as base:
+            results, stats = await check(status, base)
+        assert [r["status"] for r in results] == ["Online"] * 3
+        assert stats["created"] == 1 and stats["reused"] == 2
+        timings = results[0]["timings"]
+        assert set(timings) == set(status.PROBE_PHASES)
+        assert timings["connect_ms"] is not None and results[1]["timings"]["connect_ms"] is None
+        assert timings["ttfb_ms"] <= timings["total_ms"]
+    asyncio.run(main())
+
+def test_range_request_matches_expected_206_and_200(status):
+    async def main():
+        async with serve(stub_site()) as base:
+            exact, _ = await check(status, base, keyword="all good", expected_status=["206"])
+            mapped, _ = await check(status, base, keyword="all good", expected_status=["200"])
+            missing, _ = await check(status, base, keyword="outage", expected_status=["206"])
+            wrong, _ = await check(status, base, keyword="all good", expected_status=["204"])
+        assert exact[0]["status"] == "Online" and exact[0]["code"] == 206
+        assert mapped[0]["status"] == "Online"
+        assert missing[0]["status"] == "Keyword Missing"
+        assert wrong[0]["status"] == "Status 206"
+    asyncio.run(main())
+
+def test_history_keeps_phase_timings(status, tmp_path):
+    history = status.HistoryStore(str(tmp_path / "history.sqlite3"))
+    timings = {"dns_ms": 1.5, "connect_ms": 3.0, "server_ms": 20.0, "ttfb_ms": 25.0, "total_ms": 26.0}
+    history.record([{"target": "website:https://a.example", "ts": time.time(), "up": True, "latency_ms": 25.0, "timings": timings}])
+    row = history.db.execute(f"SELECT {', '.join(status.PROBE_PHASES)} FROM samples").fetchone()
+    assert row == tuple(timings[phase] for phase in status.PROBE_PHASES)
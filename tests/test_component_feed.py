@@ -0,0 +1,93 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from conftest import serve
+
+COMPONENTS = {"components": [
+    {"id": "api", "name": "API", "status": "operational", "group_id": None},
+    {"id": "voice", "name": "Voice", "status": "operational", "group_id": None},
+    {"id": "voice-eu", "name": "Voice EU", "status": "partial_outage", "group_id": "voice"}
+]}
+
+def stub_feed():
+    state = {"requests": [], "delay": 0.0, "fail": False}
+    async def components(request: web.Request) -> web.Response:
+        state["requests"].append(dict(request.headers))
+        await asyncio.sleep(state["delay"])
+        if state["fail"]: return web.Response(status=503)
+        if request.headers.get("If-None-Match") == '"v1"': return web.Response(status=304)
+        return web.json_response(COMPONENTS, headers={"ETag": '"v1"'})
+    app = web.Application()
+    app.router.add_get("/components.json", components)
+    return app, state
+
+async def with_feed(status, run, **cache_options):
+    app, state = stub_feed()
+    async with serve(app) as base, aiohttp.ClientSession() as session:
+        cache = status.ComponentFeedCache(url=f"{base}/components.json", **cache_options)
+        await run(cache, session, state)
+
+def test_ttl_hit_then_etag_revalidation(status):
+    async def run(cache, session, state):
+        await cache.get(session)
+        await cache.get(session)
+        assert len(state["requests"]) == 1
+        assert cache.stats["misses"] == 1 and cache.stats["hits"] == 1
+        assert [c["id"] for c in cache.children("voice")] == ["voice-eu"]
+        assert [c["id"] for c in cache.top_level()] == ["api", "voice"]
+
+        await cache.get(session, force=True)
+        assert state["requests"][-1].get("If-None-Match") == '"v1"'
+        assert cache.stats["revalidations"] == 1
+        assert cache.components["voice-eu"]["status"] == "partial_outage"
+    asyncio.run(with_feed(status, run))
+
+def test_concurrent_callers_share_one_request(status):
+    async def run(cache, session, state):
+        state["delay"] = 0.2
+        results = await asyncio.gather(*(cache.get(session) for _ in range(5)))
+        assert all(result is cache for result in results)
+        assert len(state["requests"]) == 1
+        assert cache.stats["coalesced"] == 4
+        assert cache.inflight is None
+    asyncio.run(with_feed(status, run))
+
+def test_serves_stale_components_when_refresh_fails(status):
+    async def run(cache, session, state):
+        await cache.get(session)
+        state["fail"] = True
+        await cache.get(session)
+        assert cache.stats["errors"] == 1 and cache.stats["stale"] == 1
+        assert "api" in cache.components
+
+        cache.stale_limit = 0
+        with pytest.raises(status.ComponentFeedError):
+            await cache.get(session)
+    asyncio.run(with_feed(status, run, ttl=0))
+
+def test_error_without_cached_components_is_raised(status):
+    async def run(cache, session, state):
+        state["fail"] = True
+        with pytest.raises(status.ComponentFeedError) as error:
+            await cache.get(session)
+        assert error.value.status == 503
+        assert cache.stats["stale"] == 0
+    asyncio.run(with_feed(status, run))
+
+def test_cancelled_caller_does_not_abort_shared_refresh(status):
+    async def run(cache, session, state):
+        state["delay"] = 0.3
+        first = asyncio.create_task(cache.get(session))
+        second = asyncio.create_task(cache.get(session))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        assert await second is cache
+        assert first.cancelled()
+        assert len(state["requests"]) == 1
+        assert "voice" in cache.components
+        await cache.get(session)
+        assert cache.stats["hits"] == 1
+    asyncio.run(with_feed(status, run))
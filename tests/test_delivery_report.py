@@ -0,0 +1,39 @@
+import json
+import os
+import time
+
+import pytest
+
+class FakeLoop:
+    def create_task(self, coro): coro.close()
+
+class FakeBot:
+    loop = FakeLoop()
+    def get_guild(self, guild_id): return None
+
+@pytest.fixture
+def cog(status, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/DcStatuses")
+    with open("data/DcStatuses/status_config.json", "w") as f:
+        json.dump({"history_enabled": False}, f)
+    return status.StatusCog(FakeBot())
+
+def test_report_without_destinations(cog):
+    assert "API Settings" in cog.delivery_report(1)
+
+def test_report_shows_each_destination_and_queue_totals(cog):
+    section = cog.guild_config(1)
+    section["api_post_url"] = "https://a.example/receive_status.php"
+    section["api_destinations"] = [{"url": "https://b.example/hook", "token": None}, {"url": "https://c.example/hook", "token": None}]
+    delivery = cog.delivery
+    delivery.submit((1, "https://a.example/receive_status.php"), {"n": 1})
+    delivery.submit((1, "https://b.example/hook"), {"n": 1})
+    delivery.pending[(1, "https://b.example/hook")].update(attempts=2, due=time.monotonic() + 60)
+    delivery.counters.update(delivered=5, retries=2)
+    delivery.latencies.extend([0.1, 0.3])
+    report = cog.delivery_report(1)
+    assert "**https://a.example/receive_status.php**: queued" in report
+    assert "**https://b.example/hook**: failed 2x, next retry <t:" in report
+    assert "**https://c.example/hook**: up to date" in report
+    assert "2 queued, 0 sending" in report and "Delivered 5, retried 2" in report and "200.0 ms avg" in report
@@ -0,0 +1,82 @@
+import json
+import os
+import time
+
+import pytest
+
+class FakeLoop:
+    def create_task(self, coro): coro.close()
+
+class FakeBot:
+    loop = FakeLoop()
+    def get_guild(self, guild_id): return None
+
+SITE = "website:https://a.example"
+
+@pytest.fixture
+def history(status, tmp_path):
+    store = status.HistoryStore(str(tmp_path / "history.sqlite3"))
+    now = time.time()
+    store.record([{"target": SITE, "ts": now - 1800 + n, "up": n != 3, "latency_ms": 40.0} for n in range(4)])
+    db, target = store.db, store.target_id(SITE)
+    def rollup(resolution, age, checks, ups):
+        bucket = int(now - age) - int(now - age) % resolution
+        db.execute("INSERT INTO rollups VALUES (?, ?, ?, ?, ?, 0, 0)", (resolution, target, bucket, checks, ups))
+    with db:
+        rollup(60, 10 * 3600, 4, 0)
+        rollup(3600, 10 * 3600, 100, 100)
+        rollup(86400, 20 * 86400, 12, 12)
+    return store
+
+def test_uptime_picks_the_resolution_for_each_window(status, history):
+    assert history.resolution_for(3600) == 60 and history.resolution_for(86400) == 60
+    assert history.resolution_for(7 * 86400) == 3600 and history.resolution_for(30 * 86400) == 86400
+    assert history.uptime(SITE, 3600) == pytest.approx(75.0)
+    assert history.uptime(SITE, 86400) == pytest.approx(37.5)
+    assert history.uptime(SITE, 30 * 86400) == pytest.approx(93.75)
+
+def test_unknown_targets_have_no_history(status, history):
+    assert history.uptime("website:https://unknown.example", 86400) is None
+    assert history.latency_percentiles("website:https://unknown.example", 86400) == {50: None, 95: None}
+
+def test_latency_percentiles_interpolate_within_bins(status, history):
+    assert history.latency_percentiles(SITE, 3600) == {50: pytest.approx(40.0), 95: pytest.approx(49.0)}
+    bins = status.LATENCY_BINS_MS
+    assert status.HistoryStore.percentile([(0, 2), (1, 2)], 50) == pytest.approx(bins[0])
+    assert status.HistoryStore.percentile([(0, 1), (1, 1)], 75) == pytest.approx(bins[0] + (bins[1] - bins[0]) / 2)
+    assert status.HistoryStore.percentile([(len(bins), 3)], 95) == bins[-1]
+    assert status.HistoryStore.percentile([], 50) is None
+
+def test_incidents_cover_open_and_recently_closed(status, history):
+    now = time.time()
+    history.open_incident(SITE, "down", now - 20 * 86400, "Offline")
+    history.close_incident(SITE, "down", now - 19 * 86400)
+    history.open_incident(SITE, "down", now - 7200, "Status 500")
+    assert history.close_incident(SITE, "down", now - 3600) == pytest.approx(3600, abs=1)
+    history.open_incident(SITE, "flapping", now - 600, None)
+    assert history.close_incident("website:https://unknown.example", "down", now) is None
+    incidents = history.incidents(86400)
+    assert [(i["kind"], i["cause"], i["ended_at"] is None) for i in incidents] == [("down", "Status 500", False), ("flapping", None, True)]
+    assert incidents[0]["duration_s"] == pytest.approx(3600, abs=1)
+    assert len(history.incidents(30 * 86400)) == 3
+
+def test_cog_reports_uptime_and_incidents_for_its_guild(status, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/DcStatuses")
+    with open("data/DcStatuses/status_config.json", "w") as f:
+        json.dump({"history_enabled": True}, f)
+    cog = status.StatusCog(FakeBot())
+    try:
+        cog.guild_config(1)["websites"] = [{"label": "Shop", "url": "https://shop.example"}]
+        cog.guild_config(2)["websites"] = [{"label": "Other", "url": "https://other.example"}]
+        assert cog.history_report(cog.history_rows(1)) == "No history recorded for this server's targets yet."
+        now = time.time()
+        cog.history.record([{"target": f"website:{url}", "ts": now - 60, "up": True, "latency_ms": 120.0} for url in ("https://shop.example", "https://other.example")])
+        cog.history.open_incident("website:https://shop.example", "down", now - 300, "Status 503")
+        cog.history.open_incident("website:https://other.example", "down", now - 300, "Offline")
+        report = cog.history_report(cog.history_rows(1))
+        assert "**Shop**: 1h 100.00% · 24h 100.00% · 30d 100.00% · p95" in report
+        assert "Status 503" in report and "ongoing" in report
+        assert "Other" not in report and "Offline" not in report
+    finally:
+        cog.history.db.close()
@@ -0,0 +1,57 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from conftest import serve
+
+def stub_app():
+    release = asyncio.Event()
+    async def slow(request: web.Request) -> web.Response:
+        await release.wait()
+        return web.Response(text="ok")
+    async def fast(request: web.Request) -> web.Response:
+        return web.Response(text="ok")
+    app = web.Application()
+    app.router.add_get("/slow", slow)
+    app.router.add_get("/", fast)
+    return app, release
+
+def test_stats_count_active_queued_and_reused(status):
+    async def main():
+        app, release = stub_app()
+        pool = status.HttpPool("test", limit=1, limit_per_host=1, dns_ttl=None, keepalive=30.0)
+        session = pool.start()
+        async with serve(app) as base:
+            async def get(path):
+                async with session.get(base + path) as response:
+                    return await response.text()
+            first = asyncio.ensure_future(get("/slow"))
+            second = asyncio.ensure_future(get("/"))
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if pool.stats()["queued"]: break
+            stats = pool.stats()
+            assert stats["active"] == 2 and stats["queued"] == 1 and stats["created"] == 1
+            release.set()
+            assert await asyncio.gather(first, second) == ["ok", "ok"]
+            stats = pool.stats()
+            assert stats["active"] == 0 and stats["queued"] == 0
+            assert stats["created"] == 1 and stats["reused"] == 1 and stats["queue_waits"] == 1
+            await pool.close()
+    asyncio.run(main())
+
+def test_failed_request_releases_active(status):
+    async def main():
+        pool = status.HttpPool("test", limit=2, limit_per_host=2, dns_ttl=None, keepalive=None, force_close=True)
+        session = pool.start()
+        app = web.Application()
+        async with serve(app) as base:
+            port = int(base.rsplit(":", 1)[1])
+        try:
+            await session.get(f"http://127.0.0.1:{port}/")
+        except aiohttp.ClientError:
+            pass
+        assert pool.stats()["active"] == 0 and pool.stats()["created"] == 0
+        await pool.close()
+    asyncio.run(main())
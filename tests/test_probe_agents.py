@@ -0,0 +1,130 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+from aiohttp import web
+
+from conftest import serve
+
+class FakeLoop:
+    def create_task(self, coro): coro.close()
+
+class FakeBot:
+    loop = FakeLoop()
+    def get_guild(self, guild_id): return None
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/DcStatuses")
+    with open("data/DcStatuses/status_config.json", "w") as f:
+        json.dump({
+            "history_enabled": False, "agent_hub_enabled": True, "agent_hub_port": 0, "agent_token": "test-token",
+            "agent_timeout": 0.6, "agent_sync_interval": 0.1, "agent_recheck_timeout": 2
+        }, f)
+    return tmp_path
+
+def stub_websites():
+    async def healthy(request: web.Request) -> web.Response: return web.Response(text="ok")
+    async def failing(request: web.Request) -> web.Response: return web.Response(status=500)
+    app = web.Application()
+    app.router.add_get("/ok/{n}", healthy)
+    app.router.add_get("/down/{n}", failing)
+    return app
+
+async def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.05)
+
+def test_agents_share_targets_reach_quorum_and_rebalance(status, workdir):
+    async def scenario():
+        async with serve(stub_websites()) as base:
+            cog = status.StatusCog(FakeBot())
+            section = cog.guild_config(1)
+            section["websites"] = [{"label": f"site {n}", "url": f"{base}/{'down' if n % 3 == 0 else 'ok'}/{n}"} for n in range(12)]
+            await cog.start_agent_hub()
+            host, port = cog.agent_runner.addresses[0][:2]
+            hub = cog.agent_hub
+            hub.set_targets(cog.agent_targets())
+            targets = set(hub.targets)
+
+            agents = {name: status.ProbeAgent(f"http://{host}:{port}", "test-token", name, dict(status.CONFIG_DEFAULTS)) for name in ("a", "b", "c")}
+            tasks = {name: asyncio.create_task(agent.run()) for name, agent in agents.items()}
+            try:
+                await wait_for(lambda: all(len(hub.reports.get(target, {})) == 3 for target in targets))
+                assert hub.live_agents() == ["a", "b", "c"]
+                assert all(sorted(owners) == ["a", "b", "c"] for owners in hub.placement().values())
+                assert set().union(*(agent.targets for agent in agents.values())) == targets
+
+                cog.scheduler.pop_due(cog.scheduler_targets())
+                await cog.fetch_all_statuses()
+                for site in section["websites"]:
+                    result = cog.results[("website", site["url"])]
+                    assert result["agents_total"] == 3
+                    assert result["online"] == ("/ok/" in site["url"])
+
+                tasks.pop("c").cancel()
+                await wait_for(lambda: hub.live_agents() == ["a", "b"])
+                placement = hub.placement()
+                assert set(placement) == targets
+                assert all(sorted(owners) == ["a", "b"] for owners in placement.values())
+                await wait_for(lambda: all(set(agents[name].targets) == targets for name in ("a", "b")))
+            finally:
+                for task in tasks.values(): task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+                for task in list(cog.reprobe_tasks.values()): task.cancel()
+                await cog.agent_runner.cleanup()
+                await cog.http.close()
+    asyncio.run(scenario())
+
+def test_hub_rejects_agents_without_the_token(status, workdir):
+    async def scenario():
+        cog = status.StatusCog(FakeBot())
+        await cog.start_agent_hub()
+        host, port = cog.agent_runner.addresses[0][:2]
+        agent = status.ProbeAgent(f"http://{host}:{port}", "wrong", "intruder", dict(status.CONFIG_DEFAULTS))
+        try:
+            assert not await agent.sync()
+            assert cog.agent_hub.live_agents() == []
+        finally:
+            await agent.http.close()
+            await cog.agent_runner.cleanup()
+            await cog.http.close()
+    asyncio.run(scenario())
+
+def test_quorum_marks_down_only_when_most_agents_fail(status):
+    async def scenario():
+        hub = status.AgentHub(status.StatusCog.result_failed, replicas=3, quorum=0.5)
+        hub.set_targets({"website:x": {"id": "website:x", "kind": "website", "site": {"url": "x"}, "interval": 60}})
+        up = {"status": "Online", "online": True, "latency_ms": 20}
+        down = {"status": "Offline", "online": False, "latency_ms": None}
+        for agent in ("a", "b", "c"): hub.sync(agent, [])
+        assert hub.aggregate("website:x") is None
+
+        hub.sync("a", [{"id": "website:x", "result": down}])
+        hub.sync("b", [{"id": "website:x", "result": up}])
+        hub.sync("c", [{"id": "website:x", "result": up}])
+        result = hub.aggregate("website:x")
+        assert result["online"] and (result["agents_up"], result["agents_total"]) == (2, 3)
+
+        hub.sync("b", [{"id": "website:x", "result": down}])
+        result = hub.aggregate("website:x")
+        assert not result["online"] and (result["agents_up"], result["agents_total"]) == (1, 3)
+
+        hub.sync("unknown", [{"id": "website:y", "result": down}])
+        assert "website:y" not in hub.reports
+    asyncio.run(scenario())
+
+def test_hash_ring_moves_only_the_departed_agents_targets(status):
+    targets = [f"website:https://site{n}.example" for n in range(500)]
+    before = status.HashRing(["a", "b", "c", "d"])
+    after = status.HashRing(["a", "b", "c"])
+    owners = {target: before.lookup(target, 1)[0] for target in targets}
+    moved = [target for target in targets if after.lookup(target, 1)[0] != owners[target]]
+    assert moved and all(owners[target] == "d" for target in moved)
+    assert len(set(before.lookup(targets[0], 3))) == 3
+    assert status.HashRing([]).lookup(targets[0], 3) == []
@@ -0,0 +1,38 @@
+import asyncio
+
+def job(host, delay, result):
+    async def factory():
+        await asyncio.sleep(delay)
+        return result
+    return (host, factory, "Timed Out")
+
+def test_slow_host_cannot_starve_other_hosts(status):
+    async def main():
+        engine = status.ProbeEngine(concurrency=25, per_host=4, deadline=1.0)
+        jobs = [job("slow.example", 0.5, "slow") for _ in range(40)]
+        jobs += [job(f"fast{i}.example", 0.01, "fast") for i in range(20)]
+        results = await engine.run(jobs)
+        assert results[40:] == ["fast"] * 20
+        assert results[:40].count("Timed Out") > 0
+    asyncio.run(main())
+
+def test_limits_hold_per_host_and_overall(status):
+    async def main():
+        engine = status.ProbeEngine(concurrency=5, per_host=2, deadline=5.0)
+        running = {"all": 0, "peak": 0, "hosts": {}, "host_peak": 0}
+        def tracked(host):
+            async def factory():
+                running["all"] += 1
+                running["hosts"][host] = running["hosts"].get(host, 0) + 1
+                running["peak"] = max(running["peak"], running["all"])
+                running["host_peak"] = max(running["host_peak"], running["hosts"][host])
+                await asyncio.sleep(0.02)
+                running["all"] -= 1
+                running["hosts"][host] -= 1
+                return host
+            return (host, factory, None)
+        jobs = [tracked(f"h{i % 4}") for i in range(24)] + [(None, job(None, 0.02, "plain")[1], None)]
+        results = await engine.run(jobs)
+        assert None not in results
+        assert running["peak"] <= 5 and running["host_peak"] <= 2
+    asyncio.run(main())
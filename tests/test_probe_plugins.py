@@ -0,0 +1,112 @@
+import asyncio
+import shutil
+import socket
+import ssl
+import subprocess
+
+import pytest
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    if not shutil.which("openssl"): pytest.skip("openssl is needed to create a test certificate")
+    folder = tmp_path_factory.mktemp("tls")
+    cert, key = folder / "cert.pem", folder / "key.pem"
+    subprocess.run([
+        "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "30", "-subj", "/CN=localhost",
+        "-addext", "subjectAltName=DNS:localhost", "-keyout", str(key), "-out", str(cert)
+    ], check=True, capture_output=True)
+    return str(cert), str(key)
+
+def run_probe(status, uri: str):
+    return asyncio.run(status.ProbePlugins().run(uri))
+
+def test_tcp_probe_reports_open_and_refused_ports(status):
+    async def scenario():
+        accepted = []
+        async def handle(reader, writer):
+            accepted.append(await reader.read())
+            writer.close()
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            up = await status.ProbePlugins().run(f"tcp://127.0.0.1:{port}")
+            await asyncio.sleep(0.05)
+        return up, accepted
+    up, accepted = asyncio.run(scenario())
+    assert up["status"] == "Operational" and up["online"] and up["latency_ms"] is not None
+    assert accepted == [b""]
+
+    down = run_probe(status, f"tcp://127.0.0.1:{closed_port()}")
+    assert down["status"] == "Offline" and not down["online"]
+    assert down["detail"] == "Connection refused"
+
+def test_udp_probe_checks_the_reply(status):
+    class Echo(asyncio.DatagramProtocol):
+        def connection_made(self, transport): self.transport = transport
+        def datagram_received(self, data, addr): self.transport.sendto(b"pong:" + data, addr)
+    async def scenario():
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(Echo, local_addr=("127.0.0.1", 0))
+        port = transport.get_extra_info("sockname")[1]
+        plugins = status.ProbePlugins()
+        try:
+            return (
+                await plugins.run(f"udp://127.0.0.1:{port}?send=ping&expect=pong"),
+                await plugins.run(f"udp://127.0.0.1:{port}?payload=ffff&expect_hex=706f6e673affff"),
+                await plugins.run(f"udp://127.0.0.1:{port}?send=ping&expect=nope")
+            )
+        finally:
+            transport.close()
+    text, binary, unexpected = asyncio.run(scenario())
+    assert text["status"] == "Operational" and text["online"]
+    assert binary["status"] == "Operational"
+    assert unexpected["status"] == "Unexpected Answer" and not unexpected["online"]
+
+    down = run_probe(status, f"udp://127.0.0.1:{closed_port()}?timeout=1")
+    assert not down["online"] and down["status"] in ("Offline", "Timed Out")
+
+def test_dns_probe_resolves_and_matches_expected_address(status):
+    up = run_probe(status, "dns://localhost?type=A&expect=127.0.0.1")
+    assert up["status"] == "Operational" and up["online"]
+
+    unexpected = run_probe(status, "dns://localhost?type=A&expect=192.0.2.1")
+    assert unexpected["status"] == "Unexpected Answer" and not unexpected["online"]
+
+    down = run_probe(status, "dns://missing.invalid?timeout=3")
+    assert not down["online"]
+
+def test_tls_probe_checks_trust_and_expiry(status, certificate):
+    cert, key = certificate
+    async def scenario():
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        async def handle(reader, writer):
+            await reader.read()
+            writer.close()
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=context)
+        port = server.sockets[0].getsockname()[1]
+        plugins = status.ProbePlugins()
+        async with server:
+            return (
+                await plugins.run(f"tls://127.0.0.1:{port}?sni=localhost&ca={cert}&warn_days=7"),
+                await plugins.run(f"tls://127.0.0.1:{port}?sni=localhost&ca={cert}&warn_days=60"),
+                await plugins.run(f"tls://127.0.0.1:{port}?sni=localhost")
+            )
+    valid, expiring, untrusted = asyncio.run(scenario())
+    assert valid["status"] == "Operational" and valid["online"]
+    assert valid["detail"].startswith("certificate valid for")
+    assert expiring["status"] == "Partial Outage" and expiring["online"]
+    assert untrusted["status"] == "Offline" and not untrusted["online"]
+    assert "certificate" in untrusted["detail"]
+
+    down = run_probe(status, f"tls://127.0.0.1:{closed_port()}")
+    assert down["status"] == "Offline"
+
+def test_probe_uri_validation(status):
+    with pytest.raises(ValueError): status.parse_probe_uri("tcp://example.com")
+    with pytest.raises(ValueError): status.parse_probe_uri("udp://example.com:53?payload=zz")
+    assert status.parse_probe_uri("tls://example.com")["port"] == 443
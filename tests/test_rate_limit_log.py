@@ -0,0 +1,58 @@
+import asyncio
+import inspect
+import json
+import logging
+
+import discord
+import discord.http
+import pytest
+from aiohttp import web
+
+from conftest import serve
+
+def discord_json(data, status: int = 200, **headers) -> web.Response:
+    # discord.py only decodes bodies whose Content-Type is exactly application/json.
+    return web.Response(body=json.dumps(data).encode(), status=status, headers={"Content-Type": "application/json", **headers})
+
+def stub_discord(global_limit: bool):
+    state = {"limited": 0}
+    async def me(request: web.Request) -> web.Response:
+        return discord_json({"id": "1", "username": "bot", "discriminator": "0", "avatar": None})
+    async def channel(request: web.Request) -> web.Response:
+        if state["limited"] < 2:
+            state["limited"] += 1
+            return discord_json({"message": "You are being rate limited.", "retry_after": 0.05, "global": global_limit}, status=429, Via="1.1 google")
+        return discord_json({"id": "2"})
+    app = web.Application()
+    app.router.add_get("/users/@me", me)
+    app.router.add_get("/channels/2", channel)
+    return app
+
+def test_formats_match_installed_discord_py(status):
+    source = inspect.getsource(discord.http)
+    for message in status.RATE_LIMIT_LOG_FORMATS:
+        assert repr(message) in source, f"discord.py {discord.__version__} no longer logs {message!r}"
+
+@pytest.mark.parametrize("global_limit", [False, True])
+def test_real_http_client_429s_are_counted(status, monkeypatch, global_limit):
+    async def main():
+        metrics = status.build_metrics_registry()
+        handler = status.RateLimitLogHandler(metrics)
+        logger = logging.getLogger("discord.http")
+        logger.addHandler(handler)
+        try:
+            async with serve(stub_discord(global_limit)) as base:
+                monkeypatch.setattr(discord.http.Route, "BASE", base)
+                http = discord.http.HTTPClient(asyncio.get_running_loop())
+                await http.static_login("token")
+                try:
+                    assert await http.request(discord.http.Route("GET", "/channels/{channel_id}", channel_id=2)) == {"id": "2"}
+                finally:
+                    await http.close()
+            await asyncio.sleep(0)
+        finally:
+            logger.removeHandler(handler)
+        scope = "global" if global_limit else "route"
+        assert metrics.families["status_monitor_discord_rate_limits_total"]["samples"] == {(("scope", scope),): 2}
+        assert metrics.families["status_monitor_discord_rate_limit_wait_seconds_total"]["samples"] == {(("scope", scope),): pytest.approx(0.1)}
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+class FakeLoop:
+    def create_task(self, coro): coro.close()
+
+class FakeBot:
+    loop = FakeLoop()
+    def get_guild(self, guild_id): return None
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/DcStatuses")
+    with open("data/DcStatuses/status_config.json", "w") as f:
+        json.dump({"history_enabled": False}, f)
+    return tmp_path
+
+def test_requests_during_a_cycle_are_counted_as_folded(status):
+    async def main():
+        calls = []
+        release = asyncio.Event()
+        async def cycle(probe, force, targets):
+            calls.append((probe, force))
+            await release.wait()
+        updates = status.UpdateCoordinator(cycle, debounce=0.01)
+        updates.start()
+        first = updates.request(force=(1,))
+        await asyncio.sleep(0.02)
+        assert updates.running
+        during = [updates.request(probe=True, force=(2,)), updates.request(force=(3,), debounce=True)]
+        release.set()
+        await asyncio.gather(first, *during)
+        updates.stop()
+        assert calls == [(set(), {1}), ({2}, {2, 3})]
+        assert updates.stats == {"requested": 3, "folded": 1, "cycles": 2}
+    asyncio.run(main())
+
+def test_probe_requeues_only_the_requesting_guild(status, workdir):
+    async def main():
+        cog = status.StatusCog(FakeBot())
+        for guild_id in (1, 2):
+            section = cog.guild_config(guild_id)
+            section["websites"] = [{"label": "site", "url": f"https://site{guild_id}.example"}]
+            section["bots"] = [{"id": 100 + guild_id, "name": "bot"}]
+        async def publish(force=None): pass
+        cog.update_status_embed = publish
+        assert len(cog.scheduler.pop_due(cog.scheduler_targets())) == 4
+        for key in list(cog.scheduler.entries):
+            cog.scheduler.record(key, changed=False, failed=False)
+        await cog.run_update({1}, {1}, [])
+        assert sorted(cog.scheduler.pop_due(cog.scheduler_targets())) == [("bot", 1, 101), ("website", "https://site1.example")]
+    asyncio.run(main())